@@ -0,0 +1,125 @@
+"""
+Mide el reporte agregado (src/modules/reporting/aggregate_report.py) sobre
+un árbol de reportes sintéticos con el mismo formato que outputs/.
+
+Genera --reportes reportes en un directorio temporal (o reutiliza --dir si
+ya existe), los agrega por agente y por día y verifica los totales contra
+un conteo independiente hecho al generarlos.
+
+Uso:
+    python -m benchmarks.bench_aggregate [--reportes 100000] [--agentes 50] [--dias 30] [--dir DIR]
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from src.modules.reporting.aggregate_report import AggregateReportGenerator, iter_reports
+
+PROHIBIDAS = ["queja", "imposible", "problema", "culpa", "tonto"]
+
+
+def _estado(rng: random.Random, prob_ok: float) -> dict:
+    ok = rng.random() < prob_ok
+    return {"status": "OK" if ok else "Faltante", "found": ok}
+
+
+def generar(directorio: str, n: int, agentes: int, dias: int, semilla: int) -> dict:
+    """Escribe n reportes sintéticos y devuelve los totales esperados."""
+    rng = random.Random(semilla)
+    esperado = {"llamadas": 0, "cumplimiento": 0, "score": 0}
+    for i in range(n):
+        score = rng.randint(-30, 30)
+        palabras = rng.sample(PROHIBIDAS, rng.choice([0, 0, 0, 1, 2]))
+        report = {
+            "sentiment_analysis": {
+                "sentiment": "Positivo" if score > 0 else "Negativo" if score < 0 else "Neutral",
+                "score": score,
+                "positive_words_count": rng.randint(0, 20),
+                "negative_words_count": rng.randint(0, 20),
+                "most_positive": {"word": "gracias", "score": 2},
+                "most_negative": {"word": "lamento", "score": -2}
+            },
+            "protocol_analysis": {
+                "greeting": _estado(rng, 0.95),
+                "identification": _estado(rng, 0.85),
+                "prohibited_words": {
+                    "status": "Detectadas" if palabras else "OK",
+                    "found": palabras or ["Ninguna detectada"]
+                },
+                "farewell": _estado(rng, 0.8)
+            },
+            "metadata": {
+                "call": f"llamada_{i:06d}",
+                "agent": f"agente_{rng.randrange(agentes):03d}",
+                "date": f"2025-06-{rng.randrange(dias) + 1:02d}"
+            }
+        }
+        call_dir = os.path.join(directorio, f"llamada_{i:06d}")
+        os.makedirs(call_dir, exist_ok=True)
+        with open(os.path.join(call_dir, "reporte.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        esperado["llamadas"] += 1
+        esperado["score"] += score
+        protocolo = report["protocol_analysis"]
+        if all(protocolo[fase]["status"] == "OK" for fase in protocolo):
+            esperado["cumplimiento"] += 1
+    return esperado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reportes", type=int, default=100000)
+    parser.add_argument("--agentes", type=int, default=50)
+    parser.add_argument("--dias", type=int, default=30)
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--dir", default=None, help="Directorio de reportes a reutilizar entre ejecuciones")
+    args = parser.parse_args()
+
+    temporal = args.dir is None
+    directorio = args.dir or tempfile.mkdtemp(prefix="bench_aggregate_")
+    try:
+        esperado = None
+        if temporal or not os.path.isdir(directorio) or not os.listdir(directorio):
+            print(f"Generando {args.reportes} reportes en {directorio}...")
+            inicio = time.perf_counter()
+            esperado = generar(directorio, args.reportes, args.agentes, args.dias, args.semilla)
+            print(f"  generados en {time.perf_counter() - inicio:.1f} s")
+
+        inicio = time.perf_counter()
+        n_lectura = sum(1 for _ in iter_reports(directorio))
+        lectura = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        agregado = AggregateReportGenerator()
+        n = agregado.add_tree(directorio)
+        resultado = agregado.generate()
+        with tempfile.TemporaryDirectory() as salida:
+            agregado.write(salida, ("json", "csv", "columnar"))
+        segundos = time.perf_counter() - inicio
+
+        total = resultado["total"]
+        assert n == n_lectura and agregado.errores == 0
+        if esperado is not None:
+            assert total["llamadas"] == esperado["llamadas"]
+            assert round(total["tasa_cumplimiento"] * n) == esperado["cumplimiento"]
+            assert round(total["score_promedio"] * n) == esperado["score"]
+        assert sum(g["llamadas"] for g in resultado["por_agente"].values()) == n
+        assert sum(g["llamadas"] for g in resultado["por_dia"].values()) == n
+
+        print(f"Reportes: {n} | Agentes: {len(resultado['por_agente'])} | Días: {len(resultado['por_dia'])}")
+        print(f"Solo lectura y parseo: {lectura:.2f} s")
+        print(f"Agregado completo (lectura + roll-ups + escritura): {segundos:.2f} s "
+              f"({n / segundos:,.0f} reportes/s)")
+        print(f"Cumplimiento total: {total['tasa_cumplimiento']:.1%} | "
+              f"Top prohibidas: {total['top_prohibidas'][:3]}")
+    finally:
+        if temporal:
+            shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
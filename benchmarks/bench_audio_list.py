@@ -0,0 +1,131 @@
+"""
+Mide la carga de la lista de audios de la GUI con muchas filas.
+
+Compara la lista virtualizada (src/audio_list.py: QTableView + ModeloAudios
++ DelegadoReproduccion) con el diseño anterior, un QTableWidget con un
+widget de reproducción por fila. Si QtMultimedia está disponible, el diseño
+anterior incluye también un QMediaPlayer y un QAudioOutput por fila, como
+ReproductorAudio; si no, se mide solo el costo de los widgets.
+
+Cada variante corre en un intérprete nuevo (con QT_QPA_PLATFORM=offscreen
+si no se indica otra plataforma) y se informa el tiempo hasta la primera
+pintura y la memoria residual agregada.
+
+Uso:
+    python -m benchmarks.bench_audio_list [--filas 1000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import wave
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+_SCRIPT = """
+import json, os, sys, time
+from PyQt6.QtWidgets import QApplication
+
+def rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+app = QApplication(sys.argv[:1])
+audios = sorted(os.path.join({directorio!r}, n) for n in os.listdir({directorio!r}))
+multimedia = False
+if {modo!r} == "modelo":
+    from src.audio_list import ModeloAudios, DelegadoReproduccion, PoolReproductores, COLUMNA_REPRODUCIR
+    from PyQt6.QtWidgets import QTableView
+base = rss()
+t0 = time.perf_counter()
+if {modo!r} == "modelo":
+    pool = PoolReproductores()
+    modelo = ModeloAudios(pool)
+    tabla = QTableView()
+    tabla.setModel(modelo)
+    tabla.setItemDelegateForColumn(COLUMNA_REPRODUCIR, DelegadoReproduccion(tabla))
+    tabla.verticalHeader().setDefaultSectionSize(44)
+    modelo.set_audios(audios)
+else:
+    from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QWidget, QHBoxLayout, QPushButton
+    try:
+        from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+        from PyQt6.QtCore import QUrl
+        multimedia = True
+    except ImportError:
+        pass
+    tabla = QTableWidget()
+    tabla.setColumnCount(4)
+    tabla.setRowCount(len(audios))
+    reproductores = []
+    for i, audio in enumerate(audios):
+        tabla.setItem(i, 0, QTableWidgetItem(os.path.basename(audio)))
+        tabla.setItem(i, 1, QTableWidgetItem("WAV"))
+        tabla.setItem(i, 2, QTableWidgetItem("-"))
+        celda = QWidget()
+        layout = QHBoxLayout(celda)
+        layout.addWidget(QPushButton())
+        layout.addWidget(QPushButton())
+        if multimedia:
+            player = QMediaPlayer()
+            salida = QAudioOutput()
+            player.setAudioOutput(salida)
+            player.setSource(QUrl.fromLocalFile(audio))
+            reproductores.append((player, salida))
+        tabla.setCellWidget(i, 3, celda)
+        tabla.setRowHeight(i, 44)
+tabla.resize(900, 700)
+tabla.show()
+tabla.grab()
+app.processEvents()
+t1 = time.perf_counter()
+resultado = [t1 - t0, rss() - base, multimedia]
+print(json.dumps(resultado))
+"""
+
+
+def medir(modo: str, directorio: str):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    salida = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(modo=modo, directorio=directorio)],
+        cwd=RAIZ, env=env, capture_output=True, text=True
+    )
+    if salida.returncode != 0:
+        raise RuntimeError(salida.stderr.strip().splitlines()[-1] if salida.stderr.strip() else "error")
+    return tuple(json.loads(salida.stdout.strip().splitlines()[-1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_audio_list_") as directorio:
+        for i in range(args.filas):
+            with wave.open(os.path.join(directorio, f"llamada_{i:05d}.wav"), "wb") as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(8000)
+                w.writeframes(b"\0" * 1600)
+
+        print(f"Filas: {args.filas}")
+        for modo, nombre in (("widgets", "QTableWidget con reproductor por fila"),
+                             ("modelo", "QTableView virtualizada + pool")):
+            try:
+                segundos, memoria, multimedia = medir(modo, directorio)
+            except RuntimeError as e:
+                print(f"  {nombre}: no se pudo medir ({e})")
+                continue
+            nota = " (sin QtMultimedia: solo widgets)" if modo == "widgets" and not multimedia else ""
+            print(f"  {nombre}: {segundos * 1000:.0f} ms, {memoria / (1024 * 1024):.1f} MB{nota}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Micro-benchmark de las implementaciones de distancia de Levenshtein de
+src/utils/distance_metrics.py.
+
+La equivalencia de todas las variantes con distance() (la implementación
+de referencia) se verifica en tests/test_distance_metrics.py.
+
+Uso:
+    python -m benchmarks.bench_distance [--semilla 1]
+"""
+import argparse
+import random
+import sys
+import time
+
+from src.utils.distance_metrics import (
+    distance, bounded_distance, bitparallel_distance, distance_batch, hamming_distance_with_padding, CandidateMatrix
+)
+from src.modules.preprocessing.suggestion_index import read_hunspell_words, DEFAULT_DIC_PATH
+
+def _hay_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def medir(nombre: str, func, repeticiones: int = 3) -> float:
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        func()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark de distancias de edición")
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.semilla)
+
+    palabras = [w for w in read_hunspell_words(DEFAULT_DIC_PATH) if w.isalpha()]
+    consultas = rng.sample(palabras, 200)
+    candidatas = rng.sample(palabras, 500)
+    n = len(consultas) * len(candidatas)
+
+    casos = {
+        "distance": lambda: [distance(q, c) for q in consultas for c in candidatas],
+        "bounded_distance (k=2)": lambda: [bounded_distance(q, c, 2) for q in consultas for c in candidatas],
+        "bitparallel_distance": lambda: [bitparallel_distance(q, c) for q in consultas for c in candidatas],
+        "distance_batch": lambda: [distance_batch(q, candidatas) for q in consultas],
+        "distance_batch (k=2)": lambda: [distance_batch(q, candidatas, 2) for q in consultas],
+    }
+    base = None
+    print(f"{'Implementación':26} {'µs/par':>8} {'Aceleración':>12}")
+    for nombre, func in casos.items():
+        segundos = medir(nombre, func)
+        base = base or segundos
+        print(f"{nombre:26} {segundos / n * 1e6:8.3f} {base / segundos:11.1f}x")
+
+    if not _hay_numpy():
+        print("\nNumPy no está instalado: se omite la comparación vectorizada.")
+        return 0
+
+    # Una consulta contra miles de vecinos del diccionario
+    print(f"\n{'Candidatas':>10} {'Implementación':26} {'ms/consulta':>12}")
+    for cantidad in [100, 1000, 10000]:
+        vecinos = rng.sample(palabras, cantidad)
+        matriz = CandidateMatrix(vecinos)
+        casos = {
+            "distance_batch (k=2)": lambda: [distance_batch(q, vecinos, 2) for q in consultas[:20]],
+            "CandidateMatrix.levenshtein": lambda: [matriz.levenshtein(q, 2) for q in consultas[:20]],
+            "hamming_with_padding": lambda: [[hamming_distance_with_padding(q, c) for c in vecinos]
+                                             for q in consultas[:20]],
+            "CandidateMatrix.hamming": lambda: [matriz.hamming(q) for q in consultas[:20]],
+        }
+        for nombre, func in casos.items():
+            print(f"{cantidad:10} {nombre:26} {medir(nombre, func) / 20 * 1000:12.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
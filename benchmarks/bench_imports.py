@@ -0,0 +1,90 @@
+"""
+Mide el costo de importar los módulos del analizador.
+
+Cada importación se ejecuta en un intérprete nuevo para medir el arranque
+en frío, como le ocurre a un proceso trabajador recién creado. También
+verifica que los paquetes de análisis y preprocesamiento no carguen Qt
+ni el diccionario de Hunspell al importarse.
+
+Uso:
+    python -m benchmarks.bench_imports [--repeticiones 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MODULOS = [
+    "src.utils.distance_metrics",
+    "src.modules.preprocessing.lexicon",
+    "src.modules.preprocessing.spell_checker",
+    "src.modules.preprocessing.tokenizer",
+    "src.modules.preprocessing.speech_to_text",
+    "src.modules.analysis.sentiment_analyzer",
+    "src.modules.analysis.protocol_analyzer",
+    "src.modules.reporting.report_generator",
+    "src.batch",
+]
+
+# Módulos pesados que no deben cargarse al importar el núcleo
+PROHIBIDOS = ["PyQt6", "phunspell", "assemblyai", "pydub"]
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+try:
+    import {modulo}
+    error = ""
+except Exception as e:
+    error = repr(e)
+t1 = time.perf_counter()
+cargados = [m for m in {prohibidos!r} if m in sys.modules]
+print(json.dumps([t1 - t0, cargados, error]))
+"""
+
+
+def medir(modulo: str, repeticiones: int):
+    """
+    Importa un módulo en intérpretes nuevos y mide el tiempo.
+
+    Args:
+        modulo: Nombre del módulo a importar.
+        repeticiones: Cantidad de mediciones.
+
+    Returns:
+        Tupla (mediana en ms, módulos pesados cargados, error).
+    """
+    tiempos = []
+    cargados, error = [], ""
+    script = _SCRIPT.format(modulo=modulo, prohibidos=PROHIBIDOS)
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", script], cwd=RAIZ,
+                                capture_output=True, text=True, check=True).stdout
+        segundos, cargados, error = json.loads(salida.strip().splitlines()[-1])
+        tiempos.append(segundos * 1000)
+    return statistics.median(tiempos), cargados, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de importación de los módulos")
+    parser.add_argument("--repeticiones", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'Módulo':45} {'Mediana (ms)':>12}  Pesados cargados")
+    fallas = 0
+    for modulo in MODULOS:
+        mediana, cargados, error = medir(modulo, args.repeticiones)
+        if error:
+            print(f"{modulo:45} {'-':>12}  Error: {error}")
+            continue
+        print(f"{modulo:45} {mediana:12.2f}  {', '.join(cargados) or '-'}")
+        fallas += bool(cargados)
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
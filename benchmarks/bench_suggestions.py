@@ -0,0 +1,82 @@
+"""
+Compara los motores de sugerencias del tokenizador (phunspell y el índice
+SymSpell local) en exhaustividad y velocidad.
+
+Se toman palabras del diccionario, se les introducen 1 o 2 errores de
+edición al azar y se mide en qué proporción la palabra original aparece
+entre las sugerencias finales de Tokenizer._find_suggestions (recall@3).
+
+Uso:
+    python -m benchmarks.bench_suggestions [--muestras 500] [--semilla 1]
+"""
+import argparse
+import random
+import statistics
+import string
+import sys
+import time
+
+from src.modules.preprocessing.suggestion_index import read_hunspell_words, DEFAULT_DIC_PATH
+from src.modules.preprocessing.tokenizer import Tokenizer
+
+ALFABETO = string.ascii_lowercase + "áéíóúñü"
+
+
+def introducir_errores(word: str, cantidad: int, rng: random.Random) -> str:
+    for _ in range(cantidad):
+        operacion = rng.choice(["sustituir", "borrar", "insertar", "transponer"])
+        i = rng.randrange(len(word))
+        if operacion == "sustituir":
+            word = word[:i] + rng.choice(ALFABETO) + word[i + 1:]
+        elif operacion == "borrar" and len(word) > 2:
+            word = word[:i] + word[i + 1:]
+        elif operacion == "insertar":
+            word = word[:i] + rng.choice(ALFABETO) + word[i:]
+        elif i + 1 < len(word):
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word
+
+
+def evaluar(tokenizer: Tokenizer, casos):
+    aciertos = 0
+    tiempos = []
+    for original, con_error in casos:
+        inicio = time.perf_counter()
+        sugerencias = tokenizer._find_suggestions(con_error)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        aciertos += original in sugerencias
+    return aciertos / len(casos), statistics.mean(tiempos), statistics.median(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de motores de sugerencias")
+    parser.add_argument("--muestras", type=int, default=500)
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.semilla)
+    palabras = [w for w in read_hunspell_words(DEFAULT_DIC_PATH) if len(w) >= 4 and w.isalpha()]
+    casos = []
+    for original in rng.sample(palabras, args.muestras):
+        con_error = introducir_errores(original, rng.choice([1, 2]), rng)
+        if con_error != original:
+            casos.append((original, con_error))
+
+    print(f"{'Motor':12} {'Recall@3':>9} {'Media (ms)':>11} {'Mediana (ms)':>13}")
+    for motor in ["symspell", "phunspell"]:
+        tokenizer = Tokenizer(suggestion_engine=motor)
+        try:
+            if motor == "symspell":
+                inicio = time.perf_counter()
+                tokenizer._get_suggestion_index()
+                print(f"(carga del índice: {(time.perf_counter() - inicio):.2f} s)")
+            recall, media, mediana = evaluar(tokenizer, casos)
+        except ImportError as e:
+            print(f"{motor:12} no disponible: {e}")
+            continue
+        print(f"{motor:12} {recall:9.3f} {media:11.3f} {mediana:13.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
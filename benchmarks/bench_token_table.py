@@ -0,0 +1,114 @@
+"""
+Compara el análisis de sentimiento y de palabras prohibidas sobre listas de
+tokens (SentimentAnalyzer y la lógica de ProtocolAnalyzer, llamada por
+llamada) con la versión vectorizada de TokenTable
+(src/modules/analysis/token_table.py) sobre todas las llamadas a la vez.
+
+Genera --llamadas llamadas sintéticas de --tokens tokens con palabras de la
+tabla de símbolos, verifica que ambos caminos den los mismos resultados y
+mide el tiempo y la memoria de cada uno.
+
+Uso:
+    python -m benchmarks.bench_token_table [--llamadas 2000] [--tokens 800] [--semilla 1]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from src.modules.analysis.sentiment_analyzer import SentimentAnalyzer
+from src.modules.analysis.token_table import TokenTable
+from src.modules.preprocessing.lexicon_store import read_table
+
+TABLA = os.path.join("diccionario", "tabla_simbolos.json")
+PROHIBIDAS = ["queja", "imposible", "problema", "culpa", "tonto"]
+
+
+def generar(llamadas: int, tokens: int, semilla: int) -> dict:
+    """Devuelve llamada -> lista de tokens con el formato de Tokenizer.tokenize."""
+    rng = random.Random(semilla)
+    tabla, _ = read_table(TABLA)
+    vocabulario = [(w, e.get("puntaje", 0), e.get("token") or "OTRO") for w, e in tabla.items()]
+    vocabulario += [(w, -2, "PALABRA_PROHIBIDA") for w in PROHIBIDAS]
+    pesos = [1] * (len(vocabulario) - len(PROHIBIDAS)) + [0.05] * len(PROHIBIDAS)
+    return {
+        f"llamada_{i:06d}": [
+            {"lexema": w, "sentiment": s, "token": t, "valido": True, "sugerencias": []}
+            for w, s, t in rng.choices(vocabulario, pesos, k=tokens)
+        ]
+        for i in range(llamadas)
+    }
+
+
+def por_listas(corpus: dict):
+    sentimiento = {nombre: SentimentAnalyzer(tokens).analyze() for nombre, tokens in corpus.items()}
+    # La misma selección que ProtocolAnalyzer.analyze
+    prohibidas = {}
+    for nombre, tokens in corpus.items():
+        palabras = [t["lexema"] for t in tokens if t.get("token") == "PALABRA_PROHIBIDA"]
+        if palabras:
+            prohibidas[nombre] = palabras
+    return sentimiento, prohibidas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--llamadas", type=int, default=2000)
+    parser.add_argument("--tokens", type=int, default=800)
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    corpus = generar(args.llamadas, args.tokens, args.semilla)
+    memoria_listas = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    n = sum(len(tokens) for tokens in corpus.values())
+    print(f"Llamadas: {len(corpus)} | Tokens: {n:,}")
+
+    inicio = time.perf_counter()
+    sentimiento, prohibidas = por_listas(corpus)
+    listas = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    tabla = TokenTable()
+    for nombre, tokens in corpus.items():
+        tabla.add_tokens(nombre, tokens)
+    columnas = tabla.columnas
+    construccion = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    sentimiento_tabla = tabla.sentiment_by_call()
+    prohibidas_tabla = tabla.prohibited_by_call()
+    vectorizado = time.perf_counter() - inicio
+
+    assert sentimiento_tabla == sentimiento
+    assert prohibidas_tabla == prohibidas
+
+    with tempfile.TemporaryDirectory() as directorio:
+        path = os.path.join(directorio, "tokens.npz")
+        inicio = time.perf_counter()
+        tabla.save(path)
+        guardado = time.perf_counter() - inicio
+        tamanio = os.path.getsize(path)
+        inicio = time.perf_counter()
+        cargada = TokenTable.load(path)
+        carga = time.perf_counter() - inicio
+    assert cargada.prohibited_by_call() == prohibidas
+
+    print(f"\n{'Camino':40} {'Segundos':>9}")
+    print(f"{'Listas de tokens (por llamada)':40} {listas:9.3f}")
+    print(f"{'TokenTable: construcción':40} {construccion:9.3f}")
+    print(f"{'TokenTable: sentimiento + prohibidas':40} {vectorizado:9.3f}  "
+          f"({listas / vectorizado:.0f}x)")
+    print(f"{'TokenTable: guardar .npz':40} {guardado:9.3f}")
+    print(f"{'TokenTable: cargar .npz':40} {carga:9.3f}")
+
+    memoria_tabla = sum(c.nbytes for c in columnas.values())
+    print(f"\nMemoria de los tokens: listas {memoria_listas / 2**20:.1f} MB | "
+          f"columnas {memoria_tabla / 2**20:.1f} MB | .npz {tamanio / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,4 +3,11 @@ Archivo de configuración para credenciales y claves API.
 """
 
 # AssemblyAI API Key
-ASSEMBLY_API_KEY = "tu_api_key_de_assemblyai"
\ No newline at end of file
+ASSEMBLY_API_KEY = "tu_api_key_de_assemblyai"
+
+# Motor de voz a texto: "assemblyai", "replay" (transcripciones ya grabadas) o "vosk" (local)
+STT_BACKEND = "assemblyai"
+# Opciones del motor, p. ej. {"directorio": "outputs"} para replay o {"model_path": ...} para vosk
+STT_OPTIONS = {}
+# Modelo de Vosk (https://alphacephei.com/vosk/models)
+VOSK_MODEL_PATH = "modelos/vosk-model-small-es-0.42"
@@ -0,0 +1,37 @@
+"""
+Reporte agregado de una campaña a partir de los reportes de outputs/.
+
+Uso:
+    python -m src.aggregate [outputs] [--salida outputs/.agregado] [--formato json csv columnar] [--top 10]
+"""
+import argparse
+import sys
+import time
+from typing import List
+
+from .modules.reporting.aggregate_report import AggregateReportGenerator
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Reporte agregado por agente y por día")
+    parser.add_argument("outputs", nargs="?", default="outputs", help="Directorio con los reportes de cada llamada")
+    parser.add_argument("--salida", default=None, help="Directorio de destino (por defecto <outputs>/.agregado)")
+    parser.add_argument("--formato", nargs="+", choices=["json", "csv", "columnar"], default=["json", "csv"],
+                        help="Formatos a generar")
+    parser.add_argument("--top", type=int, default=10, help="Palabras prohibidas a informar por grupo")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    agregado = AggregateReportGenerator(top=args.top)
+    n = agregado.add_tree(args.outputs)
+    salida = args.salida or f"{args.outputs.rstrip('/')}/.agregado"
+    for path in agregado.write(salida, args.formato):
+        print(f"Generado: {path}")
+    total = agregado.generate()["total"]
+    print(f"\nReportes: {n} ({agregado.errores} inválidos) | Cumplimiento: {total['tasa_cumplimiento']:.1%} | "
+          f"Tiempo: {time.perf_counter() - inicio:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
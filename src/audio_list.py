@@ -0,0 +1,268 @@
+"""
+Lista de audios virtualizada para la GUI.
+
+En lugar de un QTableWidget con un reproductor (QMediaPlayer + QAudioOutput)
+por fila, la lista usa un modelo (ModeloAudios) que la vista consulta solo
+para las filas visibles, un delegado que dibuja los botones de reproducción
+y un pool de pocos reproductores que se asignan al audio que se reproduce.
+"""
+import os
+from collections import OrderedDict
+from typing import List, Optional
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QEvent, QRect, QSize, QUrl, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate
+
+from .utils.audio_probe import format_duration
+
+COLUMNAS = ["Nombre", "Tipo", "Duración", "Reproducir"]
+COLUMNA_REPRODUCIR = 3
+
+# Rol con el estado de reproducción de la fila (True si se está reproduciendo)
+ROL_REPRODUCIENDO = Qt.ItemDataRole.UserRole + 1
+
+_SIN_MEDIR = object()
+
+# Reproductores simultáneos por defecto: el que suena y el último pausado
+DEFAULT_POOL_SIZE = 2
+
+
+class _Reproductor:
+    __slots__ = ("player", "audio_output", "ruta")
+
+    def __init__(self, player, audio_output):
+        self.player = player
+        self.audio_output = audio_output
+        self.ruta: Optional[str] = None
+
+
+class PoolReproductores(QObject):
+    estado_cambiado = pyqtSignal(str)
+    error = pyqtSignal(str, str)
+
+    def __init__(self, tamaño: int = DEFAULT_POOL_SIZE, parent=None):
+        """
+        Pool de reproductores compartido por todas las filas de la lista.
+
+        Los reproductores se crean recién cuando se reproduce un audio y se
+        reutilizan: si se pide un audio nuevo y el pool está lleno, se
+        reasigna el usado menos recientemente. Al reproducir un audio se
+        pausan los demás.
+
+        Args:
+            tamaño: Cantidad máxima de reproductores.
+            parent: QObject padre.
+        """
+        super().__init__(parent)
+        self.tamaño = max(1, tamaño)
+        # Ruta -> reproductor, del usado menos recientemente al más reciente
+        self._asignados: "OrderedDict[str, _Reproductor]" = OrderedDict()
+
+    def _crear(self) -> _Reproductor:
+        from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+
+        reproductor = _Reproductor(QMediaPlayer(self), QAudioOutput(self))
+        reproductor.player.setAudioOutput(reproductor.audio_output)
+
+        def on_status(status, r=reproductor):
+            if status == QMediaPlayer.MediaStatus.EndOfMedia and r.ruta:
+                self.estado_cambiado.emit(r.ruta)
+
+        def on_error(error, error_string, r=reproductor):
+            if error != QMediaPlayer.Error.NoError and r.ruta:
+                self.error.emit(r.ruta, error_string)
+                self.estado_cambiado.emit(r.ruta)
+
+        reproductor.player.mediaStatusChanged.connect(on_status)
+        reproductor.player.errorOccurred.connect(on_error)
+        return reproductor
+
+    def _reproductor_para(self, ruta: str) -> _Reproductor:
+        reproductor = self._asignados.get(ruta)
+        if reproductor is not None:
+            self._asignados.move_to_end(ruta)
+            return reproductor
+        if len(self._asignados) < self.tamaño:
+            reproductor = self._crear()
+        else:
+            anterior, reproductor = self._asignados.popitem(last=False)
+            reproductor.player.stop()
+            self.estado_cambiado.emit(anterior)
+        reproductor.ruta = ruta
+        reproductor.player.setSource(QUrl.fromLocalFile(os.path.abspath(ruta)))
+        self._asignados[ruta] = reproductor
+        return reproductor
+
+    def reproduciendo(self, ruta: str) -> bool:
+        """Indica si un audio se está reproduciendo."""
+        reproductor = self._asignados.get(ruta)
+        if reproductor is None:
+            return False
+        from PyQt6.QtMultimedia import QMediaPlayer
+        return reproductor.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+
+    def alternar(self, ruta: str):
+        """
+        Reproduce o pausa un audio.
+
+        Args:
+            ruta: Ruta al audio.
+        """
+        if not os.path.isfile(ruta):
+            self.error.emit(ruta, "Archivo no encontrado o ruta inválida.")
+            return
+        if self.reproduciendo(ruta):
+            self._asignados[ruta].player.pause()
+            self.estado_cambiado.emit(ruta)
+            return
+        for otra in list(self._asignados):
+            if otra != ruta and self.reproduciendo(otra):
+                self._asignados[otra].player.pause()
+                self.estado_cambiado.emit(otra)
+        self._reproductor_para(ruta).player.play()
+        self.estado_cambiado.emit(ruta)
+
+    def detener(self, ruta: str):
+        """Detiene un audio y vuelve al inicio."""
+        reproductor = self._asignados.get(ruta)
+        if reproductor is not None:
+            reproductor.player.stop()
+            self.estado_cambiado.emit(ruta)
+
+    def cleanup(self):
+        """Detiene todos los audios y libera los archivos abiertos."""
+        for ruta, reproductor in list(self._asignados.items()):
+            reproductor.player.stop()
+            reproductor.player.setSource(QUrl())
+            reproductor.ruta = None
+            self.estado_cambiado.emit(ruta)
+        self._asignados.clear()
+
+
+class ModeloAudios(QAbstractTableModel):
+    def __init__(self, pool: PoolReproductores = None, parent=None):
+        """
+        Modelo de la lista de audios. Los textos de cada fila se calculan
+        cuando la vista los pide, es decir, solo para las filas visibles.
+
+        Args:
+            pool: Pool de reproductores para el estado de reproducción.
+            parent: QObject padre.
+        """
+        super().__init__(parent)
+        self.pool = pool
+        self.audios: List[str] = []
+        self.duraciones: List[object] = []
+        self._filas = {}
+        if pool is not None:
+            pool.estado_cambiado.connect(self.actualizar_reproduccion)
+
+    def set_audios(self, audios: List[str]):
+        """Reemplaza la lista de audios."""
+        self.beginResetModel()
+        self.audios = list(audios)
+        self.duraciones = [_SIN_MEDIR] * len(self.audios)
+        self._filas = {audio: i for i, audio in enumerate(self.audios)}
+        self.endResetModel()
+
+    def set_duracion(self, fila: int, duracion_us: Optional[int]):
+        """Registra la duración medida de una fila."""
+        if 0 <= fila < len(self.duraciones):
+            self.duraciones[fila] = duracion_us
+            indice = self.index(fila, 2)
+            self.dataChanged.emit(indice, indice, [Qt.ItemDataRole.DisplayRole])
+
+    def actualizar_reproduccion(self, ruta: str):
+        fila = self._filas.get(ruta)
+        if fila is not None:
+            indice = self.index(fila, COLUMNA_REPRODUCIR)
+            self.dataChanged.emit(indice, indice, [ROL_REPRODUCIENDO])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.audios)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNAS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNAS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        audio = self.audios[index.row()]
+        columna = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if columna == 0:
+                return os.path.basename(audio)
+            if columna == 1:
+                return os.path.splitext(audio)[1][1:].upper()
+            if columna == 2:
+                duracion = self.duraciones[index.row()]
+                return "…" if duracion is _SIN_MEDIR else format_duration(duracion)
+        elif role == Qt.ItemDataRole.ToolTipRole and columna == 0:
+            return audio
+        elif role == ROL_REPRODUCIENDO and columna == COLUMNA_REPRODUCIR:
+            return self.pool is not None and self.pool.reproduciendo(audio)
+        return None
+
+
+class DelegadoReproduccion(QStyledItemDelegate):
+    reproducir = pyqtSignal(int)
+    detener = pyqtSignal(int)
+
+    BOTON = 40
+    ICONO = 28
+    ESPACIO = 8
+
+    def __init__(self, parent=None):
+        """
+        Dibuja los botones de reproducir/pausar y detener de cada fila sin
+        crear widgets, y traduce los clics en las señales reproducir y
+        detener con el número de fila.
+        """
+        super().__init__(parent)
+        style = QApplication.style()
+        self.icon_play = style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay)
+        self.icon_pause = style.standardIcon(QStyle.StandardPixmap.SP_MediaPause)
+        self.icon_stop = style.standardIcon(QStyle.StandardPixmap.SP_MediaStop)
+
+    def _botones(self, rect: QRect):
+        ancho = 2 * self.BOTON + self.ESPACIO
+        x = rect.x() + (rect.width() - ancho) // 2
+        y = rect.y() + (rect.height() - self.BOTON) // 2
+        return (QRect(x, y, self.BOTON, self.BOTON),
+                QRect(x + self.BOTON + self.ESPACIO, y, self.BOTON, self.BOTON))
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        reproduciendo = bool(index.data(ROL_REPRODUCIENDO))
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#bbdefb" if hover else "#e3eafc"))
+        for boton, icono in zip(self._botones(option.rect),
+                                (self.icon_pause if reproduciendo else self.icon_play, self.icon_stop)):
+            painter.drawEllipse(boton)
+            margen = (self.BOTON - self.ICONO) // 2
+            icono.paint(painter, boton.adjusted(margen, margen, -margen, -margen))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(2 * self.BOTON + self.ESPACIO + 16, self.BOTON + 4)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            play, stop = self._botones(option.rect)
+            pos = event.position().toPoint()
+            if play.contains(pos):
+                self.reproducir.emit(index.row())
+                return True
+            if stop.contains(pos):
+                self.detener.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
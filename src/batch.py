@@ -0,0 +1,468 @@
+"""
+Procesamiento por lotes de llamadas, sin interfaz gráfica.
+
+Ejecuta la misma cadena que la GUI (SpeechToText -> Tokenizer ->
+SentimentAnalyzer -> ProtocolAnalyzer -> ReportGenerator) sobre un
+directorio o un manifiesto de archivos, repartiendo las llamadas en un
+pool de procesos.
+
+Uso:
+    python -m src.batch <directorio|manifiesto.txt> [--workers N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Any, List, Tuple
+
+AUDIO_EXTS = [".mp3", ".wav"]
+TRANSCRIPT_EXTS = [".json"]
+TRANSCRIPT_NAME = "transcripcion_assembly.json"
+# Archivos JSON que genera el propio análisis en outputs/ (no son transcripciones)
+GENERATED_JSON = {"reporte.json", "tokens.json"}
+OUTPUT_DIR = "outputs"
+DEFAULT_SPELL_CACHE = os.path.join(OUTPUT_DIR, ".cache", "ortografia.json")
+DEFAULT_INDEX_PATH = os.path.join(OUTPUT_DIR, "corpus.db")
+# Cada cuántas llamadas un proceso trabajador guarda sus cachés (además de al terminar)
+FLUSH_EVERY = 50
+
+# Tokenizador del proceso trabajador (se crea una sola vez por proceso)
+_tokenizer = None
+_suggestion_engine = "phunspell"
+_rules_path = None
+_per_speaker = False
+_index_path = None
+# Motor de voz a texto del proceso trabajador: (nombre, opciones); None usa el configurado
+_stt_backend = None
+_speech_to_text = None
+_procesadas = 0
+
+
+def _init_worker(spell_cache_path: str = None, suggestion_engine: str = "phunspell", rules_path: str = None,
+                 per_speaker: bool = False, index_path: str = None, stt_backend: Tuple[str, Dict[str, Any]] = None):
+    global _suggestion_engine, _rules_path, _per_speaker, _index_path, _stt_backend
+    _stt_backend = stt_backend
+    _suggestion_engine = suggestion_engine
+    _rules_path = rules_path
+    _per_speaker = per_speaker
+    _index_path = index_path
+    # Las cachés se escriben cada FLUSH_EVERY llamadas y al terminar el proceso trabajador
+    from multiprocessing.util import Finalize
+    Finalize(None, _flush_worker, exitpriority=10)
+    if spell_cache_path:
+        from .modules.preprocessing.spell_checker import get_spell_checker
+        get_spell_checker(spell_cache_path)
+
+
+def _flush_worker():
+    if _speech_to_text is not None:
+        _speech_to_text.cache.flush()
+    if _tokenizer is not None:
+        _tokenizer.spell_checker.flush()
+
+
+def _get_tokenizer():
+    global _tokenizer
+    if _tokenizer is None:
+        from .modules.preprocessing.tokenizer import Tokenizer
+        _tokenizer = Tokenizer(suggestion_engine=_suggestion_engine)
+    return _tokenizer
+
+
+def _get_speech_to_text():
+    # Un solo motor por proceso (p. ej. el modelo de Vosk se carga una vez)
+    global _speech_to_text
+    if _speech_to_text is None:
+        from .modules.preprocessing.speech_to_text import SpeechToText
+        from .modules.preprocessing.stt_backends import get_backend
+        backend = get_backend(*_stt_backend) if _stt_backend else None
+        _speech_to_text = SpeechToText(backend=backend)
+    return _speech_to_text
+
+
+def nombre_llamada(path: str) -> str:
+    """
+    Obtiene el nombre con el que se guardan los resultados de una llamada.
+
+    Args:
+        path: Ruta al audio o a la transcripción.
+
+    Returns:
+        Nombre del subdirectorio dentro de outputs/.
+    """
+    base = os.path.splitext(os.path.basename(path))[0]
+    if os.path.basename(path) == TRANSCRIPT_NAME:
+        # Transcripción ya generada: usar el nombre de su directorio
+        return os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return base
+
+
+def es_transcripcion(path: str) -> bool:
+    """
+    Indica si un archivo JSON es una transcripción ({"text", "utterances"}).
+
+    Args:
+        path: Ruta al archivo JSON.
+
+    Returns:
+        True para transcripcion_assembly.json y para los JSON con "text" y
+        "utterances"; False para reportes, tokens, cachés y otros JSON.
+    """
+    nombre = os.path.basename(path)
+    if nombre == TRANSCRIPT_NAME:
+        return True
+    if nombre in GENERATED_JSON:
+        return False
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            datos = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(datos, dict) and isinstance(datos.get("text"), str) and "utterances" in datos
+
+
+def recolectar_entradas(origen: str) -> List[str]:
+    """
+    Obtiene la lista de archivos a procesar.
+
+    Args:
+        origen: Directorio con audios/transcripciones o manifiesto de texto
+            con una ruta por línea (las líneas vacías y las que empiezan
+            con '#' se ignoran). Cada línea del manifiesto puede agregar,
+            separados por tabulaciones, el agente y la fecha de la llamada
+            (ver leer_metadatos).
+
+    Returns:
+        Lista de rutas a audios o transcripciones JSON. En un directorio se
+        omiten los subdirectorios ocultos (p. ej. outputs/.cache) y los JSON
+        que no son transcripciones (ver es_transcripcion).
+    """
+    if os.path.isdir(origen):
+        entradas = []
+        for raiz, directorios, archivos in os.walk(origen):
+            directorios[:] = [d for d in directorios if not d.startswith(".")]
+            for archivo in sorted(archivos):
+                path = os.path.join(raiz, archivo)
+                ext = os.path.splitext(archivo)[1].lower()
+                if ext in AUDIO_EXTS or (ext in TRANSCRIPT_EXTS and es_transcripcion(path)):
+                    entradas.append(path)
+        return sorted(entradas)
+
+    base_dir = os.path.dirname(os.path.abspath(origen))
+    entradas = []
+    with open(origen, "r", encoding="utf-8") as f:
+        for linea in f:
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            linea = linea.split("\t", 1)[0].strip()
+            if not os.path.isabs(linea):
+                linea = os.path.join(base_dir, linea)
+            entradas.append(linea)
+    return entradas
+
+
+def nombres_repetidos(entradas: List[str]) -> Dict[str, List[str]]:
+    """
+    Busca entradas distintas que guardarían sus resultados en el mismo
+    directorio de outputs/ (p. ej. dos llamada.mp3 en carpetas diferentes).
+
+    Args:
+        entradas: Rutas a procesar.
+
+    Returns:
+        Diccionario nombre de la llamada -> rutas que lo comparten. Vacío si
+        no hay colisiones; una misma ruta repetida no cuenta como colisión.
+    """
+    por_nombre = {}
+    for path in dict.fromkeys(os.path.abspath(p) for p in entradas):
+        por_nombre.setdefault(nombre_llamada(path), []).append(path)
+    return {nombre: rutas for nombre, rutas in por_nombre.items() if len(rutas) > 1}
+
+
+def leer_metadatos(origen: str) -> Dict[str, Dict[str, str]]:
+    """
+    Lee el agente y la fecha de cada llamada de un manifiesto.
+
+    Formato de cada línea: ruta<TAB>agente[<TAB>fecha YYYY-MM-DD].
+
+    Args:
+        origen: Manifiesto (si es un directorio, no hay metadatos).
+
+    Returns:
+        Diccionario ruta -> {"agent", "date"} (solo las líneas que los tienen).
+    """
+    if os.path.isdir(origen):
+        return {}
+    base_dir = os.path.dirname(os.path.abspath(origen))
+    metadatos = {}
+    with open(origen, "r", encoding="utf-8") as f:
+        for linea in f:
+            linea = linea.strip()
+            if not linea or linea.startswith("#") or "\t" not in linea:
+                continue
+            campos = [c.strip() for c in linea.split("\t")]
+            path = campos[0] if os.path.isabs(campos[0]) else os.path.join(base_dir, campos[0])
+            datos = {}
+            if campos[1]:
+                datos["agent"] = campos[1]
+            if len(campos) > 2 and campos[2]:
+                datos["date"] = campos[2]
+            if datos:
+                metadatos[path] = datos
+    return metadatos
+
+
+def procesar_llamada(path: str, metadata: Dict[str, str] = None) -> Dict[str, Any]:
+    """
+    Procesa una llamada completa y guarda su reporte.
+
+    Args:
+        path: Ruta al audio o a una transcripción JSON ({"text", "utterances"}).
+        metadata: Agente ("agent") y fecha ("date") de la llamada. Si no se
+            indica la fecha, se usa la de modificación del archivo.
+
+    Returns:
+        Reporte generado.
+    """
+    from .modules.analysis.sentiment_analyzer import SentimentAccumulator, UtteranceSentimentAnalyzer
+    from .modules.analysis.protocol_analyzer import ProtocolAnalyzer
+    from .modules.reporting.report_generator import ReportGenerator
+
+    # 1. Transcripción (o lectura de una transcripción existente)
+    if os.path.splitext(path)[1].lower() in TRANSCRIPT_EXTS:
+        with open(path, "r", encoding="utf-8") as f:
+            transcripcion = json.load(f)
+    else:
+        transcripcion = _get_speech_to_text().transcribe(path)
+
+    tokenizer = _get_tokenizer()
+    utterances = transcripcion.get("utterances") or []
+    speaker_result = None
+    columnas = None
+    # Con el índice del corpus se guardan los tokens para poder reanalizar la
+    # llamada cuando cambie la tabla de símbolos (ver analysis.reanalysis)
+    tokens = [] if _index_path else None
+    if _per_speaker and utterances:
+        # 2 y 3. Tokenización por intervención y sentimiento por hablante
+        columnas = tokenizer.tokenize_utterances(utterances)
+        speaker_result = UtteranceSentimentAnalyzer(columnas, utterances).analyze()
+        sentiment_result = speaker_result["general"]
+        prohibidas = columnas.tokens_de("PALABRA_PROHIBIDA")
+    else:
+        # 2 y 3. Tokenización y análisis de sentimiento fusionados: cada token se
+        # acumula a medida que se genera y solo se conservan los que necesita el
+        # análisis de protocolo (palabras prohibidas)
+        sentimiento = SentimentAccumulator()
+        prohibidas = []
+        for t in tokenizer.iter_tokens(transcripcion.get("text") or ""):
+            sentimiento.update(t)
+            if t.token == "PALABRA_PROHIBIDA":
+                prohibidas.append(t)
+            if tokens is not None:
+                tokens.append(t)
+        sentiment_result = sentimiento.result()
+    protocol_result = ProtocolAnalyzer(prohibidas, utterances, _rules_path).analyze()
+
+    # 4. Reporte
+    call_dir = os.path.join(OUTPUT_DIR, nombre_llamada(path))
+    corpus_index = None
+    if _index_path:
+        from .modules.reporting.corpus_index import get_corpus_index
+        corpus_index = get_corpus_index(_index_path)
+    metadata = dict(metadata or {})
+    metadata.setdefault("date", datetime.fromtimestamp(os.stat(path).st_mtime).strftime("%Y-%m-%d"))
+    metadata = {"call": nombre_llamada(path), "agent": metadata.get("agent"), "date": metadata["date"]}
+    report = ReportGenerator(sentiment_result, protocol_result, speaker_result, corpus_index,
+                             metadata).generate_report(os.path.join(call_dir, "reporte.json"), transcripcion)
+    if corpus_index is not None:
+        from .modules.analysis.reanalysis import register_call
+        register_call(corpus_index, call_dir, tokens, columnas, utterances)
+    return report
+
+
+def _procesar_seguro(path: str, metadata: Dict[str, str] = None) -> Tuple[str, bool, str]:
+    global _procesadas
+    try:
+        procesar_llamada(path, metadata)
+        return path, True, ""
+    except Exception as e:
+        return path, False, str(e)
+    finally:
+        _procesadas += 1
+        if _procesadas % FLUSH_EVERY == 0:
+            _flush_worker()
+
+
+def procesar_lote(entradas: List[str], workers: int = None, spell_cache_path: str = None,
+                  suggestion_engine: str = "phunspell", rules_path: str = None,
+                  per_speaker: bool = False, index_path: str = None,
+                  metadatos: Dict[str, Dict[str, str]] = None,
+                  stt_backend: Tuple[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Procesa un lote de llamadas en paralelo.
+
+    Args:
+        entradas: Rutas a procesar.
+        workers: Cantidad de procesos. Si es None, usa la cantidad de CPUs.
+        spell_cache_path: Archivo de caché ortográfica compartido entre
+            ejecuciones. Si es None, la caché es solo en memoria.
+        suggestion_engine: Motor de sugerencias del tokenizador ("phunspell" o "symspell").
+        rules_path: Archivo de reglas de protocolo. Si es None, usa las reglas por defecto.
+        per_speaker: Analizar el sentimiento por intervención y por hablante.
+        index_path: Índice del corpus en el cual registrar cada reporte. Si es None, no se indexa.
+        metadatos: Agente y fecha de cada llamada, por ruta (ver leer_metadatos).
+        stt_backend: Motor de voz a texto para los audios, como (nombre, opciones)
+            de get_backend. Si es None, usa el configurado en credentials/config.py.
+
+    Returns:
+        Resumen con cantidad de llamadas procesadas, errores y rendimiento.
+    """
+    inicio = time.perf_counter()
+    ok = 0
+    errores = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(spell_cache_path, suggestion_engine, rules_path, per_speaker,
+                                       index_path, stt_backend)) as pool:
+        metadatos = metadatos or {}
+        futuros = [pool.submit(_procesar_seguro, p, metadatos.get(p)) for p in entradas]
+        for i, futuro in enumerate(as_completed(futuros), 1):
+            path, exito, mensaje = futuro.result()
+            if exito:
+                ok += 1
+                print(f"[{i}/{len(entradas)}] OK {path}")
+            else:
+                errores.append({"path": path, "error": mensaje})
+                print(f"[{i}/{len(entradas)}] ERROR {path}: {mensaje}")
+    segundos = time.perf_counter() - inicio
+    return {
+        "procesadas": ok,
+        "errores": errores,
+        "segundos": segundos,
+        "llamadas_por_minuto": (ok * 60.0 / segundos) if segundos > 0 else 0.0
+    }
+
+
+def transcribir_async(entradas: List[str], max_in_flight: int, base_url: str = None) -> List[str]:
+    """
+    Transcribe de forma concurrente los audios de la lista.
+
+    Args:
+        entradas: Rutas a procesar.
+        max_in_flight: Cantidad máxima de transcripciones simultáneas.
+        base_url: URL base de la API de transcripción.
+
+    Returns:
+        Lista de entradas donde cada audio transcripto se reemplaza por su
+        transcripción JSON. Los audios que fallaron se mantienen y se
+        reintentan de forma síncrona durante el análisis.
+    """
+    from .modules.preprocessing.async_transcriber import AsyncTranscriber
+
+    audios = [p for p in entradas if os.path.splitext(p)[1].lower() in AUDIO_EXTS]
+    if not audios:
+        return entradas
+
+    def on_result(path, resultado, error):
+        if error:
+            print(f"Transcripción fallida {path}: {error}")
+        else:
+            print(f"Transcripción lista {path}")
+
+    print(f"Transcribiendo {len(audios)} audios (máximo {max_in_flight} en curso)...")
+    transcriber = AsyncTranscriber(base_url=base_url, max_in_flight=max_in_flight)
+    resultados = transcriber.run(audios, on_result)
+    return [
+        AsyncTranscriber.output_path(p) if p in resultados and not isinstance(resultados[p], Exception) else p
+        for p in entradas
+    ]
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Procesamiento por lotes de llamadas")
+    parser.add_argument("origen", help="Directorio de audios/transcripciones o manifiesto con una ruta por línea")
+    parser.add_argument("--workers", type=int, default=None, help="Cantidad de procesos (por defecto, una por CPU)")
+    parser.add_argument("--transcripcion-async", action="store_true",
+                        help="Transcribir todos los audios de forma concurrente antes del análisis")
+    parser.add_argument("--max-en-vuelo", type=int, default=8,
+                        help="Transcripciones simultáneas con --transcripcion-async")
+    parser.add_argument("--assembly-url", default=None,
+                        help="URL base de la API de transcripción (p. ej. un servidor local de prueba)")
+    parser.add_argument("--cache-ortografia", nargs="?", const=DEFAULT_SPELL_CACHE, default=None,
+                        help="Persistir la caché de lookup/suggest de phunspell entre ejecuciones "
+                             f"(por defecto en {DEFAULT_SPELL_CACHE})")
+    parser.add_argument("--sugerencias", choices=["phunspell", "symspell"], default="phunspell",
+                        help="Motor de sugerencias para palabras desconocidas")
+    parser.add_argument("--reglas", default=None,
+                        help="Archivo de reglas de protocolo de la campaña "
+                             "(por defecto diccionario/protocolos/default.json)")
+    parser.add_argument("--por-hablante", action="store_true",
+                        help="Sentimiento por hablante (agente/cliente) y línea de tiempo por intervención")
+    parser.add_argument("--indice", nargs="?", const=DEFAULT_INDEX_PATH, default=None,
+                        help="Registrar cada reporte en el índice del corpus "
+                             f"(por defecto en {DEFAULT_INDEX_PATH}; ver python -m src.corpus)")
+    parser.add_argument("--stt", choices=["assemblyai", "replay", "vosk"], default=None,
+                        help="Motor de voz a texto para los audios (por defecto STT_BACKEND de credentials/config.py)")
+    parser.add_argument("--transcripciones", default=OUTPUT_DIR,
+                        help="Con --stt replay: directorio de las transcripciones grabadas")
+    parser.add_argument("--modelo-vosk", default=None,
+                        help="Con --stt vosk: directorio del modelo (por defecto VOSK_MODEL_PATH)")
+    args = parser.parse_args(argv)
+
+    stt_backend = None
+    if args.stt == "replay":
+        stt_backend = ("replay", {"directorio": args.transcripciones})
+    elif args.stt == "vosk":
+        stt_backend = ("vosk", {"model_path": args.modelo_vosk} if args.modelo_vosk else {})
+    elif args.stt:
+        stt_backend = (args.stt, {})
+    if args.transcripcion_async and args.stt not in (None, "assemblyai"):
+        parser.error("--transcripcion-async solo está disponible con AssemblyAI")
+
+    if args.reglas:
+        # Validar las reglas antes de lanzar los procesos
+        from .modules.analysis.protocol_rules import load_rules
+        try:
+            load_rules(args.reglas)
+        except (OSError, ValueError) as e:
+            print(f"No se pudieron cargar las reglas de protocolo: {e}")
+            return 1
+
+    entradas = recolectar_entradas(args.origen)
+    if not entradas:
+        print(f"No se encontraron archivos para procesar en: {args.origen}")
+        return 1
+    repetidos = nombres_repetidos(entradas)
+    if repetidos:
+        # Se rechazan antes de transcribir: compartirían transcripción y reporte
+        print("Hay llamadas distintas con el mismo nombre; renombre los archivos o procéselas por separado:")
+        for nombre, rutas in repetidos.items():
+            print(f"  {nombre}: {', '.join(rutas)}")
+        return 1
+    # Una misma ruta listada dos veces se procesa una sola vez
+    unicas = {}
+    for path in entradas:
+        unicas.setdefault(os.path.abspath(path), path)
+    entradas = list(unicas.values())
+
+    metadatos = leer_metadatos(args.origen)
+
+    if args.transcripcion_async:
+        originales = entradas
+        entradas = transcribir_async(entradas, args.max_en_vuelo, args.assembly_url)
+        metadatos = {nueva: metadatos[original] for original, nueva in zip(originales, entradas) if original in metadatos}
+
+    print(f"Procesando {len(entradas)} llamadas...")
+    resumen = procesar_lote(entradas, args.workers, args.cache_ortografia, args.sugerencias, args.reglas,
+                            args.por_hablante, args.indice, metadatos, stt_backend)
+    print(f"\nProcesadas: {resumen['procesadas']} | Errores: {len(resumen['errores'])} | "
+          f"Tiempo: {resumen['segundos']:.1f} s | "
+          f"Rendimiento: {resumen['llamadas_por_minuto']:.1f} llamadas/min")
+    return 1 if resumen["errores"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
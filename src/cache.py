@@ -0,0 +1,44 @@
+"""
+Administración de la caché de transcripciones.
+
+Uso:
+    python -m src.cache stats
+    python -m src.cache evict --max-mb 500
+"""
+import argparse
+import sys
+from datetime import datetime
+from typing import List
+
+from .modules.preprocessing.transcription_cache import TranscriptionCache
+
+
+def _fecha(ts) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "-"
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Administración de la caché de transcripciones")
+    parser.add_argument("--dir", default=None, help="Directorio de la caché")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("stats", help="Muestra estadísticas de la caché")
+    evict = sub.add_parser("evict", help="Desaloja las entradas menos usadas")
+    evict.add_argument("--max-mb", type=float, required=True, help="Tamaño máximo en MB")
+    args = parser.parse_args(argv)
+
+    cache = TranscriptionCache(args.dir)
+    if args.comando == "evict":
+        eliminadas = cache.evict(int(args.max_mb * 1024 * 1024))
+        print(f"Entradas eliminadas: {eliminadas}")
+
+    stats = cache.stats()
+    print(f"Directorio: {stats['directorio']}")
+    print(f"Entradas: {stats['entradas']}")
+    print(f"Tamaño: {stats['bytes'] / (1024 * 1024):.2f} MB de {stats['max_bytes'] / (1024 * 1024):.0f} MB")
+    print(f"Acceso más antiguo: {_fecha(stats['acceso_mas_antiguo'])}")
+    print(f"Acceso más reciente: {_fecha(stats['acceso_mas_reciente'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
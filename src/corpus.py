@@ -0,0 +1,87 @@
+"""
+Consulta y mantenimiento del índice del corpus de llamadas (outputs/corpus.db).
+
+Uso:
+    python -m src.corpus rebuild [--full]
+    python -m src.corpus search "reclamo" --prohibited Detectadas --desde 2025-06-01
+    python -m src.corpus search --max-score -5 --sentiment Negativo
+    python -m src.corpus ingest outputs/llamada_001
+    python -m src.corpus stats
+"""
+import argparse
+import json
+import sys
+from typing import List
+
+from .modules.reporting.corpus_index import CorpusIndex
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Índice del corpus de llamadas")
+    parser.add_argument("--db", default=None, help="Archivo del índice (por defecto outputs/corpus.db)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    rebuild = sub.add_parser("rebuild", help="Sincroniza el índice con el directorio de salidas")
+    rebuild.add_argument("--outputs", default="outputs", help="Directorio de salidas")
+    rebuild.add_argument("--full", action="store_true", help="Volver a indexar todas las llamadas")
+
+    ingest = sub.add_parser("ingest", help="Indexa uno o más directorios de llamadas")
+    ingest.add_argument("directorios", nargs="+")
+
+    search = sub.add_parser("search", help="Busca llamadas")
+    search.add_argument("texto", nargs="?", default=None, help="Consulta de texto completo sobre las intervenciones")
+    search.add_argument("--sentiment", choices=["Positivo", "Negativo", "Neutral"])
+    search.add_argument("--min-score", type=int)
+    search.add_argument("--max-score", type=int)
+    search.add_argument("--desde", help="Fecha mínima (YYYY-MM-DD)")
+    search.add_argument("--hasta", help="Fecha máxima (YYYY-MM-DD)")
+    search.add_argument("--greeting", choices=["OK", "Faltante"])
+    search.add_argument("--identification", choices=["OK", "Faltante"])
+    search.add_argument("--prohibited", choices=["OK", "Detectadas"])
+    search.add_argument("--farewell", choices=["OK", "Faltante"])
+    search.add_argument("--palabra-prohibida", help="Llamadas en las que se detectó esa palabra")
+    search.add_argument("--limit", type=int, default=50)
+    search.add_argument("--json", action="store_true", help="Imprimir los resultados en JSON")
+
+    sub.add_parser("stats", help="Muestra el tamaño del índice")
+    args = parser.parse_args(argv)
+
+    with CorpusIndex(args.db) as index:
+        if args.comando == "rebuild":
+            resumen = index.rebuild(args.outputs, full=args.full)
+            print(f"Indexadas: {resumen['indexadas']} | Sin cambios: {resumen['sin_cambios']} | "
+                  f"Eliminadas: {resumen['eliminadas']}")
+        elif args.comando == "ingest":
+            for directorio in args.directorios:
+                if not index.ingest_dir(directorio, force=True):
+                    print(f"Sin reporte: {directorio}")
+        elif args.comando == "search":
+            try:
+                resultados = index.search(
+                    args.texto, sentiment=args.sentiment, min_score=args.min_score, max_score=args.max_score,
+                    desde=args.desde, hasta=args.hasta, palabra_prohibida=args.palabra_prohibida, limit=args.limit,
+                    greeting=args.greeting, identification=args.identification, prohibited=args.prohibited,
+                    farewell=args.farewell
+                )
+            except ValueError as e:
+                print(e)
+                return 1
+            if args.json:
+                print(json.dumps(resultados, ensure_ascii=False, indent=2))
+            else:
+                for r in resultados:
+                    prohibidas = f" | Prohibidas: {', '.join(r['prohibited_words'])}" if r["prohibited_words"] else ""
+                    print(f"{r['fecha']}  {r['nombre']}  {r['sentiment']} ({r['score']}){prohibidas}")
+                    for c in r.get("coincidencias", []):
+                        print(f"    [{c['speaker']}] {c['text']}")
+                print(f"\n{len(resultados)} llamadas")
+        elif args.comando == "stats":
+            stats = index.stats()
+            print(f"Índice: {stats['path']}")
+            print(f"Llamadas: {stats['llamadas']}")
+            print(f"Intervenciones: {stats['utterances']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,26 +2,90 @@ import sys
 import os
 import json
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QFileDialog, QTextEdit, QStackedWidget, QListWidgetItem, QMessageBox, QProgressBar, QDialog, QTableWidget, QTableWidgetItem, QSpinBox, QComboBox, QLineEdit, QHeaderView, QSizePolicy, QStyle, QProgressDialog
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QFileDialog, QTextEdit, QStackedWidget, QListWidgetItem, QMessageBox, QProgressBar, QDialog, QTableWidget, QTableWidgetItem, QTableView, QSpinBox, QComboBox, QLineEdit, QHeaderView, QSizePolicy, QStyle, QProgressDialog,
+    QStyledItemDelegate, QStyleOptionProgressBar
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QUrl
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QRunnable, QObject, pyqtSignal, QSize, QUrl
 from PyQt6.QtGui import QPixmap, QIcon, QMovie
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from pydub import AudioSegment
 from typing import Dict, Any, List
 from datetime import datetime
 
 # Importar los nuevos módulos
 from .modules.preprocessing.speech_to_text import SpeechToText
 from .modules.preprocessing.tokenizer import Tokenizer as TokenizerBase
+from .modules.preprocessing.lexicon_store import get_lexicon_store
 from .modules.analysis.sentiment_analyzer import SentimentAnalyzer
 from .modules.analysis.protocol_analyzer import ProtocolAnalyzer
 from .modules.reporting.report_generator import ReportGenerator
+from .modules.reporting.corpus_index import get_corpus_index
+from .modules.analysis.reanalysis import Reanalyzer, register_call
+from .utils.audio_probe import DurationCache, probe_many
+from .audio_list import ModeloAudios, DelegadoReproduccion, PoolReproductores, COLUMNA_REPRODUCIR
 
 AUDIO_EXTS = [".mp3", ".wav"]
 AUDIO_DIR = "../audio/"
 OUTPUT_DIR = "../outputs/"
 
+class ProcesoCancelado(Exception):
+    pass
+
+def procesar_audio(audio_path, progreso=None, cancelado=None, parent=None):
+    """
+    Transcribe un audio, lo analiza y guarda su reporte en outputs/.
+
+    Args:
+        audio_path: Ruta al audio.
+        progreso: Función que recibe el porcentaje de avance.
+        cancelado: Función que devuelve True para interrumpir el proceso
+            entre etapas.
+        parent: Widget padre para el tokenizador.
+
+    Returns:
+        Tupla (transcripción, tokens).
+
+    Raises:
+        ProcesoCancelado: Si se canceló antes de terminar.
+    """
+    def avance(valor):
+        if cancelado is not None and cancelado():
+            raise ProcesoCancelado()
+        if progreso is not None:
+            progreso(valor)
+
+    # 1. Transcripción y diarización
+    avance(10)
+    stt = SpeechToText()
+    transcripcion = stt.transcribe(audio_path)
+    stt.cache.flush()
+    avance(40)
+
+    # 2. Tokenización
+    tokenizer = Tokenizer()
+    tokens = tokenizer.tokenize(transcripcion["text"], parent)
+    avance(60)
+
+    # 3. Análisis de sentimiento
+    sentiment_analyzer = SentimentAnalyzer(tokens)
+    sentiment_result = sentiment_analyzer.analyze()
+    avance(80)
+
+    # 4. Análisis de protocolo
+    protocol_analyzer = ProtocolAnalyzer(tokens, transcripcion["utterances"])
+    protocol_result = protocol_analyzer.analyze()
+    avance(90)
+
+    # 5. Generación de reporte
+    report_generator = ReportGenerator(sentiment_result, protocol_result, corpus_index=get_corpus_index())
+    output_dir = os.path.join("outputs", os.path.splitext(os.path.basename(audio_path))[0])
+    os.makedirs(output_dir, exist_ok=True)
+    report_path = os.path.join(output_dir, "reporte.json")
+    report_generator.generate_report(report_path)
+    register_call(get_corpus_index(), output_dir, tokens)
+    if progreso is not None:
+        progreso(100)
+    return transcripcion, tokens
+
 class ProcesamientoThread(QThread):
     progreso = pyqtSignal(int)
     terminado = pyqtSignal(str)
@@ -31,41 +95,191 @@ class ProcesamientoThread(QThread):
         super().__init__()
         self.audio_path = audio_path
         self.parent = parent
+        # Resultados que reutiliza el resumen (ResumenThread) sin volver a tokenizar
+        self.transcripcion = None
+        self.tokens = None
+
+    def run(self):
+        try:
+            self.transcripcion, self.tokens = procesar_audio(self.audio_path, self.progreso.emit, parent=self.parent)
+            self.terminado.emit(self.audio_path)
+        except Exception as e:
+            self.error.emit(str(e))
+
+def formatear_resumen(report):
+    """Devuelve el HTML del resumen de sentimiento y del protocolo de un reporte."""
+    resumen = f"""
+    <b>Sentimiento general:</b> {report['sentiment_analysis']['sentiment']} ({report['sentiment_analysis']['score']})<br>
+    <b>Palabras positivas:</b> {report['sentiment_analysis']['positive_words_count']}<br>
+    <b>Palabras negativas:</b> {report['sentiment_analysis']['negative_words_count']}<br>
+    """
+    if report['sentiment_analysis']['most_positive']['word']:
+        resumen += f"<b>Palabra más positiva:</b> {report['sentiment_analysis']['most_positive']['word']} ({report['sentiment_analysis']['most_positive']['score']})<br>"
+    if report['sentiment_analysis']['most_negative']['word']:
+        resumen += f"<b>Palabra más negativa:</b> {report['sentiment_analysis']['most_negative']['word']} ({report['sentiment_analysis']['most_negative']['score']})<br>"
+    # Protocolo
+    prohibited = report['protocol_analysis']['prohibited_words']
+    protocolo = f"""
+    <b>Fase de saludo:</b> {report['protocol_analysis']['greeting']['status']}<br>
+    <b>Identificación del cliente:</b> {report['protocol_analysis']['identification']['status']}<br>
+    """
+    if prohibited['status'] == 'OK' and prohibited['found'] == ["Ninguna detectada"]:
+        protocolo += f"<b>Uso de palabras prohibidas:</b> Ninguna detectada<br>"
+    else:
+        protocolo += f"<b>Uso de palabras prohibidas:</b> {prohibited['status']}<br>"
+        if prohibited['found'] and prohibited['found'] != ["Ninguna detectada"]:
+            protocolo += f"<b>Palabras prohibidas encontradas:</b> {', '.join(prohibited['found'])}<br>"
+    protocolo += f"<b>Despedida amable:</b> {report['protocol_analysis']['farewell']['status']}<br>"
+    return resumen, protocolo
+
+class ResumenThread(QThread):
+    progreso = pyqtSignal(int)
+    correccion_requerida = pyqtSignal(list)
+    terminado = pyqtSignal(str, str)
+    error = pyqtSignal(str)
+
+    def __init__(self, audio_path, tokens=None, transcripcion=None, correcciones=None, force=False, parent=None):
+        """
+        Genera el reporte y el resumen de una llamada fuera del hilo de la interfaz.
+
+        Reutiliza los tokens y la transcripción de ProcesamientoThread; solo
+        si no están disponibles lee la transcripción y vuelve a tokenizar.
+        Si se pasan correcciones, primero las guarda en la tabla de símbolos,
+        reanaliza los reportes afectados y actualiza los tokens.
+
+        Args:
+            audio_path: Ruta al audio de la llamada.
+            tokens: Tokens de la llamada (se modifican con las correcciones).
+            transcripcion: Transcripción de la llamada.
+            correcciones: Correcciones de PantallaCorreccionLexemas.
+            force: Generar el resumen aunque haya palabras no válidas.
+            parent: QObject padre.
+        """
+        super().__init__(parent)
+        self.audio_path = audio_path
+        self.tokens = tokens
+        self.transcripcion = transcripcion
+        self.correcciones = correcciones or []
+        self.force = force
 
     def run(self):
         try:
-            # 1. Transcripción y diarización
-            self.progreso.emit(10)
-            stt = SpeechToText()
-            transcripcion = stt.transcribe(self.audio_path)
-            self.progreso.emit(40)
-            
-            # 2. Tokenización
-            tokenizer = Tokenizer()
-            tokens = tokenizer.tokenize(transcripcion["text"], self.parent)
-            self.progreso.emit(60)
-            
-            # 3. Análisis de sentimiento
-            sentiment_analyzer = SentimentAnalyzer(tokens)
-            sentiment_result = sentiment_analyzer.analyze()
-            self.progreso.emit(80)
-            
-            # 4. Análisis de protocolo
-            protocol_analyzer = ProtocolAnalyzer(tokens, transcripcion["utterances"])
-            protocol_result = protocol_analyzer.analyze()
-            
-            # 5. Generación de reporte
-            report_generator = ReportGenerator(sentiment_result, protocol_result)
             output_dir = os.path.join("outputs", os.path.splitext(os.path.basename(self.audio_path))[0])
-            os.makedirs(output_dir, exist_ok=True)
             report_path = os.path.join(output_dir, "reporte.json")
-            report_generator.generate_report(report_path)
-            
+            if self.transcripcion is None:
+                with open(os.path.join(output_dir, "transcripcion_assembly.json"), "r", encoding="utf-8") as f:
+                    self.transcripcion = json.load(f)
+            if self.tokens is None:
+                self.tokens = Tokenizer().tokenize(self.transcripcion.get("text", ""))
+            self.progreso.emit(20)
+            if self.isInterruptionRequested():
+                return
+
+            if self.correcciones:
+                self.aplicar_correcciones()
+                self.progreso.emit(40)
+                if self.isInterruptionRequested():
+                    return
+
+            palabras_no_validas = [t for t in self.tokens if not t["valido"]]
+            if palabras_no_validas and not self.force:
+                # Mostrar pantalla de corrección antes de cualquier análisis
+                self.correccion_requerida.emit(palabras_no_validas)
+                return
+
+            sentiment_result = SentimentAnalyzer(self.tokens).analyze()
+            self.progreso.emit(60)
+            protocol_result = ProtocolAnalyzer(self.tokens, self.transcripcion.get("utterances", [])).analyze()
+            self.progreso.emit(80)
+            if self.isInterruptionRequested():
+                return
+
+            report_generator = ReportGenerator(sentiment_result, protocol_result, corpus_index=get_corpus_index())
+            report = report_generator.generate_report(report_path, self.transcripcion)
+            register_call(get_corpus_index(), output_dir, self.tokens)
             self.progreso.emit(100)
-            self.terminado.emit(self.audio_path)
+            resumen, protocolo = formatear_resumen(report)
+            self.terminado.emit(resumen, protocolo)
         except Exception as e:
             self.error.emit(str(e))
 
+    def aplicar_correcciones(self):
+        dictionary_path = Tokenizer().dictionary_path
+        # Solo se agregan los cambios al journal de la tabla (sin reescribirla)
+        get_lexicon_store(dictionary_path).apply({
+            corr["lexema"]: {"puntaje": corr["puntaje"], "token": corr["token"]}
+            for corr in self.correcciones
+        })
+        # Reanalizar los demás reportes que dependen de los lexemas modificados
+        resultado = Reanalyzer(get_corpus_index(), dictionary_path).run()
+        if resultado["reanalizadas"]:
+            print(f"Reportes reanalizados por cambios en la tabla de símbolos: {len(resultado['reanalizadas'])}")
+        for error in resultado["errores"]:
+            print(f"No se pudo reanalizar {error['llamada']}: {error['error']}")
+        # Actualizar tokens
+        por_original = {corr["original"]: corr for corr in self.correcciones}
+        for token in self.tokens:
+            corr = por_original.get(token["lexema"])
+            if corr is not None:
+                token["lexema"] = corr["lexema"]
+                token["valido"] = True
+                token["sentiment"] = int(corr["puntaje"])
+                token["token"] = str(corr["token"])
+
+class SenalesTrabajo(QObject):
+    progreso = pyqtSignal(int, int)
+    terminado = pyqtSignal(int)
+    error = pyqtSignal(int, str)
+
+class TrabajoLlamada(QRunnable):
+    def __init__(self, id_trabajo, audio_path):
+        """
+        Procesamiento de una llamada de la cola (PantallaCola) en el QThreadPool.
+
+        Un QRunnable no puede emitir señales, por lo que el avance se informa
+        con un SenalesTrabajo creado en el hilo de la interfaz.
+
+        Args:
+            id_trabajo: Identificador del trabajo en la cola.
+            audio_path: Ruta al audio.
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.id_trabajo = id_trabajo
+        self.audio_path = audio_path
+        self.senales = SenalesTrabajo()
+        self.cancelado = False
+        self.transcripcion = None
+        self.tokens = None
+
+    def run(self):
+        try:
+            self.transcripcion, self.tokens = procesar_audio(
+                self.audio_path,
+                lambda valor: self.senales.progreso.emit(self.id_trabajo, valor),
+                lambda: self.cancelado
+            )
+            self.senales.terminado.emit(self.id_trabajo)
+        except ProcesoCancelado:
+            self.senales.error.emit(self.id_trabajo, "Cancelado")
+        except Exception as e:
+            self.senales.error.emit(self.id_trabajo, str(e))
+
+class DelegadoProgreso(QStyledItemDelegate):
+    def paint(self, painter, option, index):
+        valor = index.data(Qt.ItemDataRole.UserRole)
+        if valor is None:
+            super().paint(painter, option, index)
+            return
+        barra = QStyleOptionProgressBar()
+        barra.rect = option.rect.adjusted(4, 10, -4, -10)
+        barra.minimum = 0
+        barra.maximum = 100
+        barra.progress = int(valor)
+        barra.text = f"{int(valor)}%"
+        barra.textVisible = True
+        QApplication.style().drawControl(QStyle.ControlElement.CE_ProgressBar, barra, painter)
+
 class PantallaBienvenida(QWidget):
     archivos_seleccionados = pyqtSignal(list)
 
@@ -99,6 +313,210 @@ class PantallaBienvenida(QWidget):
         if files:
             self.archivos_seleccionados.emit(files)
 
+class PantallaCola(QWidget):
+    EN_COLA = "En cola"
+    PROCESANDO = "Procesando"
+    COMPLETADO = "Completado"
+    ERROR = "Error"
+    CANCELADO = "Cancelado"
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout()
+        self.btn_volver = QPushButton()
+        self.btn_volver.setText("←")
+        self.btn_volver.setObjectName("btnVolver")
+        self.btn_volver.setIcon(QIcon())
+        self.btn_volver.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_volver.clicked.connect(self.volver_lista)
+        topbar = QHBoxLayout()
+        topbar.addWidget(self.btn_volver, alignment=Qt.AlignmentFlag.AlignLeft)
+        topbar.addStretch()
+        layout.addLayout(topbar)
+        self.label = QLabel("Cola de procesamiento")
+        self.label.setObjectName("tituloAnalisis")
+        layout.addWidget(self.label)
+
+        # Pool propio: los trabajos siguen corriendo al cambiar de pantalla
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(min(4, QThread.idealThreadCount()))
+        controles = QHBoxLayout()
+        self.btn_agregar = QPushButton("Agregar audios")
+        self.btn_agregar.clicked.connect(self.seleccionar_archivos)
+        self.spin_hilos = QSpinBox()
+        self.spin_hilos.setRange(1, max(1, QThread.idealThreadCount()) * 2)
+        self.spin_hilos.setValue(self.pool.maxThreadCount())
+        self.spin_hilos.valueChanged.connect(self.pool.setMaxThreadCount)
+        self.btn_cancelar = QPushButton("Cancelar pendientes")
+        self.btn_cancelar.clicked.connect(self.cancelar_todo)
+        self.btn_limpiar = QPushButton("Quitar terminados")
+        self.btn_limpiar.clicked.connect(self.quitar_terminados)
+        controles.addWidget(self.btn_agregar)
+        controles.addWidget(QLabel("Llamadas en paralelo:"))
+        controles.addWidget(self.spin_hilos)
+        controles.addStretch()
+        controles.addWidget(self.btn_limpiar)
+        controles.addWidget(self.btn_cancelar)
+        layout.addLayout(controles)
+
+        self.tabla = QTableWidget()
+        self.tabla.setColumnCount(3)
+        self.tabla.setHorizontalHeaderLabels(["Nombre", "Estado", "Progreso"])
+        self.tabla.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.tabla.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.tabla.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.tabla.setItemDelegateForColumn(2, DelegadoProgreso(self.tabla))
+        self.tabla.cellDoubleClicked.connect(self.abrir_trabajo)
+        header = self.tabla.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(1, 140)
+        header.resizeSection(2, 180)
+        self.tabla.verticalHeader().setVisible(False)
+        self.tabla.verticalHeader().setDefaultSectionSize(36)
+        layout.addWidget(self.tabla, stretch=1)
+
+        self.resumen = QLabel("")
+        self.resumen.setStyleSheet("color: #666;")
+        layout.addWidget(self.resumen)
+        self.setLayout(layout)
+        self.ventana_principal = None
+        # id -> trabajo, y fila de la tabla de cada id
+        self.trabajos = {}
+        self.estados = {}
+        self.filas = {}
+        self._siguiente_id = 0
+
+    def seleccionar_archivos(self):
+        files, _ = QFileDialog.getOpenFileNames(self, "Seleccionar audios", AUDIO_DIR, "Archivos de audio (*.mp3 *.wav)")
+        if files:
+            self.encolar(files)
+
+    def encolar(self, audios):
+        """Agrega audios a la cola; los que ya están en cola o procesándose se ignoran."""
+        activos = {self.trabajos[i].audio_path for i, estado in self.estados.items()
+                   if estado in (self.EN_COLA, self.PROCESANDO)}
+        for audio in audios:
+            if audio in activos:
+                continue
+            activos.add(audio)
+            id_trabajo = self._siguiente_id
+            self._siguiente_id += 1
+            trabajo = TrabajoLlamada(id_trabajo, audio)
+            trabajo.senales.progreso.connect(self.actualizar_progreso)
+            trabajo.senales.terminado.connect(self.trabajo_terminado)
+            trabajo.senales.error.connect(self.trabajo_fallido)
+            fila = self.tabla.rowCount()
+            self.tabla.insertRow(fila)
+            self.tabla.setItem(fila, 0, QTableWidgetItem(os.path.basename(audio)))
+            self.tabla.setItem(fila, 1, QTableWidgetItem(self.EN_COLA))
+            progreso = QTableWidgetItem()
+            progreso.setData(Qt.ItemDataRole.UserRole, 0)
+            self.tabla.setItem(fila, 2, progreso)
+            self.trabajos[id_trabajo] = trabajo
+            self.filas[id_trabajo] = fila
+            self._set_estado(id_trabajo, self.EN_COLA)
+            self.pool.start(trabajo)
+        self.actualizar_resumen()
+
+    def _set_estado(self, id_trabajo, estado):
+        self.estados[id_trabajo] = estado
+        item = self.tabla.item(self.filas[id_trabajo], 1)
+        if item is not None:
+            item.setText(estado)
+
+    def actualizar_progreso(self, id_trabajo, valor):
+        if id_trabajo not in self.filas:
+            return
+        if self.estados[id_trabajo] == self.EN_COLA:
+            self._set_estado(id_trabajo, self.PROCESANDO)
+        self.tabla.item(self.filas[id_trabajo], 2).setData(Qt.ItemDataRole.UserRole, valor)
+
+    def trabajo_terminado(self, id_trabajo):
+        if id_trabajo not in self.filas:
+            return
+        self._set_estado(id_trabajo, self.COMPLETADO)
+        self.tabla.item(self.filas[id_trabajo], 2).setData(Qt.ItemDataRole.UserRole, 100)
+        self.actualizar_resumen()
+
+    def trabajo_fallido(self, id_trabajo, msg):
+        if id_trabajo not in self.filas:
+            return
+        trabajo = self.trabajos[id_trabajo]
+        self._set_estado(id_trabajo, self.CANCELADO if trabajo.cancelado else self.ERROR)
+        self.tabla.item(self.filas[id_trabajo], 1).setToolTip(msg)
+        self.actualizar_resumen()
+
+    def cancelar_todo(self):
+        """Quita de la cola los trabajos pendientes e interrumpe los que están en curso."""
+        for id_trabajo, trabajo in self.trabajos.items():
+            estado = self.estados[id_trabajo]
+            if estado not in (self.EN_COLA, self.PROCESANDO):
+                continue
+            trabajo.cancelado = True
+            if self.pool.tryTake(trabajo):
+                self._set_estado(id_trabajo, self.CANCELADO)
+        self.actualizar_resumen()
+
+    def quitar_terminados(self):
+        for id_trabajo in sorted(self.filas, key=self.filas.get, reverse=True):
+            if self.estados[id_trabajo] in (self.EN_COLA, self.PROCESANDO):
+                continue
+            self.tabla.removeRow(self.filas.pop(id_trabajo))
+            del self.trabajos[id_trabajo]
+            del self.estados[id_trabajo]
+        for fila, id_trabajo in enumerate(sorted(self.filas, key=self.filas.get)):
+            self.filas[id_trabajo] = fila
+        self.actualizar_resumen()
+
+    def actualizar_resumen(self):
+        conteo = {}
+        for estado in self.estados.values():
+            conteo[estado] = conteo.get(estado, 0) + 1
+        estados = (self.EN_COLA, self.PROCESANDO, self.COMPLETADO, self.ERROR, self.CANCELADO)
+        self.resumen.setText(" | ".join(f"{estado}: {conteo[estado]}" for estado in estados if conteo.get(estado)))
+
+    def trabajo_en_fila(self, fila):
+        for id_trabajo, f in self.filas.items():
+            if f == fila:
+                return self.trabajos[id_trabajo]
+        return None
+
+    def abrir_trabajo(self, row, col):
+        trabajo = self.trabajo_en_fila(row)
+        if trabajo is None or self.estados[trabajo.id_trabajo] != self.COMPLETADO:
+            return
+        if self.ventana_principal:
+            self.ventana_principal.mostrar_analisis(trabajo.audio_path, {
+                "transcripcion": trabajo.transcripcion,
+                "tokens": trabajo.tokens
+            })
+
+    def detener(self):
+        """Cancela la cola y espera a que terminen los trabajos en curso."""
+        self.cancelar_todo()
+        self.pool.waitForDone()
+
+    def volver_lista(self):
+        if self.ventana_principal:
+            self.ventana_principal.stacked.setCurrentWidget(self.ventana_principal.pantalla_lista)
+
+class DuracionesThread(QThread):
+    duracion = pyqtSignal(int, object)
+
+    def __init__(self, audios, cache, parent=None):
+        super().__init__(parent)
+        self.audios = audios
+        self.cache = cache
+
+    def run(self):
+        # Se leen solo los encabezados de cada audio, en un pool de hilos
+        for i, duracion_us in probe_many(self.audios, self.cache, cancelado=self.isInterruptionRequested):
+            if self.isInterruptionRequested():
+                break
+            self.duracion.emit(i, duracion_us)
+
 class PantallaLista(QWidget):
     audio_seleccionado = pyqtSignal(str)
 
@@ -115,6 +533,12 @@ class PantallaLista(QWidget):
         topbar = QHBoxLayout()
         topbar.addWidget(self.btn_volver, alignment=Qt.AlignmentFlag.AlignLeft)
         topbar.addStretch()
+        self.btn_encolar = QPushButton("Procesar todos en cola")
+        self.btn_encolar.clicked.connect(self.encolar_todos)
+        self.btn_ver_cola = QPushButton("Ver cola")
+        self.btn_ver_cola.clicked.connect(self.ver_cola)
+        topbar.addWidget(self.btn_ver_cola)
+        topbar.addWidget(self.btn_encolar)
         layout.addLayout(topbar)
         self.label = QLabel("Lista de audios")
         self.label.setObjectName("tituloAnalisis")
@@ -123,73 +547,88 @@ class PantallaLista(QWidget):
         card_layout.setContentsMargins(0,0,0,0)
         self.card.setLayout(card_layout)
         self.card.setStyleSheet("")
-        self.tabla = QTableWidget()
-        self.tabla.setColumnCount(4)
-        self.tabla.setHorizontalHeaderLabels(["Nombre", "Tipo", "Duración", "Reproducir"])
-        self.tabla.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.tabla.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.tabla.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.tabla.cellDoubleClicked.connect(self.abrir_audio)
-        self.tabla.cellClicked.connect(self.marcar_audio)
+        self.pool_reproductores = PoolReproductores(parent=self)
+        self.pool_reproductores.error.connect(self.mostrar_error_reproduccion)
+        self.modelo = ModeloAudios(self.pool_reproductores, self)
+        self.delegado = DelegadoReproduccion(self)
+        self.delegado.reproducir.connect(lambda fila: self.pool_reproductores.alternar(self.audios[fila]))
+        self.delegado.detener.connect(lambda fila: self.pool_reproductores.detener(self.audios[fila]))
+        self.tabla = QTableView()
+        self.tabla.setModel(self.modelo)
+        self.tabla.setItemDelegateForColumn(COLUMNA_REPRODUCIR, self.delegado)
+        self.tabla.setMouseTracking(True)
+        self.tabla.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.tabla.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.tabla.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.tabla.doubleClicked.connect(lambda index: self.abrir_audio(index.row(), index.column()))
+        self.tabla.clicked.connect(lambda index: self.marcar_audio(index.row(), index.column()))
         header = self.tabla.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        # Anchos fijos: ResizeToContents mediría todas las filas
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(1, 70)
+        header.resizeSection(2, 110)
         header.resizeSection(3, 120)  # Columna de reproducir más angosta
-        self.tabla.verticalHeader().setVisible(False)
+        vertical = self.tabla.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(44)
         self.tabla.setCornerButtonEnabled(False)
         card_layout.addWidget(self.tabla)
         layout.addWidget(self.label)
         layout.addWidget(self.card, stretch=1)
         self.setLayout(layout)
-        self.reproductores = {}
+        self.audios = []
+        self.cache_duraciones = DurationCache()
+        self.hilo_duraciones = None
 
     def set_audios(self, audios):
-        from os.path import basename, splitext
-        self.audios = audios  # Guardar la lista de rutas completas
-        self.tabla.setRowCount(len(audios))
-        for i, audio in enumerate(audios):
-            nombre = basename(audio)
-            tipo = splitext(audio)[1][1:].upper()
-            try:
-                duracion = AudioSegment.from_file(audio).duration_seconds
-                minutos = int(duracion // 60)
-                segundos = int(duracion % 60)
-                duracion_str = f"{minutos}:{segundos:02d} min"
-            except Exception:
-                duracion_str = "-"
-            self.tabla.setItem(i, 0, QTableWidgetItem(nombre))
-            self.tabla.setItem(i, 1, QTableWidgetItem(tipo))
-            self.tabla.setItem(i, 2, QTableWidgetItem(duracion_str))
-            reproductor = ReproductorAudio()
-            reproductor.set_audio(audio)
-            # Centrar el reproductor en la celda
-            cell_widget = QWidget()
-            cell_layout = QHBoxLayout()
-            cell_layout.setContentsMargins(0,0,0,0)
-            cell_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            cell_layout.addWidget(reproductor)
-            cell_widget.setLayout(cell_layout)
-            self.tabla.setCellWidget(i, 3, cell_widget)
-            self.reproductores[audio] = reproductor
-            self.tabla.setRowHeight(i, 44)
-        self.tabla.resizeColumnsToContents()
+        self.detener_duraciones()
+        self.pool_reproductores.cleanup()
+        self.audios = list(audios)  # Guardar la lista de rutas completas
+        self.modelo.set_audios(self.audios)
+        # Las duraciones se completan a medida que se obtienen, sin bloquear la interfaz
+        self.hilo_duraciones = DuracionesThread(self.audios, self.cache_duraciones, self)
+        self.hilo_duraciones.duracion.connect(self.mostrar_duracion)
+        self.hilo_duraciones.start()
+
+    def mostrar_duracion(self, fila, duracion_us):
+        if self.sender() is not self.hilo_duraciones:
+            return
+        self.modelo.set_duracion(fila, duracion_us)
+
+    def encolar_todos(self):
+        if self.audios and self.ventana_principal:
+            self.ventana_principal.encolar_audios(self.audios)
+
+    def ver_cola(self):
+        if self.ventana_principal:
+            self.ventana_principal.stacked.setCurrentWidget(self.ventana_principal.pantalla_cola)
+
+    def mostrar_error_reproduccion(self, ruta, mensaje):
+        QMessageBox.critical(self, "Error de reproducción", f"No se pudo reproducir {os.path.basename(ruta)}: {mensaje}")
+
+    def detener_duraciones(self):
+        if self.hilo_duraciones is not None:
+            self.hilo_duraciones.requestInterruption()
+            self.hilo_duraciones.wait()
+            self.hilo_duraciones = None
 
     def cleanup(self):
-        for reproductor in self.reproductores.values():
-            reproductor.cleanup()
-        self.reproductores.clear()
+        self.detener_duraciones()
+        self.pool_reproductores.cleanup()
 
     def abrir_audio(self, row, col):
-        if col == 3:
+        if col == COLUMNA_REPRODUCIR:
             return
         # Usar la ruta completa guardada en self.audios
         audio_path = self.audios[row]
         self.audio_seleccionado.emit(audio_path)
 
     def marcar_audio(self, row, col):
-        if col == 3:
+        if col == COLUMNA_REPRODUCIR:
             return
         self.tabla.selectRow(row)
         self.tabla.setFocus()
@@ -288,8 +727,8 @@ class PantallaCorreccionLexemas(QWidget):
         self.tabla.setHorizontalHeaderLabels(["¿Válido?", "Lexema", "Sugerencia", "Puntaje", "Token"])
         self.tabla.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self.tabla.horizontalHeader().setStretchLastSection(True)
-        import phunspell
-        dic_es = phunspell.Phunspell('es_PY')
+        from .modules.preprocessing.spell_checker import get_spell_checker
+        dic_es = get_spell_checker()
         # Opciones de token/categoría
         opciones_token = [
             "SALUDO",
@@ -431,7 +870,10 @@ class PantallaAnalisis(QWidget):
                 background-color: #357abd;
             }
         """)
-        self.btn_ver_resumen.clicked.connect(self.mostrar_resumen)
+        self.btn_ver_resumen.clicked.connect(lambda: self.mostrar_resumen())
+        self.btn_cancelar_resumen = QPushButton("Cancelar")
+        self.btn_cancelar_resumen.clicked.connect(self.cancelar_resumen)
+        self.btn_cancelar_resumen.hide()
         
         # Agregar widgets al layout
         layout.addWidget(self.titulo)
@@ -441,6 +883,7 @@ class PantallaAnalisis(QWidget):
         
         btns = QHBoxLayout()
         btns.addStretch()
+        btns.addWidget(self.btn_cancelar_resumen)
         btns.addWidget(self.btn_ver_resumen)
         layout.addLayout(btns)
         
@@ -450,14 +893,31 @@ class PantallaAnalisis(QWidget):
         self._resumen = ""
         self._protocolo = ""
         self.processing_thread = None
+        self.resumen_thread = None
+        self._hilos_anteriores = []
+        self._tokens = None
+        self._transcripcion = None
 
     def mostrar_analisis(self, audio_path=None, data=None):
         if audio_path:
+            self.cancelar_resumen()
             self.audio_path = audio_path
+            self._tokens = None
+            self._transcripcion = None
+            self.btn_ver_resumen.setEnabled(False)
             self.audio_label.setText(f"Audio: {os.path.basename(audio_path)}")
             self.reproductor.set_audio(os.path.abspath(audio_path))
-            self.processing_label.setText("Procesando audio...")
             self.text_chat.clear()
+            self._soltar_procesamiento()
+            if data and data.get("transcripcion") is not None:
+                # Llamada ya procesada (por ejemplo, desde la cola): no se vuelve a procesar
+                self._tokens = data.get("tokens")
+                self._transcripcion = data["transcripcion"]
+                self.processing_label.setText("")
+                self.mostrar_transcripcion(self._transcripcion)
+                self.btn_ver_resumen.setEnabled(True)
+                return
+            self.processing_label.setText("Procesando audio...")
             
             # Iniciar procesamiento en un hilo separado
             self.processing_thread = ProcesamientoThread(audio_path, self)
@@ -466,96 +926,124 @@ class PantallaAnalisis(QWidget):
             self.processing_thread.error.connect(self.mostrar_error)
             self.processing_thread.start()
 
+    def _soltar_procesamiento(self):
+        # Un procesamiento anterior que sigue corriendo se conserva hasta que
+        # termine (destruir un QThread activo cierra la aplicación), pero sus
+        # resultados se ignoran
+        hilo = self.processing_thread
+        self.processing_thread = None
+        if hilo is not None and hilo.isRunning():
+            for senal in (hilo.progreso, hilo.terminado, hilo.error):
+                senal.disconnect()
+            self._hilos_anteriores = [h for h in self._hilos_anteriores if h.isRunning()] + [hilo]
+
     def actualizar_progreso(self, val):
         self.processing_label.setText(f"Procesando... {val}%")
 
     def procesamiento_completado(self, audio_path):
         self.processing_label.setText("")
+        self.btn_ver_resumen.setEnabled(True)
         try:
-            output_dir = os.path.join("outputs", os.path.splitext(os.path.basename(audio_path))[0])
-            # Mostrar chat desde transcripcion_assembly.json
-            transcripcion_path = os.path.join(output_dir, "transcripcion_assembly.json")
-            with open(transcripcion_path, "r", encoding="utf-8") as f:
-                transcripcion = json.load(f)
-            utterances = transcripcion.get("utterances", [])
-            if utterances:
-                transcripcion_html = ""
-                for utt in utterances:
-                    speaker = "Agente" if utt.get("speaker") == "A" else "Cliente"
-                    texto = utt.get("text", "")
-                    transcripcion_html += f"<div style='margin-bottom: 8px;'><b>{speaker}:</b> {texto}</div>"
-                self.text_chat.setHtml(transcripcion_html)
-            else:
-                self.text_chat.setText("No hay transcripción disponible.")
-            # No generar ni mostrar el resumen ni el reporte aquí
-            self._resumen = ""
-            self._protocolo = ""
+            # Tokens y transcripción en memoria para el resumen
+            self._tokens = self.processing_thread.tokens
+            self._transcripcion = transcripcion = self.processing_thread.transcripcion
+            if transcripcion is None:
+                # Mostrar chat desde transcripcion_assembly.json
+                output_dir = os.path.join("outputs", os.path.splitext(os.path.basename(audio_path))[0])
+                transcripcion_path = os.path.join(output_dir, "transcripcion_assembly.json")
+                with open(transcripcion_path, "r", encoding="utf-8") as f:
+                    transcripcion = json.load(f)
+            self.mostrar_transcripcion(transcripcion)
         except Exception as e:
             self.text_chat.setText(f"Error al cargar el análisis: {str(e)}")
             self._resumen = "Error al cargar el análisis"
             self._protocolo = "Error al cargar el análisis"
 
+    def mostrar_transcripcion(self, transcripcion):
+        utterances = transcripcion.get("utterances", [])
+        if utterances:
+            transcripcion_html = ""
+            for utt in utterances:
+                speaker = "Agente" if utt.get("speaker") == "A" else "Cliente"
+                texto = utt.get("text", "")
+                transcripcion_html += f"<div style='margin-bottom: 8px;'><b>{speaker}:</b> {texto}</div>"
+            self.text_chat.setHtml(transcripcion_html)
+        else:
+            self.text_chat.setText("No hay transcripción disponible.")
+        # No generar ni mostrar el resumen ni el reporte aquí
+        self._resumen = ""
+        self._protocolo = ""
+
     def mostrar_error(self, msg):
         self.processing_label.setText("")
+        self.btn_ver_resumen.setEnabled(True)
         QMessageBox.critical(self, "Error", f"Error al procesar audio: {msg}")
 
-    def mostrar_resumen(self, force=False):
+    def mostrar_resumen(self, force=False, correcciones=None):
+        if self.resumen_thread is not None or not self.audio_path:
+            return
+        # El reporte se genera en segundo plano con los tokens ya calculados
+        self.resumen_thread = ResumenThread(self.audio_path, self._tokens, self._transcripcion, correcciones, force, self)
+        self.resumen_thread.progreso.connect(self.actualizar_progreso_resumen)
+        self.resumen_thread.correccion_requerida.connect(self.solicitar_correccion)
+        self.resumen_thread.terminado.connect(self.resumen_generado)
+        self.resumen_thread.error.connect(self.error_resumen)
+        self.resumen_thread.finished.connect(self.resumen_finalizado)
+        self.btn_ver_resumen.setEnabled(False)
+        self.btn_cancelar_resumen.show()
+        self.processing_label.setText("Generando resumen...")
+        self.resumen_thread.start()
+
+    def actualizar_progreso_resumen(self, val):
+        self.processing_label.setText(f"Generando resumen... {val}%")
+
+    def solicitar_correccion(self, palabras_no_validas):
+        hilo = self.sender()
+        # Conservar los tokens (y la transcripción) que el hilo haya calculado
+        self._tokens = hilo.tokens
+        self._transcripcion = hilo.transcripcion
         output_dir = os.path.join("outputs", os.path.splitext(os.path.basename(self.audio_path))[0])
         report_path = os.path.join(output_dir, "reporte.json")
-        transcripcion_path = os.path.join(output_dir, "transcripcion_assembly.json")
-        try:
-            # Leer la transcripción para obtener el texto original
-            with open(transcripcion_path, "r", encoding="utf-8") as f:
-                transcripcion = json.load(f)
-            texto = transcripcion.get("text", "")
-            utterances = transcripcion.get("utterances", [])
-            tokenizer = Tokenizer()
-            tokens = tokenizer.tokenize(texto, self)
-            palabras_no_validas = [t for t in tokens if not t["valido"]]
-            #print("DEBUG palabras_no_validas:", palabras_no_validas)
-            if palabras_no_validas and not force:
-                # Mostrar pantalla de corrección antes de cualquier análisis
-                self.ventana_principal.mostrar_correccion_lexemas(palabras_no_validas, tokens, transcripcion, report_path)
-                return
-            # Solo aquí se genera el reporte.json
-            sentiment_analyzer = SentimentAnalyzer(tokens)
-            sentiment_result = sentiment_analyzer.analyze()
-            protocol_analyzer = ProtocolAnalyzer(tokens, utterances)
-            protocol_result = protocol_analyzer.analyze()
-            report_generator = ReportGenerator(sentiment_result, protocol_result)
-            report_generator.generate_report(report_path)
-            with open(report_path, "r", encoding="utf-8") as f:
-                report = json.load(f)
-            self._resumen = f"""
-            <b>Sentimiento general:</b> {report['sentiment_analysis']['sentiment']} ({report['sentiment_analysis']['score']})<br>
-            <b>Palabras positivas:</b> {report['sentiment_analysis']['positive_words_count']}<br>
-            <b>Palabras negativas:</b> {report['sentiment_analysis']['negative_words_count']}<br>
-            """
-            if report['sentiment_analysis']['most_positive']['word']:
-                self._resumen += f"<b>Palabra más positiva:</b> {report['sentiment_analysis']['most_positive']['word']} ({report['sentiment_analysis']['most_positive']['score']})<br>"
-            if report['sentiment_analysis']['most_negative']['word']:
-                self._resumen += f"<b>Palabra más negativa:</b> {report['sentiment_analysis']['most_negative']['word']} ({report['sentiment_analysis']['most_negative']['score']})<br>"
-            # Protocolo
-            prohibited = report['protocol_analysis']['prohibited_words']
-            self._protocolo = f"""
-            <b>Fase de saludo:</b> {report['protocol_analysis']['greeting']['status']}<br>
-            <b>Identificación del cliente:</b> {report['protocol_analysis']['identification']['status']}<br>
-            """
-            if prohibited['status'] == 'OK' and prohibited['found'] == ["Ninguna detectada"]:
-                self._protocolo += f"<b>Uso de palabras prohibidas:</b> Ninguna detectada<br>"
-            else:
-                self._protocolo += f"<b>Uso de palabras prohibidas:</b> {prohibited['status']}<br>"
-                if prohibited['found'] and prohibited['found'] != ["Ninguna detectada"]:
-                    self._protocolo += f"<b>Palabras prohibidas encontradas:</b> {', '.join(prohibited['found'])}<br>"
-            self._protocolo += f"<b>Despedida amable:</b> {report['protocol_analysis']['farewell']['status']}<br>"
-            # Mostrar el resumen como pantalla
-            self.ventana_principal.mostrar_resumen(self._resumen, self._protocolo)
-        except Exception as e:
-            self._resumen = f"Error al cargar el análisis: {str(e)}"
-            self._protocolo = "Error al cargar el análisis"
-            self.ventana_principal.mostrar_resumen(self._resumen, self._protocolo)
+        self.ventana_principal.mostrar_correccion_lexemas(palabras_no_validas, self._tokens, self._transcripcion, report_path)
+
+    def resumen_generado(self, resumen, protocolo):
+        self._resumen = resumen
+        self._protocolo = protocolo
+        # Mostrar el resumen como pantalla
+        self.ventana_principal.mostrar_resumen(self._resumen, self._protocolo)
+
+    def error_resumen(self, msg):
+        self._resumen = f"Error al cargar el análisis: {msg}"
+        self._protocolo = "Error al cargar el análisis"
+        self.ventana_principal.mostrar_resumen(self._resumen, self._protocolo)
+
+    def resumen_finalizado(self):
+        if self.sender() is not self.resumen_thread:
+            return
+        hilo = self.resumen_thread
+        if hilo.tokens is not None:
+            self._tokens = hilo.tokens
+            self._transcripcion = hilo.transcripcion
+        self.resumen_thread = None
+        self.btn_cancelar_resumen.hide()
+        self.btn_ver_resumen.setEnabled(True)
+        self.processing_label.setText("")
+
+    def cancelar_resumen(self):
+        if self.resumen_thread is None:
+            return
+        hilo = self.resumen_thread
+        self.resumen_thread = None
+        hilo.requestInterruption()
+        # Los resultados de un hilo cancelado se ignoran
+        for senal in (hilo.correccion_requerida, hilo.terminado, hilo.error):
+            senal.disconnect()
+        self.btn_cancelar_resumen.hide()
+        self.btn_ver_resumen.setEnabled(self.processing_thread is None or not self.processing_thread.isRunning())
+        self.processing_label.setText("")
 
     def volver_lista(self):
+        self.cancelar_resumen()
         self.reproductor.cleanup()
         if self.ventana_principal:
             self.ventana_principal.stacked.setCurrentWidget(self.ventana_principal.pantalla_lista)
@@ -663,11 +1151,14 @@ class VentanaPrincipal(QWidget):
         self.pantalla_bienvenida = PantallaBienvenida()
         self.pantalla_lista = PantallaLista()
         self.pantalla_analisis = PantallaAnalisis()
+        self.pantalla_cola = PantallaCola()
         self.pantalla_analisis.ventana_principal = self
         self.pantalla_lista.ventana_principal = self
+        self.pantalla_cola.ventana_principal = self
         self.stacked.addWidget(self.pantalla_bienvenida)
         self.stacked.addWidget(self.pantalla_lista)
         self.stacked.addWidget(self.pantalla_analisis)
+        self.stacked.addWidget(self.pantalla_cola)
         layout = QVBoxLayout()
         layout.addWidget(self.stacked)
         self.setLayout(layout)
@@ -687,10 +1178,14 @@ class VentanaPrincipal(QWidget):
         self.pantalla_lista.set_audios(self.audios_procesados)
         self.stacked.setCurrentWidget(self.pantalla_lista)
 
-    def mostrar_analisis(self, audio_path):
-        self.pantalla_analisis.mostrar_analisis(audio_path)
+    def mostrar_analisis(self, audio_path, data=None):
+        self.pantalla_analisis.mostrar_analisis(audio_path, data)
         self.stacked.setCurrentWidget(self.pantalla_analisis)
 
+    def encolar_audios(self, audios):
+        self.pantalla_cola.encolar(audios)
+        self.stacked.setCurrentWidget(self.pantalla_cola)
+
     def mostrar_correccion_lexemas(self, palabras_no_validas, tokens, transcripcion, report_path):
         # Filtrar palabras no válidas para que solo haya lexemas únicos
         lexemas_vistos = set()
@@ -701,24 +1196,9 @@ class VentanaPrincipal(QWidget):
                 palabras_unicas.append(palabra)
                 lexemas_vistos.add(lex)
         def on_finish(correcciones):
-            tokenizer = Tokenizer()
-            for corr in correcciones:
-                tokenizer.dictionary[corr["lexema"]] = {
-                    "puntaje": corr["puntaje"],
-                    "token": corr["token"]
-                }
-            with open(tokenizer.dictionary_path, "w", encoding="utf-8") as f:
-                json.dump(tokenizer.dictionary, f, ensure_ascii=False, indent=2)
-            # Actualizar tokens
-            for token in tokens:
-                for corr in correcciones:
-                    if token["lexema"] == corr["original"]:
-                        token["lexema"] = corr["lexema"]
-                        token["valido"] = True
-                        token["sentiment"] = int(corr["puntaje"])
-                        token["token"] = str(corr["token"])
+            # Guardar las correcciones, actualizar los tokens y generar el reporte en segundo plano
             self.stacked.setCurrentWidget(self.pantalla_analisis)
-            self.pantalla_analisis.mostrar_resumen(force=True)
+            self.pantalla_analisis.mostrar_resumen(force=True, correcciones=correcciones)
         pantalla_correccion = PantallaCorreccionLexemas(palabras_unicas, on_finish, self)
         pantalla_correccion.setMinimumSize(600, 400)
         self.pantalla_correccion = pantalla_correccion
@@ -750,6 +1230,8 @@ def main():
     except Exception as e:
         print(f"No se pudo cargar el archivo de estilos: {e}")
     ventana = VentanaPrincipal()
+    app.aboutToQuit.connect(ventana.pantalla_lista.detener_duraciones)
+    app.aboutToQuit.connect(ventana.pantalla_cola.detener)
     ventana.show()
     sys.exit(app.exec())
 
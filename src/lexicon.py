@@ -0,0 +1,48 @@
+"""
+Administración de la tabla de símbolos y de su journal de cambios.
+
+Uso:
+    python -m src.lexicon stats
+    python -m src.lexicon set <lexema> <puntaje> <token>
+    python -m src.lexicon remove <lexema>
+    python -m src.lexicon compact
+"""
+import argparse
+import sys
+from typing import List
+
+from .modules.preprocessing.lexicon_store import LexiconStore
+
+DEFAULT_DICTIONARY_PATH = "diccionario/tabla_simbolos.json"
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Tabla de símbolos")
+    parser.add_argument("--diccionario", default=DEFAULT_DICTIONARY_PATH, help="Tabla de símbolos JSON")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("stats", help="Muestra la cantidad de lexemas y el tamaño del journal")
+    set_ = sub.add_parser("set", help="Agrega o modifica un lexema")
+    set_.add_argument("lexema")
+    set_.add_argument("puntaje", type=int)
+    set_.add_argument("token")
+    remove = sub.add_parser("remove", help="Elimina un lexema")
+    remove.add_argument("lexema")
+    sub.add_parser("compact", help="Vuelca el journal sobre la tabla JSON")
+    args = parser.parse_args(argv)
+
+    store = LexiconStore(args.diccionario)
+    if args.comando == "set":
+        store.apply({args.lexema.lower(): {"puntaje": args.puntaje, "token": args.token}})
+    elif args.comando == "remove":
+        store.apply({args.lexema.lower(): None})
+    elif args.comando == "compact":
+        store.compact()
+
+    stats = store.stats()
+    print(f"Lexemas: {len(store.read())}")
+    print(f"Tabla: {stats['json_bytes'] / 1024:.1f} KB | Journal: {stats['journal_bytes'] / 1024:.1f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
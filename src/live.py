@@ -0,0 +1,123 @@
+"""
+Monitoreo en vivo de una llamada: transcripción por streaming y alertas de
+protocolo y sentimiento mientras la llamada está en curso.
+
+El audio se envía en bloques al ritmo de reproducción. Como servicio de
+transcripción se puede usar AssemblyAI en tiempo real, un servidor local con
+el protocolo de utils/fake_streaming_server.py, o ese mismo servidor de
+prueba levantado en el proceso con una transcripción como guion.
+
+Uso:
+    python -m src.live --fake outputs/llamada/transcripcion_assembly.json [--velocidad 10]
+    python -m src.live audio/llamada.wav --servidor 127.0.0.1:8766
+    python -m src.live audio/llamada.wav --assemblyai
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from typing import List
+
+from .modules.analysis.live_monitor import LiveMonitor
+from .modules.preprocessing.streaming import (
+    FINAL, CHUNK_MS, SocketStreamingTranscriber, AssemblyAIStreamingTranscriber, iter_audio_chunks, silence_chunks
+)
+
+
+def _ms(ms: int) -> str:
+    segundos = int(ms) // 1000
+    return f"{segundos // 60:02d}:{segundos % 60:02d}"
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Monitoreo en vivo de una llamada")
+    parser.add_argument("audio", nargs="?", default=None, help="Audio a transmitir (con --fake es opcional)")
+    origen = parser.add_mutually_exclusive_group(required=True)
+    origen.add_argument("--servidor", default=None, help="Servidor de transcripción en vivo HOST:PUERTO")
+    origen.add_argument("--fake", default=None, metavar="TRANSCRIPCION",
+                        help="Levanta el servidor de prueba con esta transcripción como guion")
+    origen.add_argument("--assemblyai", action="store_true", help="Usa la transcripción en tiempo real de AssemblyAI")
+    parser.add_argument("--velocidad", type=float, default=1.0, help="Factor de velocidad de reproducción")
+    parser.add_argument("--identificacion-s", type=float, default=60, help="Plazo para pedir la identificación")
+    parser.add_argument("--ventana-s", type=float, default=30, help="Ventana de sentimiento en segundos")
+    parser.add_argument("--umbral", type=int, default=-5, help="Puntaje de la ventana que dispara la alerta")
+    parser.add_argument("--reglas", default=None, help="Reglas de protocolo de la campaña")
+    parser.add_argument("--diccionario", default=None, help="Tabla de símbolos")
+    parser.add_argument("--parciales", action="store_true", help="Mostrar también los eventos parciales")
+    parser.add_argument("--salida", default=None, help="Guardar el resultado del monitoreo en JSON")
+    args = parser.parse_args(argv)
+
+    if args.audio is None and not args.fake:
+        parser.error("Falta el audio a transmitir")
+
+    servidor = None
+    if args.fake:
+        from .utils.fake_streaming_server import FakeStreamingServer
+        with open(args.fake, "r", encoding="utf-8") as f:
+            servidor = FakeStreamingServer(transcripcion=json.load(f)).start()
+        host, port = servidor.server_address[:2]
+        transcriber = SocketStreamingTranscriber(host, port)
+    elif args.servidor:
+        host, _, port = args.servidor.rpartition(":")
+        transcriber = SocketStreamingTranscriber(host or "127.0.0.1", int(port))
+    else:
+        transcriber = AssemblyAIStreamingTranscriber()
+
+    if args.audio:
+        chunks = iter_audio_chunks(args.audio, velocidad=args.velocidad)
+    else:
+        # Sin audio: silencio con la duración del guion
+        chunks = silence_chunks(servidor.duracion_ms + CHUNK_MS, velocidad=args.velocidad)
+
+    monitor = LiveMonitor(args.diccionario, args.reglas, int(args.identificacion_s * 1000),
+                          int(args.ventana_s * 1000), args.umbral)
+    lock = threading.Lock()
+    inicio = time.monotonic()
+    terminado = threading.Event()
+
+    def mostrar(alertas):
+        for alerta in alertas:
+            print(f"[{_ms(alerta['ts_ms'])}] ALERTA {alerta['tipo']}: {alerta['detalle']}")
+
+    def reloj():
+        # Los plazos corren aunque no lleguen eventos (silencio en la llamada)
+        while not terminado.wait(0.5):
+            with lock:
+                mostrar(monitor.tick(int((time.monotonic() - inicio) * 1000 * args.velocidad)))
+
+    threading.Thread(target=reloj, daemon=True).start()
+    latencias = []
+    try:
+        for evento in transcriber.stream(chunks):
+            t0 = time.perf_counter()
+            with lock:
+                alertas = monitor.feed(evento)
+            latencias.append(time.perf_counter() - t0)
+            if evento["tipo"] == FINAL or args.parciales:
+                marca = "" if evento["tipo"] == FINAL else "… "
+                print(f"[{_ms(evento['end'])}] {evento.get('speaker') or '-'}: {marca}{evento['text']}")
+            mostrar(alertas)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        terminado.set()
+        if servidor is not None:
+            servidor.shutdown()
+
+    resultado = monitor.result()
+    print("\nFases:", ", ".join(f"{fase} {'OK' if ts is not None else 'Faltante'}"
+                                for fase, ts in resultado["fases"].items()))
+    print(f"Palabras prohibidas: {', '.join(resultado['palabras_prohibidas']) or 'Ninguna detectada'}")
+    print(f"Alertas: {len(resultado['alertas'])} | Eventos: {len(latencias)}")
+    if latencias:
+        print(f"Procesamiento por evento: promedio {sum(latencias) / len(latencias) * 1000:.2f} ms, "
+              f"máximo {max(latencias) * 1000:.2f} ms")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import os
+import re
+from typing import Dict, Any, List, Optional
+
+from .protocol_matcher import normalizar
+from .protocol_rules import load_rules
+from .sentiment_analyzer import SentimentWindow
+from ..preprocessing.lexicon import load_lexicon
+from ..preprocessing.streaming import FINAL
+
+DEFAULT_DICTIONARY_PATH = os.path.join("diccionario", "tabla_simbolos.json")
+
+# Mismo criterio de palabra que el tokenizador
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Tipos de alerta
+PALABRA_PROHIBIDA = "palabra_prohibida"
+IDENTIFICACION_FALTANTE = "identificacion_faltante"
+SENTIMIENTO_NEGATIVO = "sentimiento_negativo"
+
+
+class LiveMonitor:
+    def __init__(self, dictionary_path: str = None, rules_path: str = None, identificacion_ms: int = 60000,
+                 window_ms: int = 30000, umbral_negativo: int = -5, agent_speaker: str = "A"):
+        """
+        Monitoreo de protocolo y sentimiento de una llamada en curso.
+
+        Recibe los eventos parciales y finales de la transcripción en vivo
+        (ver preprocessing/streaming.py) y genera alertas:
+
+        - palabra_prohibida: apenas aparece en un parcial.
+        - identificacion_faltante: si el agente no pidió la identificación
+          del cliente pasados identificacion_ms de llamada.
+        - sentimiento_negativo: cuando el puntaje de la ventana deslizante
+          de window_ms baja a umbral_negativo o menos (una vez por episodio).
+
+        Cada evento procesa solo las palabras nuevas, por lo que el costo no
+        depende del largo de la llamada.
+
+        Args:
+            dictionary_path: Tabla de símbolos. Si es None, usa la tabla por defecto.
+            rules_path: Reglas de protocolo. Si es None, usa las reglas por defecto.
+            identificacion_ms: Plazo para pedir la identificación del cliente.
+            window_ms: Duración de la ventana de sentimiento.
+            umbral_negativo: Puntaje de la ventana que dispara la alerta.
+            agent_speaker: Etiqueta del agente. Los eventos sin hablante
+                (transcripción sin diarización) se consideran del agente
+                para las fases del protocolo.
+        """
+        self.dictionary_path = dictionary_path or DEFAULT_DICTIONARY_PATH
+        self.rules = load_rules(rules_path)
+        self.identificacion_ms = identificacion_ms
+        self.umbral_negativo = umbral_negativo
+        self.agent_speaker = agent_speaker
+        self.ventana = SentimentWindow(window_ms)
+        self.fases: Dict[str, Optional[int]] = {"saludo": None, "identificacion": None}
+        self.palabras_prohibidas: List[str] = []
+        self.alertas: List[Dict[str, Any]] = []
+        self.ahora_ms = 0
+        self._utterances = 0
+        self._agente_finales = 0
+        self._ultima_despedida = None
+        self._procesadas = 0
+        self._identificacion_alertada = False
+        self._negativo_alertado = False
+
+    def _alerta(self, tipo: str, ts_ms: int, detalle: str, speaker: str = None) -> Dict[str, Any]:
+        alerta = {"tipo": tipo, "ts_ms": ts_ms, "detalle": detalle, "speaker": speaker}
+        self.alertas.append(alerta)
+        return alerta
+
+    def feed(self, evento: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Procesa un evento de la transcripción en vivo.
+
+        Args:
+            evento: {"tipo": "parcial" | "final", "text", "speaker", "start", "end"}.
+                El texto de los parciales es acumulativo dentro de cada intervención.
+
+        Returns:
+            Alertas nuevas.
+        """
+        nuevas = []
+        final = evento.get("tipo") == FINAL
+        texto = evento.get("text") or ""
+        speaker = evento.get("speaker")
+        inicio = int(evento.get("start") or 0)
+        fin = int(evento.get("end") or inicio)
+        lookup = load_lexicon(self.dictionary_path).lookup
+
+        # La última palabra de un parcial puede estar incompleta: se procesa con el siguiente evento
+        palabras = [m.group().lower() for m in _WORD_RE.finditer(texto)]
+        hasta = len(palabras) if final else max(len(palabras) - 1, 0)
+        paso = (fin - inicio) / max(len(palabras), 1)
+        for i in range(self._procesadas, hasta):
+            entrada = lookup(palabras[i])
+            if entrada is None:
+                continue
+            puntaje, token = entrada
+            ts = int(inicio + paso * (i + 1))
+            if token == "PALABRA_PROHIBIDA":
+                self.palabras_prohibidas.append(palabras[i])
+                nuevas.append(self._alerta(PALABRA_PROHIBIDA, ts, palabras[i], speaker))
+            if puntaje:
+                self.ventana.update({"sentiment": puntaje}, max(ts, self.ahora_ms))
+        self._procesadas = max(self._procesadas, hasta)
+
+        agente = speaker in (self.agent_speaker, None)
+        if agente:
+            texto_norm = normalizar(texto)
+            search = self.rules.matcher.search
+            for fase in ("saludo", "identificacion"):
+                if self.fases[fase] is None and search(fase, texto_norm):
+                    self.fases[fase] = fin
+            if search("despedida", texto_norm):
+                self._ultima_despedida = (self._agente_finales, fin)
+
+        nuevas.extend(self.tick(fin))
+        if final:
+            self._utterances += 1
+            self._procesadas = 0
+            if agente:
+                self._agente_finales += 1
+        return nuevas
+
+    def tick(self, now_ms: int) -> List[Dict[str, Any]]:
+        """
+        Avanza el reloj de la llamada y revisa los plazos y la ventana de sentimiento.
+
+        Args:
+            now_ms: Instante actual de la llamada en milisegundos.
+
+        Returns:
+            Alertas nuevas.
+        """
+        nuevas = []
+        self.ahora_ms = max(self.ahora_ms, now_ms)
+        self.ventana.advance(self.ahora_ms)
+        if (self.fases["identificacion"] is None and not self._identificacion_alertada
+                and self.ahora_ms >= self.identificacion_ms):
+            self._identificacion_alertada = True
+            nuevas.append(self._alerta(IDENTIFICACION_FALTANTE, self.ahora_ms,
+                                       f"Sin identificación del cliente a los {self.identificacion_ms // 1000} s"))
+        if self.ventana.score <= self.umbral_negativo:
+            if not self._negativo_alertado:
+                self._negativo_alertado = True
+                nuevas.append(self._alerta(SENTIMIENTO_NEGATIVO, self.ahora_ms,
+                                           f"Puntaje {self.ventana.score} en los últimos {self.ventana.window_ms // 1000} s"))
+        else:
+            self._negativo_alertado = False
+        return nuevas
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Estado actual del monitoreo.
+
+        Returns:
+            Fases detectadas (con el instante en milisegundos, o None),
+            palabras prohibidas, sentimiento de la ventana y alertas.
+        """
+        fases = dict(self.fases, despedida=None)
+        # Como en ProtocolAnalyzer, la despedida cuenta solo en las dos últimas intervenciones del agente
+        if self._ultima_despedida is not None and self._ultima_despedida[0] >= self._agente_finales - 2:
+            fases["despedida"] = self._ultima_despedida[1]
+        return {
+            "fases": fases,
+            "palabras_prohibidas": list(self.palabras_prohibidas),
+            "sentimiento_ventana": self.ventana.result(),
+            "utterances": self._utterances,
+            "alertas": list(self.alertas)
+        }
@@ -1,58 +1,49 @@
-from typing import Dict, Any, List
-import re
-import unicodedata
+from typing import Dict, Any, Iterable, List
+from .protocol_matcher import normalizar
+from .protocol_rules import load_rules
 
 class ProtocolAnalyzer:
-    def __init__(self, tokens: List[Dict[str, Any]], utterances: List[Dict[str, Any]]):
+    def __init__(self, tokens: Iterable[Dict[str, Any]], utterances: List[Dict[str, Any]], rules_path: str = None):
         """
         Inicializa el analizador de protocolo.
         
         Args:
-            tokens: Lista de tokens del texto.
+            tokens: Tokens del texto. Puede ser una lista o un iterador
+                (p. ej. Tokenizer.iter_tokens); se recorre una sola vez.
             utterances: Lista de utterances con información de hablantes.
+            rules_path: Archivo de reglas de protocolo de la campaña. Si es None,
+                usa diccionario/protocolos/default.json.
         """
         self.tokens = tokens
         self.utterances = utterances
         
-        # Frases/patrones clave para cada fase
-        self.saludo_frases = [
-            r"buen[oa]s? (d[ií]as|tardes|noches)",
-            r"hola",
-            r"bienvenido[ae]?"
-        ]
-        self.identificacion_frases = [
-            r"con qui[eé]n tengo el gusto",
-            r"me puede indicar su nombre",
-            r"podr[ií]a confirmarme su n[uú]mero de documento",
-            r"me indica su n[uú]mero de cliente",
-            r"para verificar sus datos",
-            r"me podr[ií]a facilitar su identificaci[oó]n",
-            r"me podr[ií]a decir su nombre"
-        ]
-        self.despedida_frases = [
-            r"gracias por comunicarse",
-            r"gracias por contactarnos",
-            r"gracias por su preferencia",
-            r"que tenga (un|una)? (buen[oa]?|excelente|gran) (d[ií]a|tarde|noche)",
-            r"algo m[aá]s en lo que le pueda (ayudar|asistir)",
-            r"fue un placer atenderle",
-            r"le deseo (un|una)? (excelente|buen[oa]?|gran) (d[ií]a|tarde|noche)",
-            r"hasta luego"
-        ]
+        # Frases/patrones clave para cada fase, compiladas una sola vez por
+        # contenido del archivo de reglas (ver protocol_rules.load_rules)
+        self.rules = load_rules(rules_path)
+        self.saludo_frases = self.rules.fases["saludo"]
+        self.identificacion_frases = self.rules.fases["identificacion"]
+        self.despedida_frases = self.rules.fases["despedida"]
+        self.matcher = self.rules.matcher
 
     def _normalizar(self, texto):
         # Quitar tildes y pasar a minúsculas
-        texto = texto.lower()
-        texto = unicodedata.normalize('NFD', texto)
-        texto = ''.join(c for c in texto if unicodedata.category(c) != 'Mn')
-        return texto
+        return normalizar(texto)
 
-    def _buscar_frases(self, frases, texto):
-        texto_norm = self._normalizar(texto)
-        for patron in frases:
-            if re.search(patron, texto_norm):
-                return True
-        return False
+    def find_matches(self) -> List[Dict[str, Any]]:
+        """
+        Busca todas las frases de protocolo en las intervenciones del agente.
+        
+        Returns:
+            Lista con el índice de la intervención y cada coincidencia
+            (fase, frase y posiciones sobre el texto normalizado).
+        """
+        resultado = []
+        for i, u in enumerate(self.utterances):
+            if u.get("speaker") != "A":
+                continue
+            for c in self.matcher.match(u["text"]):
+                resultado.append({"utterance": i, **c._asdict()})
+        return resultado
 
     def analyze(self) -> Dict[str, Any]:
         """
@@ -61,12 +52,13 @@ class ProtocolAnalyzer:
         Returns:
             Diccionario con el análisis del protocolo.
         """
-        # Obtener utterances del agente
-        agent_utterances = [u for u in self.utterances if u.get("speaker") == "A"]
-        saludo = any(self._buscar_frases(self.saludo_frases, u["text"]) for u in agent_utterances)
-        identificacion = any(self._buscar_frases(self.identificacion_frases, u["text"]) for u in agent_utterances)
+        # Obtener utterances del agente, normalizadas una sola vez
+        agent_texts = [self._normalizar(u["text"]) for u in self.utterances if u.get("speaker") == "A"]
+        search = self.matcher.search
+        saludo = any(search("saludo", t) for t in agent_texts)
+        identificacion = any(search("identificacion", t) for t in agent_texts)
         # Despedida amable: solo en los últimos 2 utterances del agente
-        despedida = any(self._buscar_frases(self.despedida_frases, u["text"]) for u in agent_utterances[-2:])
+        despedida = any(search("despedida", t) for t in agent_texts[-2:])
         # Palabras prohibidas: sigue usando tokens
         palabras_prohibidas = [t["lexema"] for t in self.tokens if t.get("token") == "PALABRA_PROHIBIDA"]
         return {
@@ -78,16 +70,21 @@ class ProtocolAnalyzer:
                 "status": "OK" if identificacion else "Faltante",
                 "found": identificacion
             },
-            "palabras_prohibidas": {
-                "status": "OK" if not palabras_prohibidas else "Detectadas",
-                "found": palabras_prohibidas if palabras_prohibidas else ["Ninguna detectada"]
-            },
+            "palabras_prohibidas": self.prohibited_words_result(palabras_prohibidas),
             "despedida": {
                 "status": "OK" if despedida else "Faltante",
                 "found": despedida
             }
         }
         
+    @staticmethod
+    def prohibited_words_result(palabras_prohibidas: List[str]) -> Dict[str, Any]:
+        """Arma el resultado de la fase de palabras prohibidas a partir de las palabras detectadas."""
+        return {
+            "status": "OK" if not palabras_prohibidas else "Detectadas",
+            "found": palabras_prohibidas if palabras_prohibidas else ["Ninguna detectada"]
+        }
+
     def _check_greeting(self, tokens: List[Dict[str, Any]]) -> bool:
         """Verifica si hay un saludo en los primeros tokens."""
         if not tokens:
@@ -0,0 +1,91 @@
+import re
+import unicodedata
+from typing import Dict, List, NamedTuple, Sequence
+
+
+class Coincidencia(NamedTuple):
+    """Frase de protocolo encontrada en un texto."""
+    fase: str
+    indice: int
+    patron: str
+    texto: str
+    inicio: int
+    fin: int
+
+
+def normalizar(texto: str) -> str:
+    """
+    Quita tildes y pasa a minúsculas.
+
+    Args:
+        texto: Texto a normalizar.
+
+    Returns:
+        Texto normalizado.
+    """
+    texto = texto.lower()
+    texto = unicodedata.normalize('NFD', texto)
+    return ''.join(c for c in texto if unicodedata.category(c) != 'Mn')
+
+
+class ProtocolMatcher:
+    def __init__(self, fases: Dict[str, Sequence[str]]):
+        """
+        Compila las frases de cada fase del protocolo en una única expresión
+        regular por fase (una alternativa con un grupo con nombre por frase).
+
+        Args:
+            fases: Diccionario fase -> lista de patrones (sobre texto normalizado).
+        """
+        self.fases = {fase: tuple(patrones) for fase, patrones in fases.items()}
+        self._regex = {}
+        self._grupos = {}
+        for fase, patrones in self.fases.items():
+            alternativas = "|".join(f"(?P<_frase{i}>{patron})" for i, patron in enumerate(patrones))
+            regex = re.compile(alternativas) if patrones else None
+            self._regex[fase] = regex
+            if regex is not None:
+                self._grupos[fase] = [regex.groupindex[f"_frase{i}"] for i in range(len(patrones))]
+
+    def _coincidencia(self, fase: str, m) -> Coincidencia:
+        # Índice de la frase (grupo de primer nivel) que produjo la coincidencia
+        indice = next(i for i, g in enumerate(self._grupos[fase]) if m.start(g) != -1)
+        return Coincidencia(fase, indice, self.fases[fase][indice], m.group(), m.start(), m.end())
+
+    def search(self, fase: str, texto_norm: str):
+        """
+        Busca la primera frase de una fase en un texto ya normalizado.
+
+        Args:
+            fase: Nombre de la fase.
+            texto_norm: Texto normalizado con normalizar().
+
+        Returns:
+            Coincidencia encontrada, o None.
+        """
+        regex = self._regex[fase]
+        if regex is None:
+            return None
+        m = regex.search(texto_norm)
+        return self._coincidencia(fase, m) if m else None
+
+    def match(self, texto: str, fases: Sequence[str] = None) -> List[Coincidencia]:
+        """
+        Normaliza el texto una sola vez y busca todas las frases de las fases indicadas.
+
+        Args:
+            texto: Texto original.
+            fases: Fases a buscar. Si es None, busca todas.
+
+        Returns:
+            Lista de coincidencias con fase, frase y posiciones (sobre el texto normalizado).
+        """
+        texto_norm = normalizar(texto)
+        resultado = []
+        for fase in fases or self.fases:
+            regex = self._regex[fase]
+            if regex is None:
+                continue
+            resultado.extend(self._coincidencia(fase, m) for m in regex.finditer(texto_norm))
+        return resultado
+
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Tuple
+
+from .protocol_matcher import ProtocolMatcher
+
+DEFAULT_RULES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../diccionario/protocolos/default.json"))
+
+FASES_REQUERIDAS = ("saludo", "identificacion", "despedida")
+
+# Reglas cargadas por ruta: (mtime_ns, tamaño) -> reglas
+_por_ruta: Dict[str, Tuple[Tuple[int, int], "ProtocolRules"]] = {}
+
+# Referencia a un grupo anterior (\1, \g<1>), sin contar las barras escapadas
+_REFERENCIA = re.compile(r"(?<!\\)(?:\\\\)*\\(?:[1-9]|g<)")
+
+
+class ProtocolRules:
+    def __init__(self, path: str, version, campania: str, fases: Dict[str, List[str]], content_hash: str,
+                 matcher: ProtocolMatcher):
+        """
+        Catálogo de reglas de protocolo de una campaña.
+
+        Args:
+            path: Archivo de origen.
+            version: Versión declarada en el archivo.
+            campania: Nombre de la campaña.
+            fases: Diccionario fase -> lista de patrones.
+            content_hash: Hash SHA-256 del contenido del archivo.
+            matcher: Matcher compilado de las fases.
+        """
+        self.path = path
+        self.version = version
+        self.campania = campania
+        self.fases = fases
+        self.content_hash = content_hash
+        self.matcher = matcher
+
+
+def _parse(path: str, contenido: bytes, content_hash: str) -> ProtocolRules:
+    try:
+        data = json.loads(contenido.decode("utf-8"))
+    except ValueError as e:
+        raise ValueError(f"Archivo de reglas inválido {path}: {e}")
+    fases = data.get("fases")
+    if not isinstance(fases, dict):
+        raise ValueError(f"Archivo de reglas inválido {path}: falta el objeto 'fases'")
+    # Las fases requeridas y las adicionales de la campaña
+    for fase in dict.fromkeys((*FASES_REQUERIDAS, *fases)):
+        patrones = fases.get(fase)
+        if not isinstance(patrones, list) or not all(isinstance(p, str) for p in patrones):
+            raise ValueError(f"Archivo de reglas inválido {path}: la fase '{fase}' debe ser una lista de patrones")
+        for patron in patrones:
+            try:
+                compilado = re.compile(patron)
+            except re.error as e:
+                raise ValueError(f"Patrón inválido en {path} (fase '{fase}'): {patron!r}: {e}")
+            # Cada patrón se combina con los demás en una sola expresión por fase:
+            # los grupos con nombre y las referencias a grupos dejarían de ser válidos
+            if compilado.groupindex or _REFERENCIA.search(patron):
+                raise ValueError(f"Patrón inválido en {path} (fase '{fase}'): {patron!r}: "
+                                 "no se admiten grupos con nombre ni referencias a grupos")
+
+    try:
+        matcher = ProtocolMatcher(fases)
+    except re.error as e:
+        raise ValueError(f"Archivo de reglas inválido {path}: {e}")
+    return ProtocolRules(path, data.get("version"), data.get("campania", ""), fases, content_hash, matcher)
+
+
+def load_rules(path: str = None) -> ProtocolRules:
+    """
+    Carga un catálogo de reglas de protocolo.
+
+    Las reglas se compilan una sola vez por versión del archivo; si cambia
+    la fecha de modificación pero no el contenido (hash), se reutilizan.
+    Cada llamada verifica la fecha de modificación del archivo, de modo que
+    un proceso de larga duración toma los cambios sin reiniciarse. Si el
+    archivo modificado es inválido, se siguen usando las últimas reglas
+    válidas.
+
+    Args:
+        path: Ruta al archivo de reglas. Si es None, usa las reglas por defecto.
+
+    Returns:
+        Reglas de protocolo.
+
+    Raises:
+        ValueError: Si el archivo es inválido y no hay reglas previas cargadas.
+    """
+    path = os.path.abspath(path or DEFAULT_RULES_PATH)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _por_ruta.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        contenido = f.read()
+    content_hash = hashlib.sha256(contenido).hexdigest()
+    if cached and cached[1].content_hash == content_hash:
+        _por_ruta[path] = (stamp, cached[1])
+        return cached[1]
+
+    try:
+        rules = _parse(path, contenido, content_hash)
+    except ValueError as e:
+        if cached is None:
+            raise
+        print(f"{e}. Se mantienen las reglas anteriores.")
+        _por_ruta[path] = (stamp, cached[1])
+        return cached[1]
+    if cached:
+        print(f"Reglas de protocolo recargadas: {path} (versión {rules.version})")
+    _por_ruta[path] = (stamp, rules)
+    return rules
@@ -0,0 +1,156 @@
+import json
+import os
+from typing import Dict, Any, Iterable, List, Tuple
+
+from .protocol_analyzer import ProtocolAnalyzer
+from .sentiment_analyzer import SentimentAccumulator, UtteranceSentimentAnalyzer
+from ..preprocessing.lexicon import load_lexicon
+from ..preprocessing.tokenizer import Token, TokenColumns
+
+TOKENS_NAME = "tokens.json"
+REPORT_NAME = "reporte.json"
+DEFAULT_DICTIONARY_PATH = os.path.join("diccionario", "tabla_simbolos.json")
+
+_FORMAT_VERSION = 1
+
+
+def register_call(corpus_index, call_dir: str, tokens: Iterable[Dict[str, Any]] = None, columnas: TokenColumns = None,
+                  utterances: List[Dict[str, Any]] = None):
+    """
+    Guarda los tokens de una llamada (tokens.json) y registra en el índice
+    del corpus de qué lexemas depende su reporte.
+
+    Args:
+        corpus_index: Índice del corpus (CorpusIndex).
+        call_dir: Directorio de la llamada dentro de outputs/.
+        tokens: Tokens del texto completo (diccionarios o Token).
+        columnas: Tokens por intervención (Tokenizer.tokenize_utterances), en
+            lugar de tokens.
+        utterances: Intervenciones de la transcripción (requeridas con columnas).
+    """
+    datos: Dict[str, Any] = {"version": _FORMAT_VERSION}
+    if columnas is not None:
+        lexemas = columnas.lexemas
+        valores = zip(columnas.sentiment, (columnas.token_names[i] for i in columnas.token_ids))
+        datos["utterance"] = columnas.utterance.tolist()
+        datos["utterances"] = [
+            {"speaker": u.get("speaker"), "start": u.get("start"), "end": u.get("end")} for u in utterances or []
+        ]
+    else:
+        tokens = list(tokens or [])
+        lexemas = [t["lexema"] for t in tokens]
+        valores = ((t["sentiment"], t["token"]) for t in tokens)
+    datos["lexemas"] = lexemas
+    dependencias = dict(zip(lexemas, valores))
+
+    os.makedirs(call_dir, exist_ok=True)
+    path = os.path.join(call_dir, TOKENS_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    corpus_index.set_dependencies(os.path.basename(os.path.normpath(call_dir)), dependencias)
+
+
+class Reanalyzer:
+    def __init__(self, corpus_index, dictionary_path: str = None, output_dir: str = "outputs"):
+        """
+        Reanálisis incremental de los reportes afectados por cambios en la
+        tabla de símbolos.
+
+        Usa las dependencias registradas con register_call para encontrar
+        las llamadas cuyo análisis usó lexemas que cambiaron, y las recalcula
+        a partir de sus tokens guardados, sin volver a transcribir ni a
+        tokenizar. Las fases de saludo, identificación y despedida no
+        dependen de la tabla y se conservan.
+
+        Args:
+            corpus_index: Índice del corpus (CorpusIndex).
+            dictionary_path: Tabla de símbolos. Si es None, usa la tabla por defecto.
+            output_dir: Directorio de salidas.
+        """
+        self.corpus_index = corpus_index
+        self.dictionary_path = dictionary_path or DEFAULT_DICTIONARY_PATH
+        self.output_dir = output_dir
+
+    def stale_calls(self) -> List[str]:
+        """Devuelve las llamadas cuyo reporte quedó desactualizado."""
+        return self.corpus_index.stale_calls(load_lexicon(self.dictionary_path).lookup)
+
+    def reanalyze_call(self, nombre: str) -> Dict[str, Any]:
+        """
+        Recalcula el reporte de una llamada con la tabla de símbolos actual.
+
+        Args:
+            nombre: Nombre de la llamada.
+
+        Returns:
+            Reporte actualizado.
+
+        Raises:
+            OSError: Si faltan los tokens o el reporte de la llamada.
+        """
+        from ..reporting.report_generator import ReportGenerator
+
+        call_dir = os.path.join(self.output_dir, nombre)
+        with open(os.path.join(call_dir, TOKENS_NAME), "r", encoding="utf-8") as f:
+            datos = json.load(f)
+        report_path = os.path.join(call_dir, REPORT_NAME)
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+
+        lookup = load_lexicon(self.dictionary_path).lookup
+        entradas: Dict[str, Tuple[int, str]] = {}
+        for lexema in datos["lexemas"]:
+            if lexema not in entradas:
+                entradas[lexema] = lookup(lexema) or (0, "OTRO")
+
+        speaker_result = None
+        if "utterance" in datos and report.get("speaker_analysis"):
+            utterances = datos["utterances"]
+            columnas = TokenColumns([u.get("speaker") or "" for u in utterances])
+            for lexema, u in zip(datos["lexemas"], datos["utterance"]):
+                puntaje, token = entradas[lexema]
+                columnas.append(u, Token(lexema, True, puntaje, token, (), 0, 0))
+            speaker_result = UtteranceSentimentAnalyzer(columnas, utterances).analyze()
+            sentiment_result = speaker_result["general"]
+        else:
+            acumulador = SentimentAccumulator()
+            for lexema in datos["lexemas"]:
+                acumulador.add(lexema, entradas[lexema][0])
+            sentiment_result = acumulador.result()
+
+        prohibidas = [lexema for lexema in datos["lexemas"] if entradas[lexema][1] == "PALABRA_PROHIBIDA"]
+        protocolo = report["protocol_analysis"]
+        protocol_result = {
+            "saludo": protocolo["greeting"],
+            "identificacion": protocolo["identification"],
+            "palabras_prohibidas": ProtocolAnalyzer.prohibited_words_result(prohibidas),
+            "despedida": protocolo["farewell"]
+        }
+        nuevo = ReportGenerator(sentiment_result, protocol_result, speaker_result, self.corpus_index,
+                                report.get("metadata")).generate_report(report_path)
+        self.corpus_index.set_dependencies(nombre, entradas)
+        return nuevo
+
+    def run(self, nombres: List[str] = None) -> Dict[str, Any]:
+        """
+        Reanaliza las llamadas desactualizadas.
+
+        Args:
+            nombres: Llamadas a reanalizar. Si es None, se usan las de stale_calls().
+
+        Returns:
+            Llamadas reanalizadas y errores.
+        """
+        if nombres is None:
+            nombres = self.stale_calls()
+        reanalizadas = []
+        errores = []
+        for nombre in nombres:
+            try:
+                self.reanalyze_call(nombre)
+                reanalizadas.append(nombre)
+            except (OSError, ValueError, KeyError) as e:
+                errores.append({"llamada": nombre, "error": str(e)})
+        return {"reanalizadas": reanalizadas, "errores": errores}
@@ -1,51 +1,239 @@
-from typing import Dict, Any, List
-from collections import Counter
+from typing import Dict, Any, Iterable, List, Optional
+from collections import Counter, deque
+
+
+def clasificar(score: int) -> str:
+    """
+    Clasifica una puntuación de sentimiento.
+
+    Args:
+        score: Puntuación total.
+
+    Returns:
+        "Positivo", "Negativo" o "Neutral".
+    """
+    if score > 0:
+        return "Positivo"
+    elif score < 0:
+        return "Negativo"
+    return "Neutral"
+
+
+class SentimentAccumulator:
+    def __init__(self):
+        """
+        Acumulador de sentimiento de una sola pasada.
+
+        Se alimenta token a token con update() y produce con result() el mismo
+        diccionario que SentimentAnalyzer.analyze. Los resultados parciales de
+        fragmentos procesados por separado se combinan con merge().
+        """
+        self.score = 0
+        self.positive_count = 0
+        self.negative_count = 0
+        # (palabra, puntaje) de la palabra más positiva/negativa; ante empates
+        # se conserva la primera aparición
+        self.most_positive: Optional[tuple] = None
+        self.most_negative: Optional[tuple] = None
+
+    def update(self, token: Dict[str, Any]):
+        """
+        Agrega un token.
+
+        Args:
+            token: Token con "lexema" y "sentiment" (diccionario o Token).
+        """
+        self.add(token["lexema"], token["sentiment"])
+
+    def add(self, lexema: str, score: int):
+        """Agrega una palabra con su puntaje (equivalente a update sin armar el token)."""
+        if score > 0:
+            self.positive_count += 1
+            if self.most_positive is None or score > self.most_positive[1]:
+                self.most_positive = (lexema, score)
+        elif score < 0:
+            self.negative_count += 1
+            if self.most_negative is None or score < self.most_negative[1]:
+                self.most_negative = (lexema, score)
+        self.score += score
+
+    def update_many(self, tokens: Iterable[Dict[str, Any]]) -> "SentimentAccumulator":
+        """Agrega todos los tokens de un iterable y devuelve el acumulador."""
+        for t in tokens:
+            self.update(t)
+        return self
+
+    def merge(self, other: "SentimentAccumulator") -> "SentimentAccumulator":
+        """
+        Combina el resultado parcial de otro fragmento.
+
+        Args:
+            other: Acumulador del fragmento que sigue a este en el texto
+                (el orden importa solo para desempatar las palabras extremas).
+
+        Returns:
+            Este mismo acumulador.
+        """
+        self.score += other.score
+        self.positive_count += other.positive_count
+        self.negative_count += other.negative_count
+        if other.most_positive is not None and (self.most_positive is None or other.most_positive[1] > self.most_positive[1]):
+            self.most_positive = other.most_positive
+        if other.most_negative is not None and (self.most_negative is None or other.most_negative[1] < self.most_negative[1]):
+            self.most_negative = other.most_negative
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Devuelve el análisis de sentimiento acumulado.
+
+        Returns:
+            Diccionario con el mismo formato que SentimentAnalyzer.analyze.
+        """
+        most_positive = self.most_positive or ("", 0)
+        most_negative = self.most_negative or ("", 0)
+        return {
+            "sentiment": clasificar(self.score),
+            "score": self.score,
+            "positive_words_count": self.positive_count,
+            "negative_words_count": self.negative_count,
+            "most_positive": {"word": most_positive[0], "score": most_positive[1]},
+            "most_negative": {"word": most_negative[0], "score": most_negative[1]}
+        }
+
+
+class SentimentWindow:
+    def __init__(self, window_ms: int = 30000):
+        """
+        Sentimiento sobre una ventana deslizante de tiempo, para llamadas en vivo.
+
+        Args:
+            window_ms: Duración de la ventana en milisegundos.
+        """
+        self.window_ms = window_ms
+        self._eventos = deque()
+        self.score = 0
+        self.positive_count = 0
+        self.negative_count = 0
+
+    def update(self, token: Dict[str, Any], timestamp_ms: int):
+        """
+        Agrega un token ocurrido en el instante indicado y descarta los que
+        quedaron fuera de la ventana. Los instantes deben ser no decrecientes.
+
+        Args:
+            token: Token con "sentiment".
+            timestamp_ms: Instante del token (p. ej. el inicio de su utterance).
+        """
+        score = token["sentiment"]
+        if score:
+            self._eventos.append((timestamp_ms, score))
+            self.score += score
+            if score > 0:
+                self.positive_count += 1
+            else:
+                self.negative_count += 1
+        self.advance(timestamp_ms)
+
+    def advance(self, now_ms: int):
+        """Descarta los tokens anteriores al comienzo de la ventana que termina en now_ms."""
+        limite = now_ms - self.window_ms
+        eventos = self._eventos
+        while eventos and eventos[0][0] <= limite:
+            _, score = eventos.popleft()
+            self.score -= score
+            if score > 0:
+                self.positive_count -= 1
+            else:
+                self.negative_count -= 1
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Devuelve el sentimiento de la ventana actual.
+
+        Returns:
+            Diccionario con sentimiento, puntuación y cantidad de palabras
+            positivas y negativas dentro de la ventana.
+        """
+        return {
+            "sentiment": clasificar(self.score),
+            "score": self.score,
+            "positive_words_count": self.positive_count,
+            "negative_words_count": self.negative_count,
+            "window_ms": self.window_ms
+        }
+
 
 class SentimentAnalyzer:
-    def __init__(self, tokens: List[Dict[str, Any]]):
+    def __init__(self, tokens: Iterable[Dict[str, Any]]):
         """
         Inicializa el analizador de sentimiento.
-        
+
         Args:
-            tokens: Lista de tokens con información de sentimiento.
+            tokens: Tokens con información de sentimiento. Puede ser una lista
+                o un iterador (p. ej. Tokenizer.iter_tokens); se recorre una sola vez.
         """
         self.tokens = tokens
-        
+
     def analyze(self) -> Dict[str, Any]:
         """
         Analiza el sentimiento general del texto.
-        
+
         Returns:
             Diccionario con el análisis de sentimiento.
         """
-        # Contar palabras positivas y negativas
-        positive_words = [t for t in self.tokens if t["sentiment"] > 0]
-        negative_words = [t for t in self.tokens if t["sentiment"] < 0]
-        
-        # Calcular puntuación total
-        total_score = sum(t["sentiment"] for t in self.tokens)
-        
-        # Encontrar palabras más positivas y negativas
-        most_positive = max(positive_words, key=lambda x: x["sentiment"]) if positive_words else None
-        most_negative = min(negative_words, key=lambda x: x["sentiment"]) if negative_words else None
-        
-        # Formato seguro para most_positive y most_negative
-        most_positive_dict = {"word": most_positive["lexema"], "score": most_positive["sentiment"]} if most_positive else {"word": "", "score": 0}
-        most_negative_dict = {"word": most_negative["lexema"], "score": most_negative["sentiment"]} if most_negative else {"word": "", "score": 0}
-        
-        # Determinar sentimiento general
-        if total_score > 0:
-            sentiment = "Positivo"
-        elif total_score < 0:
-            sentiment = "Negativo"
-        else:
-            sentiment = "Neutral"
-            
+        return SentimentAccumulator().update_many(self.tokens).result()
+
+
+class UtteranceSentimentAnalyzer:
+    def __init__(self, columnas, utterances: List[Dict[str, Any]], agent_speaker: str = "A"):
+        """
+        Inicializa el análisis de sentimiento por hablante.
+
+        Args:
+            columnas: Tokens por columnas (Tokenizer.tokenize_utterances).
+            utterances: Intervenciones de la transcripción (con "start"/"end" en ms).
+            agent_speaker: Etiqueta del hablante que corresponde al agente.
+        """
+        self.columnas = columnas
+        self.utterances = utterances
+        self.agent_speaker = agent_speaker
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Calcula en una sola pasada el sentimiento general, el del agente, el
+        del cliente (resto de los hablantes) y la línea de tiempo por intervención.
+
+        Returns:
+            Diccionario con "general", "agente", "cliente" (mismo formato que
+            SentimentAnalyzer.analyze) y "linea_tiempo".
+        """
+        columnas = self.columnas
+        general = SentimentAccumulator()
+        agente = SentimentAccumulator()
+        cliente = SentimentAccumulator()
+        es_agente = [s == self.agent_speaker for s in columnas.speakers]
+        puntaje_utt = [0] * len(columnas.speakers)
+        for lexema, score, u in zip(columnas.lexemas, columnas.sentiment, columnas.utterance):
+            general.add(lexema, score)
+            (agente if es_agente[u] else cliente).add(lexema, score)
+            puntaje_utt[u] += score
+
+        linea_tiempo = []
+        acumulado = 0
+        for i, u in enumerate(self.utterances):
+            acumulado += puntaje_utt[i]
+            linea_tiempo.append({
+                "utterance": i,
+                "speaker": columnas.speakers[i],
+                "start": u.get("start"),
+                "end": u.get("end"),
+                "score": puntaje_utt[i],
+                "cumulative": acumulado
+            })
         return {
-            "sentiment": sentiment,
-            "score": total_score,
-            "positive_words_count": len(positive_words),
-            "negative_words_count": len(negative_words),
-            "most_positive": most_positive_dict,
-            "most_negative": most_negative_dict
-        } 
\ No newline at end of file
+            "general": general.result(),
+            "agente": agente.result(),
+            "cliente": cliente.result(),
+            "linea_tiempo": linea_tiempo
+        }
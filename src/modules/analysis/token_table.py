@@ -0,0 +1,317 @@
+from array import array
+from typing import Dict, Any, Iterable, List, Optional
+
+import numpy as np
+
+from .sentiment_analyzer import clasificar
+
+_FORMAT_VERSION = 1
+
+# Columna -> (código de array, tipo NumPy)
+_TIPOS = {
+    "lexema": ("i", np.int32),
+    "sentiment": ("b", np.int8),
+    "token": ("B", np.uint8),
+    "llamada": ("i", np.int32),
+    "utterance": ("i", np.int32),
+    "speaker": ("B", np.uint8)
+}
+
+
+class _Vocabulario:
+    """Strings internados: cada valor distinto recibe un id entero estable."""
+
+    def __init__(self, valores: Iterable[str] = ()):
+        self.valores: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for v in valores:
+            self.id(v)
+
+    def id(self, valor: str) -> int:
+        i = self._ids.get(valor)
+        if i is None:
+            i = self._ids[valor] = len(self.valores)
+            self.valores.append(valor)
+        return i
+
+    def buscar(self, valor: str) -> int:
+        """Devuelve el id del valor, o -1 si no está."""
+        return self._ids.get(valor, -1)
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+
+class TokenTable:
+    def __init__(self):
+        """
+        Tabla de tokens por columnas para análisis sobre muchas llamadas.
+
+        Cada fila es un token con las columnas:
+            lexema (int32): id en el vocabulario de lexemas.
+            sentiment (int8): puntaje de sentimiento.
+            token (uint8): id de la clase de token (SALUDO, OTRO, ...).
+            llamada (int32): id de la llamada.
+            utterance (int32): índice de la intervención dentro de la llamada (-1 si no se conoce).
+            speaker (uint8): id del hablante ("" si no se conoce).
+
+        Las filas se agregan llamada por llamada (add_tokens / add_columns) y
+        las columnas NumPy se arman al consultarlas.
+        """
+        self.lexemas = _Vocabulario()
+        self.tokens = _Vocabulario()
+        self.llamadas = _Vocabulario()
+        self.speakers = _Vocabulario([""])
+        self._buffers = {nombre: array(codigo) for nombre, (codigo, _) in _TIPOS.items()}
+        self._columnas: Optional[Dict[str, np.ndarray]] = None
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[Dict[str, Any]], llamada: str = "") -> "TokenTable":
+        """
+        Crea una tabla a partir de tokens en el formato de Tokenizer.tokenize.
+
+        Args:
+            tokens: Tokens (diccionarios o Token).
+            llamada: Identificador de la llamada.
+
+        Returns:
+            Tabla de tokens.
+        """
+        tabla = cls()
+        tabla.add_tokens(llamada, tokens)
+        return tabla
+
+    def add_tokens(self, llamada: str, tokens: Iterable[Dict[str, Any]], utterance: int = -1, speaker: str = ""):
+        """
+        Agrega los tokens de una llamada (o de una intervención).
+
+        Args:
+            llamada: Identificador de la llamada.
+            tokens: Tokens (diccionarios o Token).
+            utterance: Índice de la intervención, o -1 si no se conoce.
+            speaker: Hablante de la intervención.
+        """
+        b = self._buffers
+        llamada_id = self.llamadas.id(llamada)
+        speaker_id = self.speakers.id(speaker)
+        lexema_id = self.lexemas.id
+        token_id = self.tokens.id
+        n = 0
+        for t in tokens:
+            b["lexema"].append(lexema_id(t["lexema"]))
+            b["sentiment"].append(max(-128, min(127, int(t["sentiment"]))))
+            b["token"].append(token_id(t.get("token") or "OTRO"))
+            n += 1
+        b["llamada"].extend([llamada_id] * n)
+        b["utterance"].extend([utterance] * n)
+        b["speaker"].extend([speaker_id] * n)
+        self._columnas = None
+
+    def add_columns(self, llamada: str, columnas):
+        """
+        Agrega los tokens por intervención de una llamada.
+
+        Args:
+            llamada: Identificador de la llamada.
+            columnas: Tokens por columnas (Tokenizer.tokenize_utterances).
+        """
+        b = self._buffers
+        n = len(columnas)
+        llamada_id = self.llamadas.id(llamada)
+        speaker_ids = [self.speakers.id(s) for s in columnas.speakers]
+        token_ids = [self.tokens.id(t) for t in columnas.token_names]
+        b["lexema"].extend(self.lexemas.id(w) for w in columnas.lexemas)
+        b["sentiment"].extend(columnas.sentiment)
+        b["token"].extend(token_ids[i] for i in columnas.token_ids)
+        b["llamada"].extend([llamada_id] * n)
+        b["utterance"].fromlist(columnas.utterance.tolist())
+        b["speaker"].extend(speaker_ids[u] for u in columnas.utterance)
+        self._columnas = None
+
+    @property
+    def columnas(self) -> Dict[str, np.ndarray]:
+        """Columnas NumPy de la tabla."""
+        if self._columnas is None:
+            # Copia: los buffers siguen creciendo con cada llamada agregada
+            self._columnas = {
+                nombre: np.frombuffer(buffer, dtype=_TIPOS[nombre][1]).copy() if len(buffer) else np.zeros(0, _TIPOS[nombre][1])
+                for nombre, buffer in self._buffers.items()
+            }
+        return self._columnas
+
+    def __len__(self) -> int:
+        return len(self._buffers["lexema"])
+
+    def _mascara(self, llamada: str = None, speaker: str = None) -> Optional[np.ndarray]:
+        c = self.columnas
+        mascara = None
+        if llamada is not None:
+            mascara = c["llamada"] == self.llamadas.buscar(llamada)
+        if speaker is not None:
+            m = c["speaker"] == self.speakers.buscar(speaker)
+            mascara = m if mascara is None else mascara & m
+        return mascara
+
+    def to_tokens(self, llamada: str = None) -> List[Dict[str, Any]]:
+        """
+        Convierte filas de la tabla al formato de Tokenizer.tokenize
+        (sin validez ni sugerencias, que no se guardan en la tabla).
+
+        Args:
+            llamada: Llamada a convertir. Si es None, todas.
+
+        Returns:
+            Lista de tokens.
+        """
+        c = self.columnas
+        filas = np.arange(len(self)) if llamada is None else np.flatnonzero(self._mascara(llamada))
+        lexemas = self.lexemas.valores
+        tokens = self.tokens.valores
+        return [
+            {"lexema": lexemas[l], "sentiment": int(s), "token": tokens[t]}
+            for l, s, t in zip(c["lexema"][filas].tolist(), c["sentiment"][filas].tolist(), c["token"][filas].tolist())
+        ]
+
+    def sentiment(self, llamada: str = None, speaker: str = None) -> Dict[str, Any]:
+        """
+        Análisis de sentimiento vectorizado sobre las filas seleccionadas.
+
+        Args:
+            llamada: Restringir a una llamada.
+            speaker: Restringir a un hablante.
+
+        Returns:
+            Diccionario con el mismo formato que SentimentAnalyzer.analyze.
+        """
+        c = self.columnas
+        mascara = self._mascara(llamada, speaker)
+        scores = c["sentiment"] if mascara is None else c["sentiment"][mascara]
+        lexemas = c["lexema"] if mascara is None else c["lexema"][mascara]
+        total = int(scores.sum(dtype=np.int64))
+        positivos = scores > 0
+        negativos = scores < 0
+
+        def extremo(filtro, elegir):
+            if not filtro.any():
+                return {"word": "", "score": 0}
+            # argmax/argmin devuelven la primera aparición ante empates
+            i = int(elegir(np.where(filtro, scores, 0)))
+            return {"word": self.lexemas.valores[lexemas[i]], "score": int(scores[i])}
+
+        return {
+            "sentiment": clasificar(total),
+            "score": total,
+            "positive_words_count": int(positivos.sum()),
+            "negative_words_count": int(negativos.sum()),
+            "most_positive": extremo(positivos, np.argmax),
+            "most_negative": extremo(negativos, np.argmin)
+        }
+
+    def sentiment_by_call(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Sentimiento de todas las llamadas a la vez.
+
+        Returns:
+            Diccionario llamada -> resultado con el formato de SentimentAnalyzer.analyze.
+        """
+        c = self.columnas
+        n = len(self.llamadas)
+        scores = c["sentiment"].astype(np.int64)
+        llamada = c["llamada"]
+        totales = np.bincount(llamada, weights=scores, minlength=n).astype(np.int64)
+        positivos = np.bincount(llamada[scores > 0], minlength=n)
+        negativos = np.bincount(llamada[scores < 0], minlength=n)
+
+        def extremos(filtro, signo):
+            # Ordenar por llamada, luego por puntaje (más extremo primero) y
+            # luego por posición; la primera fila de cada llamada es la buscada
+            filas = np.flatnonzero(filtro)
+            orden = filas[np.lexsort((filas, -signo * scores[filas], llamada[filas]))]
+            llamadas, primeras = np.unique(llamada[orden], return_index=True)
+            return dict(zip(llamadas.tolist(), orden[primeras].tolist()))
+
+        mas_positiva = extremos(scores > 0, 1)
+        mas_negativa = extremos(scores < 0, -1)
+        lexemas = self.lexemas.valores
+
+        def palabra(fila):
+            if fila is None:
+                return {"word": "", "score": 0}
+            return {"word": lexemas[c["lexema"][fila]], "score": int(scores[fila])}
+
+        return {
+            nombre: {
+                "sentiment": clasificar(int(totales[i])),
+                "score": int(totales[i]),
+                "positive_words_count": int(positivos[i]),
+                "negative_words_count": int(negativos[i]),
+                "most_positive": palabra(mas_positiva.get(i)),
+                "most_negative": palabra(mas_negativa.get(i))
+            }
+            for i, nombre in enumerate(self.llamadas.valores)
+        }
+
+    def prohibited_words(self, llamada: str = None, token: str = "PALABRA_PROHIBIDA") -> List[str]:
+        """
+        Palabras prohibidas en orden de aparición (como ProtocolAnalyzer).
+
+        Args:
+            llamada: Restringir a una llamada.
+            token: Clase de token buscada.
+
+        Returns:
+            Lista de lexemas.
+        """
+        c = self.columnas
+        mascara = c["token"] == self.tokens.buscar(token)
+        if llamada is not None:
+            mascara &= self._mascara(llamada)
+        return [self.lexemas.valores[i] for i in c["lexema"][mascara].tolist()]
+
+    def prohibited_by_call(self, token: str = "PALABRA_PROHIBIDA") -> Dict[str, List[str]]:
+        """Palabras prohibidas de cada llamada (solo las llamadas que tienen alguna)."""
+        c = self.columnas
+        filas = np.flatnonzero(c["token"] == self.tokens.buscar(token))
+        resultado: Dict[str, List[str]] = {}
+        for llamada, lexema in zip(c["llamada"][filas].tolist(), c["lexema"][filas].tolist()):
+            resultado.setdefault(self.llamadas.valores[llamada], []).append(self.lexemas.valores[lexema])
+        return resultado
+
+    def save(self, path: str):
+        """
+        Guarda la tabla en formato .npz.
+
+        Args:
+            path: Ruta del archivo.
+        """
+        np.savez_compressed(
+            path,
+            version=np.array(_FORMAT_VERSION),
+            vocab_lexemas=np.array(self.lexemas.valores, dtype=str),
+            vocab_tokens=np.array(self.tokens.valores, dtype=str),
+            vocab_llamadas=np.array(self.llamadas.valores, dtype=str),
+            vocab_speakers=np.array(self.speakers.valores, dtype=str),
+            **self.columnas
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "TokenTable":
+        """
+        Carga una tabla guardada con save.
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            if "version" not in data or int(data["version"]) != _FORMAT_VERSION:
+                raise ValueError(f"Tabla de tokens inválida: {path}")
+            tabla = cls()
+            tabla.lexemas = _Vocabulario(data["vocab_lexemas"].tolist())
+            tabla.tokens = _Vocabulario(data["vocab_tokens"].tolist())
+            tabla.llamadas = _Vocabulario(data["vocab_llamadas"].tolist())
+            tabla.speakers = _Vocabulario(data["vocab_speakers"].tolist())
+            for nombre, (codigo, tipo) in _TIPOS.items():
+                buffer = array(codigo)
+                buffer.frombytes(np.ascontiguousarray(data[nombre], dtype=tipo).tobytes())
+                tabla._buffers[nombre] = buffer
+        return tabla
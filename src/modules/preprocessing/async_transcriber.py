@@ -0,0 +1,187 @@
+import asyncio
+import json
+import os
+import sys
+import urllib.request
+from typing import Dict, Any, List, Callable, Optional
+
+# Agregar la raíz del proyecto al path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+from credentials.config import ASSEMBLY_API_KEY
+from .transcription_cache import TranscriptionCache, DEFAULT_CONFIG
+
+ASSEMBLY_BASE_URL = "https://api.assemblyai.com"
+
+
+class TranscriptionError(Exception):
+    """Error devuelto por el servicio de transcripción."""
+
+
+class AsyncTranscriber:
+    def __init__(self, api_key: str = None, base_url: str = None, max_in_flight: int = 8,
+                 poll_interval: float = 1.0, max_poll_interval: float = 15.0, backoff: float = 1.5,
+                 timeout: float = 3600.0, cache: TranscriptionCache = None):
+        """
+        Inicializa el transcriptor asíncrono por lotes sobre la API REST de AssemblyAI.
+
+        Args:
+            api_key: Clave API de AssemblyAI. Si es None, usa la clave por defecto.
+            base_url: URL base del servicio (permite apuntar a un servidor local de prueba).
+            max_in_flight: Cantidad máxima de trabajos enviados simultáneamente.
+            poll_interval: Espera inicial entre consultas de estado, en segundos.
+            max_poll_interval: Espera máxima entre consultas de estado, en segundos.
+            backoff: Factor de crecimiento de la espera entre consultas.
+            timeout: Tiempo máximo de espera por archivo, en segundos.
+            cache: Caché de transcripciones. Si es None, usa la caché por defecto.
+        """
+        self.api_key = api_key or ASSEMBLY_API_KEY
+        self.base_url = (base_url or ASSEMBLY_BASE_URL).rstrip("/")
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache or TranscriptionCache()
+        # Trabajos en curso por clave de caché (evita enviar dos veces el mismo audio)
+        self._en_curso = {}
+
+    def _request(self, method: str, path: str, body: bytes = None, content_type: str = None) -> Dict[str, Any]:
+        headers = {"authorization": self.api_key}
+        if content_type:
+            headers["content-type"] = content_type
+        req = urllib.request.Request(self.base_url + path, data=body, headers=headers, method=method)
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+
+    def _upload(self, audio_path: str) -> str:
+        with open(audio_path, "rb") as f:
+            data = f.read()
+        return self._request("POST", "/v2/upload", data, "application/octet-stream")["upload_url"]
+
+    def _submit(self, audio_url: str) -> str:
+        config = {
+            "audio_url": audio_url,
+            "speaker_labels": DEFAULT_CONFIG["speaker_labels"],
+            "language_code": DEFAULT_CONFIG["language_code"]
+        }
+        body = json.dumps(config).encode("utf-8")
+        return self._request("POST", "/v2/transcript", body, "application/json")["id"]
+
+    def _poll(self, transcript_id: str) -> Dict[str, Any]:
+        return self._request("GET", f"/v2/transcript/{transcript_id}")
+
+    @staticmethod
+    def output_path(audio_path: str) -> str:
+        """Ruta donde se guarda la transcripción (la misma que usa SpeechToText)."""
+        outdir = os.path.join("outputs", os.path.splitext(os.path.basename(audio_path))[0])
+        return os.path.join(outdir, "transcripcion_assembly.json")
+
+    async def _call(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def transcribe_one(self, audio_path: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        Sube, envía y espera la transcripción de un archivo.
+
+        Args:
+            audio_path: Ruta al archivo de audio.
+            semaphore: Semáforo que limita los trabajos en curso.
+
+        Returns:
+            Diccionario con la transcripción y diarización.
+        """
+        outpath = self.output_path(audio_path)
+        cache_key = await self._call(self.cache.key, audio_path, DEFAULT_CONFIG)
+        resultado = self.cache.get(cache_key)
+        if resultado is None:
+            futuro = self._en_curso.get(cache_key)
+            if futuro is None:
+                futuro = asyncio.ensure_future(self._transcribe_remote(audio_path, cache_key, semaphore))
+                self._en_curso[cache_key] = futuro
+                futuro.add_done_callback(lambda _: self._en_curso.pop(cache_key, None))
+            resultado = await asyncio.shield(futuro)
+        self._guardar(resultado, outpath)
+        return resultado
+
+    async def _transcribe_remote(self, audio_path: str, cache_key: str,
+                                 semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        async with semaphore:
+            upload_url = await self._call(self._upload, audio_path)
+            transcript_id = await self._call(self._submit, upload_url)
+
+            espera = self.poll_interval
+            transcurrido = 0.0
+            while True:
+                await asyncio.sleep(espera)
+                transcurrido += espera
+                json_data = await self._call(self._poll, transcript_id)
+                status = json_data.get("status")
+                if status == "completed":
+                    break
+                if status == "error":
+                    raise TranscriptionError(json_data.get("error") or "Error desconocido")
+                if transcurrido >= self.timeout:
+                    raise TranscriptionError(f"Tiempo de espera agotado para {audio_path}")
+                espera = min(espera * self.backoff, self.max_poll_interval)
+
+        resultado = {
+            "text": json_data.get("text"),
+            "utterances": json_data.get("utterances")
+        }
+        self.cache.put(cache_key, resultado)
+        return resultado
+
+    def _guardar(self, resultado: Dict[str, Any], outpath: str):
+        os.makedirs(os.path.dirname(outpath), exist_ok=True)
+        with open(outpath, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+
+    async def transcribe_many(self, audio_paths: List[str],
+                              on_result: Optional[Callable[[str, Dict[str, Any], Optional[Exception]], None]] = None
+                              ) -> Dict[str, Any]:
+        """
+        Transcribe varios archivos de forma concurrente.
+
+        Args:
+            audio_paths: Rutas a los archivos de audio.
+            on_result: Función llamada con (ruta, resultado, error) a medida que
+                termina cada archivo.
+
+        Returns:
+            Diccionario ruta -> transcripción, o ruta -> excepción si falló.
+
+        Raises:
+            ValueError: Si dos audios distintos se guardarían en la misma
+                transcripción (mismo nombre en directorios diferentes).
+        """
+        destinos = {}
+        for path in dict.fromkeys(os.path.abspath(p) for p in audio_paths):
+            destinos.setdefault(self.output_path(path), []).append(path)
+        repetidos = [rutas for rutas in destinos.values() if len(rutas) > 1]
+        if repetidos:
+            raise ValueError("Audios con el mismo nombre de salida: "
+                             + "; ".join(", ".join(rutas) for rutas in repetidos))
+
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        resultados = {}
+
+        async def tarea(path):
+            try:
+                resultado = await self.transcribe_one(path, semaphore)
+                error = None
+            except Exception as e:
+                resultado, error = None, e
+            resultados[path] = error if error else resultado
+            if on_result:
+                on_result(path, resultado, error)
+
+        await asyncio.gather(*(tarea(p) for p in dict.fromkeys(audio_paths)))
+        return resultados
+
+    def run(self, audio_paths: List[str], on_result=None) -> Dict[str, Any]:
+        """Versión síncrona de transcribe_many."""
+        try:
+            return asyncio.run(self.transcribe_many(audio_paths, on_result))
+        finally:
+            self.cache.flush()
@@ -0,0 +1,215 @@
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Tuple
+
+from .lexicon_store import read_table, table_stamp
+
+_MAGIC = b"CALEXv2\0"
+# magic, mtime_ns y tamaño del JSON de origen, mtime_ns y tamaño de su journal,
+# cantidad de palabras, cantidad de tokens, bytes de nombres de tokens, bytes de palabras
+_HEADER = struct.Struct("<8sqqqqIIII")
+_SEP = "\0"
+
+# Léxicos compilados compartidos por todas las instancias del proceso
+_cache: Dict[str, Tuple[Tuple[int, ...], "CompiledLexicon"]] = {}
+
+
+class CompiledLexicon(Mapping):
+    def __init__(self, words: List[str], scores: array, token_ids: array, token_names: List[str],
+                 source_stamp: Tuple[int, ...] = (0, 0, 0, 0)):
+        """
+        Tabla de símbolos compilada: palabras ordenadas con sus puntajes y
+        tokens en arreglos paralelos.
+
+        Se comporta como un diccionario de solo lectura palabra -> {"puntaje", "token"},
+        compatible con el formato de tabla_simbolos.json.
+
+        Args:
+            words: Palabras ordenadas.
+            scores: Puntaje de sentimiento de cada palabra (array 'b').
+            token_ids: Índice del token de cada palabra en token_names (array 'B').
+            token_names: Nombres de los tokens.
+            source_stamp: (mtime_ns, tamaño) del JSON a partir del cual se compiló
+                y (mtime_ns, tamaño) de su journal de cambios.
+        """
+        self.words = words
+        self.scores = scores
+        self.token_ids = token_ids
+        self.token_names = token_names
+        self.source_stamp = source_stamp
+
+    @classmethod
+    def from_dict(cls, dictionary: Dict[str, Any], source_stamp: Tuple[int, ...] = (0, 0, 0, 0)) -> "CompiledLexicon":
+        """
+        Compila un diccionario con el formato de tabla_simbolos.json.
+
+        Args:
+            dictionary: Diccionario palabra -> {"puntaje", "token"}.
+            source_stamp: (mtime_ns, tamaño) del JSON y de su journal.
+
+        Returns:
+            Léxico compilado.
+        """
+        token_names = []
+        token_index = {}
+        words = []
+        scores = array("b")
+        token_ids = array("B")
+        for word in sorted(dictionary):
+            entry = dictionary[word]
+            # Las entradas vacías se consideran ausentes, igual que en Tokenizer.tokenize
+            if not entry or _SEP in word:
+                continue
+            puntaje = entry["puntaje"] if isinstance(entry, dict) and "puntaje" in entry else 0
+            token = entry["token"] if isinstance(entry, dict) and "token" in entry else "OTRO"
+            if token not in token_index:
+                token_index[token] = len(token_names)
+                token_names.append(sys.intern(token))
+            words.append(word)
+            scores.append(max(-128, min(127, int(puntaje))))
+            token_ids.append(token_index[token])
+        return cls(words, scores, token_ids, token_names, source_stamp)
+
+    def save(self, path: str):
+        """
+        Guarda el léxico en formato binario.
+
+        Args:
+            path: Ruta del archivo compilado.
+        """
+        tokens_blob = _SEP.join(self.token_names).encode("utf-8")
+        words_blob = _SEP.join(self.words).encode("utf-8")
+        header = _HEADER.pack(_MAGIC, *self.source_stamp, len(self.words),
+                              len(self.token_names), len(tokens_blob), len(words_blob))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(tokens_blob)
+            f.write(words_blob)
+            f.write(self.scores.tobytes())
+            f.write(self.token_ids.tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CompiledLexicon":
+        """
+        Carga un léxico compilado.
+
+        Args:
+            path: Ruta del archivo compilado.
+
+        Returns:
+            Léxico compilado.
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Léxico compilado inválido: {path}")
+        magic, mtime_ns, size, journal_mtime_ns, journal_size, n_words, n_tokens, tokens_len, words_len = \
+            _HEADER.unpack_from(data)
+        if magic != _MAGIC or len(data) != _HEADER.size + tokens_len + words_len + 2 * n_words:
+            raise ValueError(f"Léxico compilado inválido: {path}")
+        pos = _HEADER.size
+        token_names = [sys.intern(t) for t in data[pos:pos + tokens_len].decode("utf-8").split(_SEP)] if n_tokens else []
+        pos += tokens_len
+        words = data[pos:pos + words_len].decode("utf-8").split(_SEP) if n_words else []
+        pos += words_len
+        scores = array("b")
+        scores.frombytes(data[pos:pos + n_words])
+        pos += n_words
+        token_ids = array("B")
+        token_ids.frombytes(data[pos:pos + n_words])
+        return cls(words, scores, token_ids, token_names, (mtime_ns, size, journal_mtime_ns, journal_size))
+
+    def index(self, word: str) -> int:
+        """Devuelve la posición de la palabra en la tabla, o -1 si no existe."""
+        i = bisect_left(self.words, word)
+        if i < len(self.words) and self.words[i] == word:
+            return i
+        return -1
+
+    def lookup(self, word: str) -> Optional[Tuple[int, str]]:
+        """
+        Busca una palabra.
+
+        Args:
+            word: Palabra a buscar.
+
+        Returns:
+            Tupla (puntaje, token), o None si la palabra no está en la tabla.
+        """
+        i = self.index(word)
+        if i < 0:
+            return None
+        return self.scores[i], self.token_names[self.token_ids[i]]
+
+    def __getitem__(self, word: str) -> Dict[str, Any]:
+        found = self.lookup(word)
+        if found is None:
+            raise KeyError(word)
+        return {"puntaje": found[0], "token": found[1]}
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self.index(word) >= 0
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def compiled_path(json_path: str) -> str:
+    """Ruta del léxico compilado correspondiente a un JSON de tabla de símbolos."""
+    return os.path.splitext(json_path)[0] + ".lex"
+
+
+def load_lexicon(json_path: str) -> CompiledLexicon:
+    """
+    Obtiene el léxico compilado de una tabla de símbolos JSON.
+
+    Incluye los cambios pendientes del journal de la tabla (ver
+    lexicon_store.LexiconStore). El resultado se comparte entre todas las
+    instancias del proceso y se invalida cuando cambia la fecha de
+    modificación o el tamaño del JSON o del journal.
+    La versión compilada se guarda junto al JSON para que otros procesos
+    la carguen sin volver a parsearlo.
+
+    Args:
+        json_path: Ruta a la tabla de símbolos JSON.
+
+    Returns:
+        Léxico compilado.
+    """
+    key = os.path.abspath(json_path)
+    stamp = table_stamp(json_path)
+    cached = _cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    lex_path = compiled_path(json_path)
+    lexicon = None
+    try:
+        lexicon = CompiledLexicon.load(lex_path)
+        if lexicon.source_stamp != stamp:
+            lexicon = None
+    except (OSError, ValueError):
+        lexicon = None
+
+    if lexicon is None:
+        dictionary, stamp = read_table(json_path)
+        lexicon = CompiledLexicon.from_dict(dictionary, stamp)
+        try:
+            lexicon.save(lex_path)
+        except OSError as e:
+            print(f"No se pudo guardar el léxico compilado en {lex_path}: {e}")
+
+    _cache[key] = (stamp, lexicon)
+    return lexicon
@@ -0,0 +1,208 @@
+import json
+import os
+from typing import Dict, Any, Optional, Tuple
+
+from ...utils.file_lock import file_lock
+
+# Tamaño del journal a partir del cual apply() compacta automáticamente
+DEFAULT_COMPACT_BYTES = 256 * 1024
+
+# Almacenes compartidos por el proceso, por ruta
+_stores: Dict[str, "LexiconStore"] = {}
+
+
+def journal_path(json_path: str) -> str:
+    """Ruta del journal de cambios correspondiente a una tabla de símbolos JSON."""
+    return os.path.splitext(json_path)[0] + ".journal"
+
+
+def journal_stamp(json_path: str) -> Tuple[int, int]:
+    """(mtime_ns, tamaño) del journal de una tabla de símbolos, o (0, 0) si no existe."""
+    try:
+        st = os.stat(journal_path(json_path))
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def table_stamp(json_path: str) -> Tuple[int, int, int, int]:
+    """(mtime_ns, tamaño) del JSON seguidos de los del journal."""
+    st = os.stat(json_path)
+    return (st.st_mtime_ns, st.st_size) + journal_stamp(json_path)
+
+
+def replay_journal(dictionary: Dict[str, Any], path: str) -> int:
+    """
+    Aplica sobre un diccionario los cambios de un journal.
+
+    Cada línea es un objeto JSON {"lexema", "puntaje", "token"} (alta o
+    modificación) o {"lexema", "eliminar": true}. Una última línea
+    incompleta (escritura en curso) se ignora. Reaplicar cambios ya
+    incluidos en el diccionario no altera el resultado.
+
+    Args:
+        dictionary: Diccionario palabra -> {"puntaje", "token"} a modificar.
+        path: Ruta del journal.
+
+    Returns:
+        Cantidad de cambios aplicados.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return 0
+    aplicados = 0
+    for linea in data.split(b"\n")[:-1]:
+        if not linea.strip():
+            continue
+        try:
+            cambio = json.loads(linea)
+        except ValueError:
+            continue
+        lexema = cambio.get("lexema")
+        if not lexema:
+            continue
+        if cambio.get("eliminar"):
+            dictionary.pop(lexema, None)
+        else:
+            dictionary[lexema] = {"puntaje": cambio.get("puntaje", 0), "token": cambio.get("token", "OTRO")}
+        aplicados += 1
+    return aplicados
+
+
+def read_table(json_path: str) -> Tuple[Dict[str, Any], Tuple[int, int, int, int]]:
+    """
+    Lee una tabla de símbolos JSON y le reaplica su journal sin bloquear.
+
+    Si el JSON o el journal cambian durante la lectura (p. ej. una
+    compactación de otro proceso), se vuelve a leer.
+
+    Args:
+        json_path: Ruta a la tabla de símbolos JSON.
+
+    Returns:
+        Diccionario palabra -> {"puntaje", "token"} y la marca (table_stamp)
+        de los archivos leídos, o (0, 0, 0, 0) si el JSON no existe.
+    """
+    while True:
+        try:
+            stamp = table_stamp(json_path)
+            with open(json_path, "r", encoding="utf-8") as f:
+                dictionary = json.load(f)
+        except FileNotFoundError:
+            stamp, dictionary = (0, 0, 0, 0), {}
+        replay_journal(dictionary, journal_path(json_path))
+        try:
+            actual = table_stamp(json_path)
+        except FileNotFoundError:
+            actual = (0, 0, 0, 0)
+        if actual == stamp:
+            return dictionary, stamp
+
+
+class LexiconStore:
+    def __init__(self, json_path: str, compact_bytes: int = DEFAULT_COMPACT_BYTES):
+        """
+        Tabla de símbolos con un journal de cambios de solo agregado.
+
+        Las correcciones se agregan al journal (tabla_simbolos.journal) en
+        lugar de reescribir el JSON completo; el costo de guardar depende de
+        la cantidad de cambios, no del tamaño de la tabla. Cuando el journal
+        supera compact_bytes, se vuelca sobre el JSON y se vacía.
+
+        Las escrituras de distintos procesos se serializan con un archivo de
+        bloqueo (fcntl en POSIX, msvcrt en Windows). Los lectores no
+        necesitan bloquear: leen el JSON y reaplican el journal (ver
+        lexicon.load_lexicon).
+
+        Args:
+            json_path: Ruta a la tabla de símbolos JSON.
+            compact_bytes: Tamaño del journal que dispara la compactación.
+        """
+        self.json_path = json_path
+        self.journal_path = journal_path(json_path)
+        self.lock_path = f"{json_path}.lock"
+        self.compact_bytes = compact_bytes
+
+    def lock(self, exclusive: bool = True):
+        """Bloqueo entre procesos sobre la tabla de símbolos."""
+        return file_lock(self.lock_path, exclusive)
+
+    def read(self) -> Dict[str, Any]:
+        """
+        Devuelve la tabla completa (JSON más los cambios del journal).
+
+        Returns:
+            Diccionario palabra -> {"puntaje", "token"}.
+        """
+        return read_table(self.json_path)[0]
+
+    def apply(self, cambios: Dict[str, Optional[Dict[str, Any]]], compact: bool = None):
+        """
+        Registra altas, modificaciones y bajas de lexemas.
+
+        Args:
+            cambios: Diccionario lexema -> {"puntaje", "token"}, o None para
+                eliminar el lexema.
+            compact: Compactar después de escribir. Si es None, se compacta
+                solo si el journal superó compact_bytes.
+        """
+        lineas = []
+        for lexema, entrada in cambios.items():
+            if entrada is None:
+                cambio = {"lexema": lexema, "eliminar": True}
+            else:
+                cambio = {"lexema": lexema, "puntaje": int(entrada.get("puntaje", 0)),
+                          "token": str(entrada.get("token", "OTRO"))}
+            lineas.append(json.dumps(cambio, ensure_ascii=False))
+        if not lineas:
+            return
+        data = ("\n".join(lineas) + "\n").encode("utf-8")
+        with self.lock():
+            with open(self.journal_path, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                tamaño = f.tell()
+            if compact or (compact is None and tamaño >= self.compact_bytes):
+                self._compact_locked()
+
+    def compact(self):
+        """Vuelca el journal sobre el JSON y lo vacía."""
+        with self.lock():
+            self._compact_locked()
+
+    def _compact_locked(self):
+        # Primero se reemplaza el JSON y recién después se vacía el journal.
+        # Un lector concurrente puede leer el JSON viejo y el journal ya
+        # vacío; read_table lo detecta porque cambian las marcas de ambos
+        # archivos y vuelve a leer. Reaplicar cambios ya incluidos en el
+        # JSON nuevo no altera el resultado.
+        dictionary = self.read()
+        tmp_path = f"{self.json_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dictionary, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.json_path)
+        with open(self.journal_path, "wb"):
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Devuelve el tamaño del JSON y del journal."""
+        def size(path):
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+        return {"json_bytes": size(self.json_path), "journal_bytes": size(self.journal_path)}
+
+
+def get_lexicon_store(json_path: str) -> LexiconStore:
+    """Devuelve el almacén del proceso para una tabla de símbolos."""
+    key = os.path.abspath(json_path)
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = LexiconStore(json_path)
+    return store
@@ -1,23 +1,25 @@
-import assemblyai as aai
 import json
 import os
-import sys
 from typing import Dict, Any
 
-# Agregar la raíz del proyecto al path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
-from credentials.config import ASSEMBLY_API_KEY
+from .stt_backends import STTBackend, AssemblyAIBackend, TRANSCRIPT_NAME, get_backend
+from .transcription_cache import TranscriptionCache
 
 class SpeechToText:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache: TranscriptionCache = None, backend: STTBackend = None):
         """
-        Inicializa el convertidor de voz a texto usando AssemblyAI.
+        Inicializa el convertidor de voz a texto.
         
         Args:
-            api_key: Clave API de AssemblyAI. Si es None, usa la clave por defecto.
+            api_key: Clave API de AssemblyAI. Si se indica, usa AssemblyAI como motor.
+            cache: Caché de transcripciones. Si es None, usa la caché por defecto.
+            backend: Motor de voz a texto (ver stt_backends.py). Si es None, usa
+                el configurado en credentials/config.py (STT_BACKEND).
         """
-        self.api_key = api_key or ASSEMBLY_API_KEY
-        aai.settings.api_key = self.api_key
+        if backend is None:
+            backend = AssemblyAIBackend(api_key) if api_key else get_backend()
+        self.backend = backend
+        self.cache = cache or TranscriptionCache()
         
     def transcribe(self, audio_path: str) -> Dict[str, Any]:
         """
@@ -32,35 +34,28 @@ class SpeechToText:
         # Configurar directorio de salida
         outdir = os.path.join("outputs", os.path.splitext(os.path.basename(audio_path))[0])
         os.makedirs(outdir, exist_ok=True)
-        outpath = os.path.join(outdir, "transcripcion_assembly.json")
+        outpath = os.path.join(outdir, TRANSCRIPT_NAME)
         
-        # Verificar si ya existe la transcripción
-        if os.path.exists(outpath):
-            print(f"Usando transcripción existente de: {outpath}")
-            with open(outpath, "r", encoding="utf-8") as f:
-                return json.load(f)
+        # Verificar si ya existe la transcripción de este mismo audio con el mismo motor
+        cache_key = None
+        if self.backend.cacheable:
+            cache_key = self.cache.key(audio_path, self.backend.config())
+            resultado = self.cache.get(cache_key)
+            if resultado is not None:
+                print(f"Usando transcripción en caché para: {audio_path}")
+                self._guardar(resultado, outpath)
+                return resultado
         
-        # Configurar transcripción en español con diarización
-        config = aai.TranscriptionConfig(
-            speaker_labels=True,
-            language_code="es"
-        )
-        
-        # Transcribir
-        print(f"Iniciando transcripción de: {audio_path}")
-        transcriber = aai.Transcriber(config=config)
-        transcript = transcriber.transcribe(audio_path)
-        
-        # Extraer solo la información necesaria
-        json_data = transcript.json_response
-        resultado = {
-            "text": json_data.get("text"),
-            "utterances": json_data.get("utterances")
-        }
+        resultado = self.backend.transcribe_audio(audio_path)
         
         # Guardar resultado
+        if cache_key is not None:
+            self.cache.put(cache_key, resultado)
         print(f"Guardando transcripción en: {outpath}")
-        with open(outpath, "w", encoding="utf-8") as f:
-            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        self._guardar(resultado, outpath)
         
-        return resultado 
\ No newline at end of file
+        return resultado
+
+    def _guardar(self, resultado: Dict[str, Any], outpath: str):
+        with open(outpath, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2) 
\ No newline at end of file
@@ -0,0 +1,186 @@
+import json
+import os
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Any, List
+
+from ...utils.file_lock import file_lock
+
+
+def _ultimos(data: "OrderedDict", n: int):
+    # Las n entradas más recientes, en orden
+    return islice(data.items(), max(len(data) - n, 0), None)
+
+
+class _LRU:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        while len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entradas": len(self.data),
+            "aciertos": self.hits,
+            "fallos": self.misses,
+            "tasa_aciertos": self.hits / total if total else 0.0
+        }
+
+
+class SpellChecker:
+    def __init__(self, lang: str = "es_PY", max_lookups: int = 200000, max_suggestions: int = 50000,
+                 cache_path: str = None):
+        """
+        Corrector ortográfico con memoización de las consultas a phunspell.
+
+        Args:
+            lang: Idioma del diccionario de phunspell.
+            max_lookups: Cantidad máxima de resultados de lookup en memoria.
+            max_suggestions: Cantidad máxima de resultados de suggest en memoria.
+            cache_path: Archivo desde el cual cargar (y en el cual guardar) la
+                caché entre ejecuciones. Si es None, la caché es solo en memoria.
+        """
+        self.lang = lang
+        self._dic = None
+        self.cache_path = cache_path
+        self._lookups = _LRU(max_lookups)
+        self._suggestions = _LRU(max_suggestions)
+        self._saved_misses = 0
+        if cache_path:
+            self.load(cache_path)
+
+    @property
+    def dic(self):
+        """Diccionario de phunspell, cargado recién en la primera consulta."""
+        if self._dic is None:
+            import phunspell
+            self._dic = phunspell.Phunspell(self.lang)
+        return self._dic
+
+    def lookup(self, word: str) -> bool:
+        """Indica si la palabra existe en el diccionario de phunspell."""
+        try:
+            return self._lookups.get(word)
+        except KeyError:
+            result = bool(self.dic.lookup(word))
+            self._lookups.put(word, result)
+            return result
+
+    def suggest(self, word: str) -> List[str]:
+        """Devuelve las sugerencias de phunspell para la palabra."""
+        try:
+            return list(self._suggestions.get(word))
+        except KeyError:
+            result = tuple(self.dic.suggest(word))
+            self._suggestions.put(word, result)
+            return list(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Devuelve contadores de aciertos y fallos de la caché."""
+        return {
+            "lookup": self._lookups.stats(),
+            "suggest": self._suggestions.stats()
+        }
+
+    def load(self, path: str):
+        """
+        Carga resultados guardados previamente.
+
+        Args:
+            path: Ruta al archivo de caché.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("lang") != self.lang:
+            return
+        for word, result in data.get("lookup", {}).items():
+            self._lookups.put(word, bool(result))
+        for word, result in data.get("suggest", {}).items():
+            self._suggestions.put(word, tuple(result))
+
+    def save(self, path: str = None):
+        """
+        Guarda los resultados en memoria para reutilizarlos en otra ejecución.
+
+        Args:
+            path: Ruta al archivo de caché. Si es None, usa cache_path.
+        """
+        path = path or self.cache_path
+        if not path:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with file_lock(f"{path}.lock"):
+            # Combinar con lo que otros procesos hayan guardado; lo de este
+            # proceso queda como lo más reciente y se recorta a los límites del LRU
+            lookups, suggestions = OrderedDict(), OrderedDict()
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    previo = json.load(f)
+                if previo.get("lang") == self.lang:
+                    lookups.update(previo.get("lookup", {}))
+                    suggestions.update(previo.get("suggest", {}))
+            except (OSError, ValueError):
+                pass
+            for word, result in self._lookups.data.items():
+                lookups.pop(word, None)
+                lookups[word] = result
+            for word, result in self._suggestions.data.items():
+                suggestions.pop(word, None)
+                suggestions[word] = list(result)
+            data = {
+                "lang": self.lang,
+                "lookup": dict(_ultimos(lookups, self._lookups.max_size)),
+                "suggest": dict(_ultimos(suggestions, self._suggestions.max_size))
+            }
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        self._saved_misses = self._lookups.misses + self._suggestions.misses
+
+    def flush(self):
+        """Guarda la caché en cache_path solo si hay resultados nuevos."""
+        if self.cache_path and self._lookups.misses + self._suggestions.misses != self._saved_misses:
+            self.save()
+
+
+# Corrector compartido por todos los tokenizadores del proceso
+_shared = None
+
+
+def get_spell_checker(cache_path: str = None) -> SpellChecker:
+    """
+    Devuelve el corrector compartido del proceso.
+
+    Args:
+        cache_path: Archivo de caché persistente. Si se indica y el corrector
+            todavía no lo usa, se cargan sus resultados.
+    """
+    global _shared
+    if _shared is None:
+        _shared = SpellChecker(cache_path=cache_path)
+    elif cache_path and _shared.cache_path != cache_path:
+        _shared.cache_path = cache_path
+        _shared.load(cache_path)
+    return _shared
@@ -0,0 +1,210 @@
+import json
+import queue
+import socket
+import threading
+import time
+import wave
+from typing import Any, Dict, Iterable, Iterator
+
+# Formato del audio enviado al servicio de transcripción en vivo: PCM de
+# 16 bits, mono, a SAMPLE_RATE Hz, en bloques de CHUNK_MS milisegundos
+SAMPLE_RATE = 16000
+CHUNK_MS = 100
+
+PARCIAL = "parcial"
+FINAL = "final"
+
+
+def _bytes_por_ms(sample_rate: int) -> float:
+    return sample_rate * 2 / 1000
+
+
+def _pacer(chunks: Iterable[bytes], chunk_ms: int, velocidad: float) -> Iterator[bytes]:
+    # Entrega los bloques al ritmo en que se reproduciría el audio
+    inicio = time.monotonic()
+    for i, chunk in enumerate(chunks):
+        espera = inicio + i * chunk_ms / 1000 / velocidad - time.monotonic()
+        if espera > 0:
+            time.sleep(espera)
+        yield chunk
+
+
+def iter_audio_chunks(path: str, chunk_ms: int = CHUNK_MS, sample_rate: int = SAMPLE_RATE,
+                      realtime: bool = True, velocidad: float = 1.0) -> Iterator[bytes]:
+    """
+    Lee un audio en bloques de PCM de 16 bits mono, como si se estuviera
+    reproduciendo.
+
+    Los WAV que ya están en ese formato se leen directamente; el resto se
+    convierte con pydub.
+
+    Args:
+        path: Ruta al audio.
+        chunk_ms: Duración de cada bloque en milisegundos.
+        sample_rate: Frecuencia de muestreo de salida.
+        realtime: Entregar los bloques al ritmo de reproducción.
+        velocidad: Factor de velocidad de reproducción (con realtime).
+
+    Yields:
+        Bloques de audio.
+    """
+    tamaño = int(_bytes_por_ms(sample_rate) * chunk_ms)
+
+    def bloques():
+        try:
+            with wave.open(path, "rb") as w:
+                if (w.getnchannels(), w.getsampwidth(), w.getframerate(), w.getcomptype()) == (1, 2, sample_rate, "NONE"):
+                    while True:
+                        datos = w.readframes(tamaño // 2)
+                        if not datos:
+                            return
+                        yield datos
+        except (wave.Error, EOFError):
+            pass
+        from pydub import AudioSegment
+        audio = AudioSegment.from_file(path).set_frame_rate(sample_rate).set_channels(1).set_sample_width(2)
+        datos = audio.raw_data
+        for inicio in range(0, len(datos), tamaño):
+            yield datos[inicio:inicio + tamaño]
+
+    return _pacer(bloques(), chunk_ms, velocidad) if realtime else bloques()
+
+
+def silence_chunks(duracion_ms: int, chunk_ms: int = CHUNK_MS, sample_rate: int = SAMPLE_RATE,
+                   realtime: bool = True, velocidad: float = 1.0) -> Iterator[bytes]:
+    """
+    Bloques de silencio de la duración indicada (para probar con el servidor
+    de prueba sin un archivo de audio).
+    """
+    bloque = bytes(int(_bytes_por_ms(sample_rate) * chunk_ms))
+    chunks = (bloque for _ in range(-(-duracion_ms // chunk_ms)))
+    return _pacer(chunks, chunk_ms, velocidad) if realtime else chunks
+
+
+class SocketStreamingTranscriber:
+    def __init__(self, host: str = "127.0.0.1", port: int = 8766, sample_rate: int = SAMPLE_RATE):
+        """
+        Cliente de transcripción en vivo sobre un socket TCP local.
+
+        Protocolo: el cliente envía una línea JSON {"sample_rate": N} y luego
+        el audio (PCM de 16 bits mono); al terminar cierra su lado de
+        escritura. El servidor responde con una línea JSON por evento:
+        {"tipo": "parcial" | "final", "text", "speaker", "start", "end"}.
+        Ver utils/fake_streaming_server.py.
+
+        Args:
+            host: Host del servidor.
+            port: Puerto del servidor.
+            sample_rate: Frecuencia de muestreo del audio enviado.
+        """
+        self.host = host
+        self.port = port
+        self.sample_rate = sample_rate
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+        """
+        Envía el audio y devuelve los eventos de transcripción a medida que llegan.
+
+        Args:
+            chunks: Bloques de audio (p. ej. iter_audio_chunks).
+
+        Yields:
+            Eventos parciales y finales.
+        """
+        sock = socket.create_connection((self.host, self.port))
+        errores = []
+
+        def enviar():
+            try:
+                sock.sendall(json.dumps({"sample_rate": self.sample_rate}).encode("utf-8") + b"\n")
+                for chunk in chunks:
+                    sock.sendall(chunk)
+                sock.shutdown(socket.SHUT_WR)
+            except OSError as e:
+                errores.append(e)
+
+        emisor = threading.Thread(target=enviar, daemon=True)
+        emisor.start()
+        try:
+            with sock.makefile("rb") as lector:
+                for linea in lector:
+                    if linea.strip():
+                        yield json.loads(linea)
+        finally:
+            sock.close()
+            emisor.join(timeout=1)
+        if errores:
+            raise errores[0]
+
+
+class AssemblyAIStreamingTranscriber:
+    def __init__(self, api_key: str = None, sample_rate: int = SAMPLE_RATE):
+        """
+        Transcripción en vivo con el servicio de tiempo real de AssemblyAI
+        (aai.RealtimeTranscriber), con los mismos eventos que
+        SocketStreamingTranscriber. El servicio no diariza: "speaker" es None.
+
+        Args:
+            api_key: Clave API de AssemblyAI. Si es None, usa la de credentials/config.py.
+            sample_rate: Frecuencia de muestreo del audio enviado.
+        """
+        self.api_key = api_key
+        self.sample_rate = sample_rate
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+        """
+        Envía el audio y devuelve los eventos de transcripción a medida que llegan.
+
+        Args:
+            chunks: Bloques de audio (p. ej. iter_audio_chunks).
+
+        Yields:
+            Eventos parciales y finales.
+
+        Raises:
+            RuntimeError: Si el servicio informa un error.
+        """
+        import assemblyai as aai
+        if self.api_key is None:
+            from credentials.config import ASSEMBLY_API_KEY
+            self.api_key = ASSEMBLY_API_KEY
+        aai.settings.api_key = self.api_key
+
+        eventos: "queue.Queue" = queue.Queue()
+        fin = object()
+
+        def on_data(transcript):
+            if not transcript.text:
+                return
+            eventos.put({
+                "tipo": FINAL if isinstance(transcript, aai.RealtimeFinalTranscript) else PARCIAL,
+                "text": transcript.text,
+                "speaker": None,
+                "start": transcript.audio_start,
+                "end": transcript.audio_end
+            })
+
+        def on_error(error):
+            eventos.put(RuntimeError(str(error)))
+
+        transcriber = aai.RealtimeTranscriber(
+            sample_rate=self.sample_rate, on_data=on_data, on_error=on_error,
+            on_close=lambda: eventos.put(fin)
+        )
+        transcriber.connect()
+
+        def enviar():
+            try:
+                transcriber.stream(chunks)
+            finally:
+                transcriber.close()
+                eventos.put(fin)
+
+        threading.Thread(target=enviar, daemon=True).start()
+        while True:
+            evento = eventos.get()
+            if evento is fin:
+                return
+            if isinstance(evento, Exception):
+                raise evento
+            yield evento
@@ -0,0 +1,227 @@
+import json
+import os
+import sys
+from typing import Dict, Any, Optional
+
+from .transcription_cache import DEFAULT_CONFIG
+
+# Agregar la raíz del proyecto al path (credentials/config.py)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+TRANSCRIPT_NAME = "transcripcion_assembly.json"
+
+# Modelos de Vosk cargados por el proceso, por ruta
+_vosk_models: Dict[str, Any] = {}
+
+
+class STTBackend:
+    """
+    Interfaz de los motores de voz a texto usados por SpeechToText.
+
+    Cada motor devuelve la transcripción con la forma de AssemblyAI:
+    {"text": str, "utterances": [{"speaker", "text", "start", "end", ...}]},
+    con los tiempos en milisegundos.
+    """
+
+    name = ""
+    # Si es False, SpeechToText no guarda sus resultados en la caché de transcripciones
+    cacheable = True
+
+    def config(self) -> Dict[str, Any]:
+        """
+        Configuración que determina el resultado de la transcripción. Forma
+        parte de la clave de la caché, de modo que cambiar de motor o de
+        modelo no reutiliza transcripciones de otro.
+        """
+        return {"backend": self.name}
+
+    def transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
+        """
+        Transcribe y diariza un archivo de audio.
+
+        Args:
+            audio_path: Ruta al archivo de audio.
+
+        Returns:
+            Diccionario con "text" y "utterances".
+        """
+        raise NotImplementedError
+
+
+class AssemblyAIBackend(STTBackend):
+    name = "assemblyai"
+
+    def __init__(self, api_key: str = None):
+        """
+        Transcripción con diarización en AssemblyAI (requiere red y créditos).
+
+        Args:
+            api_key: Clave API de AssemblyAI. Si es None, usa la de credentials/config.py.
+        """
+        if api_key is None:
+            from credentials.config import ASSEMBLY_API_KEY
+            api_key = ASSEMBLY_API_KEY
+        self.api_key = api_key
+
+    def config(self) -> Dict[str, Any]:
+        # Igual a la configuración histórica: las entradas de caché existentes siguen siendo válidas
+        return dict(DEFAULT_CONFIG)
+
+    def transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
+        import assemblyai as aai
+        aai.settings.api_key = self.api_key
+        config = aai.TranscriptionConfig(
+            speaker_labels=DEFAULT_CONFIG["speaker_labels"],
+            language_code=DEFAULT_CONFIG["language_code"]
+        )
+        print(f"Iniciando transcripción de: {audio_path}")
+        transcript = aai.Transcriber(config=config).transcribe(audio_path)
+        json_data = transcript.json_response
+        return {
+            "text": json_data.get("text"),
+            "utterances": json_data.get("utterances")
+        }
+
+
+class ReplayBackend(STTBackend):
+    name = "replay"
+    cacheable = False
+
+    def __init__(self, directorio: str = "outputs"):
+        """
+        Devuelve transcripciones ya grabadas en lugar de transcribir: para
+        probar y medir el resto de la cadena sin red ni créditos.
+
+        Para el audio <nombre>.mp3 busca <directorio>/<nombre>.json o
+        <directorio>/<nombre>/transcripcion_assembly.json.
+
+        Args:
+            directorio: Directorio de las transcripciones.
+        """
+        self.directorio = directorio
+
+    def config(self) -> Dict[str, Any]:
+        return {"backend": self.name, "directorio": os.path.abspath(self.directorio)}
+
+    def transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
+        """
+        Raises:
+            FileNotFoundError: Si no hay una transcripción grabada para el audio.
+        """
+        nombre = os.path.splitext(os.path.basename(audio_path))[0]
+        for path in (os.path.join(self.directorio, f"{nombre}.json"),
+                     os.path.join(self.directorio, nombre, TRANSCRIPT_NAME)):
+            if os.path.isfile(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    transcripcion = json.load(f)
+                return {"text": transcripcion.get("text"), "utterances": transcripcion.get("utterances")}
+        raise FileNotFoundError(f"No hay transcripción grabada para {audio_path} en {self.directorio}")
+
+
+class VoskBackend(STTBackend):
+    name = "vosk"
+
+    def __init__(self, model_path: str = None, speaker: str = "A", sample_rate: int = 16000):
+        """
+        Transcripción local (sin red) con un modelo de Vosk, p. ej.
+        vosk-model-small-es-0.42. Requiere el paquete vosk.
+
+        Vosk no diariza: todas las intervenciones se asignan a speaker, por
+        defecto el agente, para que el análisis de protocolo se aplique
+        sobre toda la llamada.
+
+        Args:
+            model_path: Directorio del modelo. Si es None, usa VOSK_MODEL_PATH de credentials/config.py.
+            speaker: Hablante asignado a las intervenciones.
+            sample_rate: Frecuencia a la que se convierte el audio.
+        """
+        if model_path is None:
+            model_path = _config("VOSK_MODEL_PATH", os.path.join("modelos", "vosk-model-small-es-0.42"))
+        self.model_path = model_path
+        self.speaker = speaker
+        self.sample_rate = sample_rate
+
+    def config(self) -> Dict[str, Any]:
+        return {"backend": self.name, "modelo": os.path.abspath(self.model_path),
+                "speaker": self.speaker, "sample_rate": self.sample_rate}
+
+    def _modelo(self):
+        modelo = _vosk_models.get(self.model_path)
+        if modelo is None:
+            from vosk import Model, SetLogLevel
+            SetLogLevel(-1)
+            modelo = _vosk_models[self.model_path] = Model(self.model_path)
+        return modelo
+
+    def transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
+        from vosk import KaldiRecognizer
+        from .streaming import iter_audio_chunks
+
+        recognizer = KaldiRecognizer(self._modelo(), self.sample_rate)
+        recognizer.SetWords(True)
+        utterances = []
+
+        def agregar(resultado: str):
+            datos = json.loads(resultado)
+            palabras = datos.get("result") or []
+            if not datos.get("text") or not palabras:
+                return
+            utterances.append({
+                "speaker": self.speaker,
+                "text": datos["text"],
+                "start": int(palabras[0]["start"] * 1000),
+                "end": int(palabras[-1]["end"] * 1000),
+                "confidence": sum(p.get("conf", 0) for p in palabras) / len(palabras),
+                "words": [
+                    {"text": p["word"], "start": int(p["start"] * 1000), "end": int(p["end"] * 1000),
+                     "confidence": p.get("conf", 0), "speaker": self.speaker}
+                    for p in palabras
+                ]
+            })
+
+        print(f"Iniciando transcripción local de: {audio_path}")
+        for chunk in iter_audio_chunks(audio_path, chunk_ms=250, sample_rate=self.sample_rate, realtime=False):
+            if recognizer.AcceptWaveform(chunk):
+                agregar(recognizer.Result())
+        agregar(recognizer.FinalResult())
+        return {"text": " ".join(u["text"] for u in utterances), "utterances": utterances}
+
+
+BACKENDS = {
+    AssemblyAIBackend.name: AssemblyAIBackend,
+    ReplayBackend.name: ReplayBackend,
+    VoskBackend.name: VoskBackend,
+}
+
+
+def _config(nombre: str, default=None):
+    try:
+        import credentials.config as config
+    except ImportError:
+        return default
+    return getattr(config, nombre, default)
+
+
+def get_backend(nombre: str = None, opciones: Optional[Dict[str, Any]] = None) -> STTBackend:
+    """
+    Crea el motor de voz a texto configurado.
+
+    Args:
+        nombre: "assemblyai", "replay" o "vosk". Si es None, usa STT_BACKEND
+            de credentials/config.py (por defecto "assemblyai").
+        opciones: Argumentos del motor (p. ej. {"directorio": ...} para
+            replay). Si es None, usa STT_OPTIONS de credentials/config.py.
+
+    Returns:
+        Motor de voz a texto.
+
+    Raises:
+        ValueError: Si el motor no existe.
+    """
+    if nombre is None:
+        nombre = _config("STT_BACKEND", AssemblyAIBackend.name)
+        if opciones is None:
+            opciones = _config("STT_OPTIONS", {})
+    if nombre not in BACKENDS:
+        raise ValueError(f"Motor de voz a texto desconocido: {nombre} (opciones: {', '.join(BACKENDS)})")
+    return BACKENDS[nombre](**(opciones or {}))
@@ -0,0 +1,323 @@
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+from ...utils.distance_metrics import distance_batch
+
+DEFAULT_DIC_PATH = os.path.join("diccionario", "es_PY.dic")
+
+_MAGIC = b"CASYMv2\0"
+# magic, max_distance, prefix_length, enteros de source_stamp, cantidad de palabras,
+# bytes de palabras, cantidad de borrados, bytes de borrados, cantidad de ids
+_HEADER = struct.Struct("<8sIIIIIIII")
+_SEP = "\0"
+
+# Índices compartidos por todas las instancias del proceso
+_cache: Dict[Tuple[str, int, int], "SymSpellIndex"] = {}
+# Índice de cada tabla de símbolos (capa sobre el índice base), por ruta
+_table_cache: Dict[Tuple[str, int], "LayeredIndex"] = {}
+
+
+def read_hunspell_words(dic_path: str) -> List[str]:
+    """
+    Lee las palabras de un diccionario Hunspell (.dic).
+
+    Solo se toman las raíces tal como aparecen en el archivo; las formas
+    derivadas de las reglas de afijos (.aff) no se expanden.
+
+    Args:
+        dic_path: Ruta al archivo .dic.
+
+    Returns:
+        Lista ordenada de palabras únicas en minúsculas.
+    """
+    words = set()
+    with open(dic_path, "r", encoding="utf-8", errors="replace") as f:
+        next(f, None)  # La primera línea es la cantidad de entradas
+        for line in f:
+            campos = line.split("/", 1)[0].split()
+            if campos:
+                words.add(campos[0].lower())
+    return sorted(words)
+
+
+class SymSpellIndex:
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 2, prefix_length: int = 7):
+        """
+        Índice de borrados (estilo SymSpell) para buscar palabras cercanas
+        por distancia de Levenshtein sin recorrer todo el diccionario.
+
+        Cada palabra se registra bajo todas las variantes que resultan de
+        borrarle hasta max_distance caracteres de su prefijo. Una consulta
+        genera los mismos borrados y solo compara contra las palabras que
+        comparten alguno.
+
+        Args:
+            words: Palabras a indexar.
+            max_distance: Distancia máxima soportada en las consultas.
+            prefix_length: Longitud del prefijo indexado (reduce el tamaño del índice).
+        """
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.words: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._deletes: Dict[str, object] = {}
+        self.source_stamp = (0, 0)
+        self.add_words(words)
+
+    def _edits(self, word: str, max_distance: int) -> set:
+        word = word[:self.prefix_length]
+        result = {word}
+        frontier = {word}
+        for _ in range(max_distance):
+            siguiente = set()
+            for w in frontier:
+                for i in range(len(w)):
+                    siguiente.add(w[:i] + w[i + 1:])
+            result |= siguiente
+            frontier = siguiente
+        return result
+
+    def add_words(self, words: Iterable[str]):
+        """Agrega palabras al índice (las ya presentes se ignoran)."""
+        deletes = self._deletes
+        for word in words:
+            word = word.lower()
+            if not word or word in self._ids:
+                continue
+            word_id = len(self.words)
+            self.words.append(word)
+            self._ids[word] = word_id
+            for d in self._edits(word, self.max_distance):
+                ids = deletes.get(d)
+                if ids is None:
+                    deletes[d] = word_id
+                elif isinstance(ids, int):
+                    deletes[d] = [ids, word_id]
+                else:
+                    ids.append(word_id)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._ids
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def lookup(self, word: str, max_distance: int = None, top_k: int = 5) -> List[Tuple[str, int]]:
+        """
+        Busca las palabras más cercanas.
+
+        Args:
+            word: Palabra a buscar.
+            max_distance: Distancia máxima de edición (no mayor que la del índice).
+            top_k: Cantidad máxima de resultados.
+
+        Returns:
+            Lista de (palabra, distancia) ordenada por distancia y luego alfabéticamente.
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        word = word.lower()
+        candidatos = set()
+        for d in self._edits(word, max_distance):
+            ids = self._deletes.get(d)
+            if ids is None:
+                continue
+            if isinstance(ids, int):
+                candidatos.add(ids)
+            else:
+                candidatos.update(ids)
+
+        palabras = [self.words[i] for i in candidatos]
+        resultados = [
+            (candidato, dist)
+            for candidato, dist in zip(palabras, distance_batch(word, palabras, max_distance))
+            if dist <= max_distance
+        ]
+        resultados.sort(key=lambda x: (x[1], x[0]))
+        return resultados[:top_k]
+
+    def save(self, path: str):
+        """
+        Guarda el índice en formato binario.
+
+        Args:
+            path: Ruta del archivo del índice.
+        """
+        claves = list(self._deletes)
+        cantidades = array("I")
+        ids = array("I")
+        for ids_borrado in self._deletes.values():
+            if isinstance(ids_borrado, int):
+                cantidades.append(1)
+                ids.append(ids_borrado)
+            else:
+                cantidades.append(len(ids_borrado))
+                ids.extend(ids_borrado)
+        words_blob = _SEP.join(self.words).encode("utf-8")
+        deletes_blob = _SEP.join(claves).encode("utf-8")
+        header = _HEADER.pack(_MAGIC, self.max_distance, self.prefix_length, len(self.source_stamp),
+                              len(self.words), len(words_blob), len(claves), len(deletes_blob), len(ids))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(struct.pack(f"<{len(self.source_stamp)}q", *self.source_stamp))
+            f.write(words_blob)
+            f.write(deletes_blob)
+            f.write(cantidades.tobytes())
+            f.write(ids.tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SymSpellIndex":
+        """
+        Carga un índice guardado con save.
+
+        Args:
+            path: Ruta del archivo del índice.
+
+        Returns:
+            Índice de sugerencias.
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Índice de sugerencias inválido: {path}")
+        magic, max_distance, prefix_length, n_stamp, n_words, words_len, n_deletes, deletes_len, n_ids = \
+            _HEADER.unpack_from(data)
+        if magic != _MAGIC or len(data) != _HEADER.size + 8 * n_stamp + words_len + deletes_len + 4 * (n_deletes + n_ids):
+            raise ValueError(f"Índice de sugerencias inválido: {path}")
+        pos = _HEADER.size
+        source_stamp = struct.unpack_from(f"<{n_stamp}q", data, pos)
+        pos += 8 * n_stamp
+        words = data[pos:pos + words_len].decode("utf-8").split(_SEP) if n_words else []
+        pos += words_len
+        claves = data[pos:pos + deletes_len].decode("utf-8").split(_SEP) if n_deletes else []
+        pos += deletes_len
+        cantidades = array("I")
+        cantidades.frombytes(data[pos:pos + 4 * n_deletes])
+        pos += 4 * n_deletes
+        ids = array("I")
+        ids.frombytes(data[pos:pos + 4 * n_ids])
+        if len(words) != n_words or len(claves) != n_deletes or sum(cantidades) != n_ids:
+            raise ValueError(f"Índice de sugerencias inválido: {path}")
+
+        # Un borrado con una sola palabra guarda el id; con varias, la lista de ids
+        ids = ids.tolist()
+        deletes = {}
+        inicio = 0
+        for clave, cantidad in zip(claves, cantidades):
+            deletes[clave] = ids[inicio] if cantidad == 1 else ids[inicio:inicio + cantidad]
+            inicio += cantidad
+
+        index = cls(max_distance=max_distance, prefix_length=prefix_length)
+        index.words = words
+        index._ids = {w: i for i, w in enumerate(words)}
+        index._deletes = deletes
+        index.source_stamp = source_stamp
+        return index
+
+
+class LayeredIndex:
+    def __init__(self, base: SymSpellIndex, overlay: SymSpellIndex):
+        """
+        Consulta un índice base compartido (es_PY.dic) y una capa con las
+        palabras de una tabla de símbolos sin modificar el índice base.
+
+        Args:
+            base: Índice del diccionario Hunspell.
+            overlay: Índice de las palabras de la tabla de símbolos.
+        """
+        self.base = base
+        self.overlay = overlay
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.overlay or word in self.base
+
+    def lookup(self, word: str, max_distance: int = None, top_k: int = 5) -> List[Tuple[str, int]]:
+        """Igual que SymSpellIndex.lookup, sobre ambos índices."""
+        resultados = dict(self.base.lookup(word, max_distance, top_k))
+        resultados.update(self.overlay.lookup(word, max_distance, top_k))
+        return sorted(resultados.items(), key=lambda x: (x[1], x[0]))[:top_k]
+
+
+def _load_or_build(index_path: str, stamp: Tuple[int, ...], max_distance: int, words, descripcion: str) -> SymSpellIndex:
+    # Carga el índice guardado si corresponde a la misma fuente; si no, lo construye y lo guarda
+    try:
+        index = SymSpellIndex.load(index_path)
+        if index.source_stamp != stamp or index.max_distance != max_distance:
+            index = None
+    except (OSError, ValueError):
+        index = None
+
+    if index is None:
+        print(f"Construyendo índice de sugerencias para {descripcion}...")
+        index = SymSpellIndex(words(), max_distance)
+        index.source_stamp = stamp
+        try:
+            index.save(index_path)
+        except OSError as e:
+            print(f"No se pudo guardar el índice de sugerencias en {index_path}: {e}")
+    return index
+
+
+def load_index(dic_path: str = None, max_distance: int = 2) -> SymSpellIndex:
+    """
+    Obtiene el índice de sugerencias de un diccionario Hunspell.
+
+    El índice se construye una vez, se guarda junto al .dic y se comparte
+    entre todas las instancias del proceso. Se reconstruye si cambia el .dic.
+
+    Args:
+        dic_path: Ruta al archivo .dic. Si es None, usa el diccionario por defecto.
+        max_distance: Distancia máxima soportada.
+
+    Returns:
+        Índice de sugerencias.
+    """
+    dic_path = dic_path or DEFAULT_DIC_PATH
+    st = os.stat(dic_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (os.path.abspath(dic_path), max_distance, st.st_mtime_ns)
+    index = _cache.get(key)
+    if index is not None:
+        return index
+
+    index_path = f"{os.path.splitext(dic_path)[0]}.d{max_distance}.sym"
+    index = _load_or_build(index_path, stamp, max_distance, lambda: read_hunspell_words(dic_path), dic_path)
+    _cache[key] = index
+    return index
+
+
+def load_table_index(json_path: str, lexicon, dic_path: str = None, max_distance: int = 2) -> LayeredIndex:
+    """
+    Obtiene el índice de sugerencias de es_PY.dic más las palabras de una
+    tabla de símbolos.
+
+    Las palabras de la tabla se indexan en una capa aparte, guardada junto
+    a la tabla (tabla_simbolos.d2.sym) y reconstruida cuando cambia la
+    tabla o su journal (source_stamp del léxico).
+
+    Args:
+        json_path: Ruta a la tabla de símbolos JSON.
+        lexicon: Léxico compilado de la tabla (ver lexicon.load_lexicon).
+        dic_path: Ruta al archivo .dic. Si es None, usa el diccionario por defecto.
+        max_distance: Distancia máxima soportada.
+
+    Returns:
+        Índice de sugerencias.
+    """
+    base = load_index(dic_path, max_distance)
+    key = (os.path.abspath(json_path), max_distance)
+    cached = _table_cache.get(key)
+    if cached is not None and cached.base is base and cached.overlay.source_stamp == tuple(lexicon.source_stamp):
+        return cached
+
+    index_path = f"{os.path.splitext(json_path)[0]}.d{max_distance}.sym"
+    overlay = _load_or_build(index_path, tuple(lexicon.source_stamp), max_distance, lambda: list(lexicon), json_path)
+    index = _table_cache[key] = LayeredIndex(base, overlay)
+    return index
@@ -1,37 +1,158 @@
 import os
 import re
 import json
-from typing import List, Dict, Any
-from ...utils.distance_metrics import distance, hamming_distance_with_padding
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QSpinBox, QComboBox, QPushButton, QHBoxLayout, QMessageBox, QHeaderView, QDialog
-import phunspell
-from PyQt6.QtGui import QIcon
+from array import array
+from typing import List, Dict, Any, Iterator, Tuple
+from ...utils.distance_metrics import bounded_distance, hamming_distance_with_padding
+from .lexicon import CompiledLexicon, load_lexicon
+from .spell_checker import SpellChecker, get_spell_checker
 
 
-dic_es = phunspell.Phunspell('es_PY')
+SUGGESTION_ENGINES = ("phunspell", "symspell")
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+class Token:
+    """
+    Token compacto producido por Tokenizer.iter_tokens.
+
+    Admite acceso por atributo (token.lexema) y, por compatibilidad con los
+    tokens en forma de diccionario, también token["lexema"] y token.get("token").
+    Las posiciones inicio/fin son offsets de caracteres sobre el texto original.
+    """
+    __slots__ = ("lexema", "valido", "sentiment", "token", "sugerencias", "inicio", "fin")
+
+    def __init__(self, lexema: str, valido: bool, sentiment: int, token: str,
+                 sugerencias: Tuple[str, ...], inicio: int, fin: int):
+        self.lexema = lexema
+        self.valido = valido
+        self.sentiment = sentiment
+        self.token = token
+        self.sugerencias = sugerencias
+        self.inicio = inicio
+        self.fin = fin
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Devuelve el token en el formato de Tokenizer.tokenize."""
+        return {
+            "lexema": self.lexema,
+            "valido": self.valido,
+            "sentiment": self.sentiment,
+            "token": self.token,
+            "sugerencias": list(self.sugerencias)
+        }
+
+    def __repr__(self) -> str:
+        return f"Token({self.lexema!r}, {self.token}, {self.sentiment}, {self.inicio}:{self.fin})"
+
+
+class TokenColumns:
+    def __init__(self, speakers: List[str]):
+        """
+        Tokens de una transcripción diarizada guardados por columnas.
+
+        Cada posición k describe un token: su lexema, puntaje, token, validez,
+        la intervención (utterance) a la que pertenece y sus offsets dentro
+        del texto de esa intervención. Las sugerencias se guardan solo para
+        los tokens que las tienen.
+
+        Args:
+            speakers: Hablante de cada intervención (p. ej. "A", "B").
+        """
+        self.speakers = speakers
+        self.lexemas: List[str] = []
+        self.sentiment = array("b")
+        self.token_ids = array("B")
+        self.token_names: List[str] = []
+        self.valido = array("B")
+        self.utterance = array("I")
+        self.inicio = array("I")
+        self.fin = array("I")
+        self.sugerencias: Dict[int, Tuple[str, ...]] = {}
+        self._token_index: Dict[str, int] = {}
+
+    def append(self, utterance: int, t: Token):
+        """Agrega un token de la intervención indicada."""
+        token_id = self._token_index.get(t.token)
+        if token_id is None:
+            token_id = self._token_index[t.token] = len(self.token_names)
+            self.token_names.append(t.token)
+        if t.sugerencias:
+            self.sugerencias[len(self.lexemas)] = t.sugerencias
+        self.lexemas.append(t.lexema)
+        self.sentiment.append(t.sentiment)
+        self.token_ids.append(token_id)
+        self.valido.append(t.valido)
+        self.utterance.append(utterance)
+        self.inicio.append(t.inicio)
+        self.fin.append(t.fin)
+
+    def __len__(self) -> int:
+        return len(self.lexemas)
+
+    def token(self, k: int) -> Token:
+        """Devuelve el token de la posición k como registro Token."""
+        return Token(self.lexemas[k], bool(self.valido[k]), self.sentiment[k],
+                     self.token_names[self.token_ids[k]], self.sugerencias.get(k, ()),
+                     self.inicio[k], self.fin[k])
+
+    def __iter__(self) -> Iterator[Token]:
+        return (self.token(k) for k in range(len(self.lexemas)))
+
+    def tokens_de(self, token: str) -> Iterator[Token]:
+        """Recorre solo los tokens de un tipo (p. ej. "PALABRA_PROHIBIDA")."""
+        token_id = self._token_index.get(token)
+        if token_id is None:
+            return iter(())
+        return (self.token(k) for k, tid in enumerate(self.token_ids) if tid == token_id)
 
 
 class Tokenizer:
-    def __init__(self, dictionary_path: str = None):
+    def __init__(self, dictionary_path: str = None, spell_checker: SpellChecker = None,
+                 suggestion_engine: str = "phunspell"):
         """
         Inicializa el tokenizador.
         
         Args:
             dictionary_path: Ruta al archivo de diccionario. Si es None, usa el diccionario por defecto.
+            spell_checker: Corrector ortográfico. Si es None, usa el corrector compartido del proceso.
+            suggestion_engine: Motor de sugerencias: "phunspell" (suggest de Hunspell) o
+                "symspell" (índice de borrados local sobre es_PY.dic y la tabla de símbolos).
         """
+        if suggestion_engine not in SUGGESTION_ENGINES:
+            raise ValueError(f"Motor de sugerencias desconocido: {suggestion_engine}")
         self.dictionary_path = dictionary_path or "diccionario/tabla_simbolos.json"
         self.dictionary = self._load_dictionary(self.dictionary_path)
+        self.spell_checker = spell_checker or get_spell_checker()
+        self.suggestion_engine = suggestion_engine
+
+    def _get_suggestion_index(self):
+        # La capa de la tabla sigue al léxico vigente, incluidas las correcciones del journal
+        from .suggestion_index import load_table_index
+        return load_table_index(self.dictionary_path, load_lexicon(self.dictionary_path))
         
-    def _load_dictionary(self, dictionary_path: str) -> Dict[str, int]:
+    def _load_dictionary(self, dictionary_path: str) -> CompiledLexicon:
         """
         Carga el diccionario de palabras válidas.
         
+        El diccionario se compila una sola vez y se comparte entre instancias
+        mientras el archivo no cambie (ver lexicon.load_lexicon).
+        
         Args:
             dictionary_path: Ruta al archivo de diccionario.
             
         Returns:
-            Diccionario con palabras y sus puntajes de sentimiento.
+            Diccionario (de solo lectura) con palabras y sus puntajes de sentimiento.
         """
         if not os.path.exists(dictionary_path):
             os.makedirs(os.path.dirname(dictionary_path), exist_ok=True)
@@ -39,11 +160,10 @@ class Tokenizer:
                 json.dump({}, f, ensure_ascii=False, indent=2)
             print(f"Diccionario creado automáticamente en {dictionary_path}")
         try:
-            with open(dictionary_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_lexicon(dictionary_path)
         except Exception as e:
             print(f"Error al cargar el diccionario: {e}")
-            return {}
+            return CompiledLexicon.from_dict({})
             
     def tokenize(self, text: str, parent_widget=None) -> List[Dict[str, Any]]:
         """
@@ -54,44 +174,59 @@ class Tokenizer:
         Returns:
             Lista de tokens con información de validez y sentimiento.
         """
-        # Convertir a minúsculas y tokenizar
-        text = text.lower()
-        words = re.findall(r'\b\w+\b', text)
-        # Validar palabras y generar tokens
-        tokens = []
-        for word in words:
-            entry = self.dictionary.get(word)
+        return [t.to_dict() for t in self.iter_tokens(text)]
+
+    def iter_tokens(self, text: str) -> Iterator[Token]:
+        """
+        Tokeniza el texto de forma incremental.
+
+        A diferencia de tokenize, no copia el texto completo en minúsculas ni
+        arma la lista de tokens: cada palabra se valida y se entrega a medida
+        que se encuentra, por lo que el consumo de memoria no depende del
+        largo de la transcripción.
+
+        Args:
+            text: Texto a tokenizar.
+
+        Yields:
+            Tokens con información de validez, sentimiento y posición en el texto.
+        """
+        lookup = self.dictionary.lookup
+        spell_lookup = self.spell_checker.lookup
+        for m in _WORD_RE.finditer(text):
+            word = m.group().lower()
+            entry = lookup(word)
             if entry:
-                tokens.append({
-                    "lexema": word,
-                    "valido": True,
-                    "sentiment": entry["puntaje"] if isinstance(entry, dict) and "puntaje" in entry else 0,
-                    "token": entry["token"] if isinstance(entry, dict) and "token" in entry else "OTRO",
-                    "sugerencias": []
-                })
-            elif dic_es.lookup(word):
-                tokens.append({
-                    "lexema": word,
-                    "valido": False,
-                    "sentiment": 0,
-                    "token": "OTRO",
-                    "sugerencias": []
-                })
+                yield Token(word, True, entry[0], entry[1], (), m.start(), m.end())
+            elif spell_lookup(word):
+                yield Token(word, False, 0, "OTRO", (), m.start(), m.end())
             else:
-                sugerencias = self._find_suggestions(word)
-                tokens.append({
-                    "lexema": word,
-                    "valido": False,
-                    "sentiment": 0,
-                    "token": "OTRO",
-                    "sugerencias": sugerencias
-                })
-        return tokens
+                sugerencias = tuple(self._find_suggestions(word))
+                yield Token(word, False, 0, "OTRO", sugerencias, m.start(), m.end())
         
+    def tokenize_utterances(self, utterances: List[Dict[str, Any]]) -> TokenColumns:
+        """
+        Tokeniza cada intervención de una transcripción diarizada en una sola
+        pasada, conservando a qué intervención y hablante pertenece cada token.
+
+        Args:
+            utterances: Intervenciones con "speaker" y "text".
+
+        Returns:
+            Tokens por columnas.
+        """
+        columnas = TokenColumns([u.get("speaker") or "" for u in utterances])
+        append = columnas.append
+        for i, u in enumerate(utterances):
+            for t in self.iter_tokens(u.get("text") or ""):
+                append(i, t)
+        return columnas
+
     def _find_suggestions(self, word: str, max_distance: int = 2) -> List[str]:
         """
         Encuentra sugerencias para una palabra basadas en las distancias de Levenshtein y Hamming.
-        Primero obtiene sugerencias de phunspell y luego filtra por distancia.
+        Primero obtiene sugerencias del motor configurado (phunspell o el índice
+        SymSpell local) y luego filtra por distancia.
         
         Args:
             word: Palabra para la que buscar sugerencias.
@@ -100,14 +235,17 @@ class Tokenizer:
         Returns:
             Lista de sugerencias ordenadas por distancia (máximo 3).
         """
-        # Obtener sugerencias base de phunspell
-        base_suggestions = list(dic_es.suggest(word))
+        # Obtener sugerencias base del motor configurado
+        if self.suggestion_engine == "symspell":
+            base_suggestions = [w for w, _ in self._get_suggestion_index().lookup(word, max_distance, top_k=10)]
+        else:
+            base_suggestions = self.spell_checker.suggest(word)
         suggestions = []
         
         # Filtrar usando ambas distancias (Levenshtein y Hamming)
         for dict_word in base_suggestions:
-            # Calcular distancia de Levenshtein
-            lev_dist = distance(word, dict_word)
+            # Calcular distancia de Levenshtein (acotada: solo importa si es <= max_distance)
+            lev_dist = bounded_distance(word, dict_word, max_distance)
             
             # Calcular distancia de Hamming con padding para palabras de diferente longitud
             hamming_dist = hamming_distance_with_padding(word, dict_word)
@@ -0,0 +1,236 @@
+import hashlib
+import json
+import mmap
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from ...utils.file_lock import file_lock
+
+DEFAULT_CACHE_DIR = os.path.join("outputs", ".cache", "transcripciones")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+# Cantidad de put() entre escrituras del índice
+DEFAULT_SAVE_EVERY = 32
+
+# Configuración de transcripción usada por defecto (forma parte de la clave)
+DEFAULT_CONFIG = {
+    "backend": "assemblyai",
+    "speaker_labels": True,
+    "language_code": "es"
+}
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """
+    Calcula el hash SHA-256 del contenido de un archivo.
+
+    Los archivos grandes se mapean en memoria y se recorren por bloques,
+    sin cargarlos completos.
+
+    Args:
+        path: Ruta al archivo.
+
+    Returns:
+        Hash hexadecimal del contenido.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return h.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for inicio in range(0, size, _CHUNK_SIZE):
+                    h.update(view[inicio:inicio + _CHUNK_SIZE])
+            finally:
+                view.release()
+    return h.hexdigest()
+
+
+class TranscriptionCache:
+    def __init__(self, cache_dir: str = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 save_every: int = DEFAULT_SAVE_EVERY):
+        """
+        Inicializa la caché de transcripciones direccionada por contenido.
+
+        Cada transcripción se guarda como <clave>.json, donde la clave combina
+        el hash del audio y la configuración de transcripción. Un índice
+        (index.json) registra tamaño y último acceso de cada entrada para
+        desalojar las menos usadas cuando se supera max_bytes.
+
+        get() y put() solo actualizan el índice en memoria; el índice se
+        escribe cada save_every put(), en evict() y en flush() (que el dueño
+        de la caché debe llamar al terminar), combinándolo con el de disco
+        bajo un archivo de bloqueo para que varios procesos no pierdan
+        entradas. El desalojo se aplica al escribir el índice, por lo que la
+        caché puede superar max_bytes en hasta save_every entradas.
+
+        Args:
+            cache_dir: Directorio de la caché. Si es None, usa el directorio por defecto.
+            max_bytes: Tamaño máximo total de la caché en bytes.
+            save_every: Cantidad de put() entre escrituras del índice.
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.lock_path = f"{self.index_path}.lock"
+        self._hash_memo = {}
+        self.save_every = save_every
+        self._dirty = False
+        self._pendientes = 0
+        self.index = self._load_index()
+
+    def _load_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        return OrderedDict(sorted(entries.items(), key=lambda kv: kv[1].get("last_access", 0)))
+
+    def _save_index(self) -> int:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with file_lock(self.lock_path):
+            # Combinar con lo que otros procesos hayan escrito mientras tanto
+            for key, entry in self._load_index().items():
+                actual = self.index.get(key)
+                if actual is None:
+                    if os.path.exists(self._entry_path(key)):
+                        self.index[key] = entry
+                elif entry.get("last_access", 0) > actual.get("last_access", 0):
+                    actual["last_access"] = entry["last_access"]
+            self.index = OrderedDict(sorted(self.index.items(), key=lambda kv: kv[1].get("last_access", 0)))
+            eliminadas = self._evict()
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+        self._dirty = False
+        self._pendientes = 0
+        return eliminadas
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def key(self, audio_path: str, config: Dict[str, Any] = None) -> str:
+        """
+        Calcula la clave de caché de un audio.
+
+        Args:
+            audio_path: Ruta al archivo de audio.
+            config: Configuración de transcripción. Si es None, usa la configuración por defecto.
+
+        Returns:
+            Clave hexadecimal que depende solo del contenido y de la configuración.
+        """
+        st = os.stat(audio_path)
+        memo_key = (os.path.abspath(audio_path), st.st_size, st.st_mtime_ns)
+        audio_hash = self._hash_memo.get(memo_key)
+        if audio_hash is None:
+            audio_hash = hash_file(audio_path)
+            self._hash_memo[memo_key] = audio_hash
+        config_json = json.dumps(config or DEFAULT_CONFIG, sort_keys=True)
+        return hashlib.sha256(f"{audio_hash}:{config_json}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene una transcripción de la caché.
+
+        Args:
+            key: Clave de la transcripción.
+
+        Returns:
+            La transcripción, o None si no está en la caché.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            if self.index.pop(key, None) is not None:
+                self._dirty = True
+            return None
+        entry = self.index.get(key)
+        if entry is None:
+            entry = self.index[key] = {"size": os.path.getsize(path)}
+        else:
+            self.index.move_to_end(key)
+        entry["last_access"] = time.time()
+        self._dirty = True
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]):
+        """
+        Guarda una transcripción en la caché. El índice se escribe (y se
+        desalojan entradas si hace falta) cada save_every llamadas.
+
+        Args:
+            key: Clave de la transcripción.
+            data: Transcripción a guardar.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.index.pop(key, None)
+        self.index[key] = {"size": os.path.getsize(path), "last_access": time.time()}
+        self._dirty = True
+        self._pendientes += 1
+        if self._pendientes >= self.save_every:
+            self._save_index()
+
+    def flush(self):
+        """Escribe el índice si hubo accesos o cambios desde la última escritura."""
+        if self._dirty:
+            self._save_index()
+
+    def _evict(self) -> int:
+        total = sum(e.get("size", 0) for e in self.index.values())
+        eliminadas = 0
+        while total > self.max_bytes and len(self.index) > 1:
+            key, entry = self.index.popitem(last=False)
+            total -= entry.get("size", 0)
+            eliminadas += 1
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+        return eliminadas
+
+    def evict(self, max_bytes: int = None) -> int:
+        """
+        Desaloja las entradas menos usadas hasta respetar el tamaño máximo.
+
+        Args:
+            max_bytes: Nuevo tamaño máximo. Si es None, usa el de la caché.
+
+        Returns:
+            Cantidad de entradas eliminadas.
+        """
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        return self._save_index()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Devuelve estadísticas de la caché.
+
+        Returns:
+            Diccionario con cantidad de entradas, tamaño total, tamaño máximo y
+            fechas de la entrada más antigua y más reciente.
+        """
+        accesos = [e.get("last_access", 0) for e in self.index.values()]
+        return {
+            "directorio": self.cache_dir,
+            "entradas": len(self.index),
+            "bytes": sum(e.get("size", 0) for e in self.index.values()),
+            "max_bytes": self.max_bytes,
+            "acceso_mas_antiguo": min(accesos) if accesos else None,
+            "acceso_mas_reciente": max(accesos) if accesos else None
+        }
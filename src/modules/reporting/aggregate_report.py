@@ -0,0 +1,265 @@
+import csv
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+SIN_AGENTE = "sin_agente"
+REPORT_NAME = "reporte.json"
+# Ancho de los intervalos del histograma de puntajes de sentimiento
+SCORE_BUCKET = 5
+
+# Fases del protocolo en el reporte (protocol_analysis) y nombre de su tasa
+_FASES = (
+    ("greeting", "tasa_saludo"),
+    ("identification", "tasa_identificacion"),
+    ("prohibited_words", "tasa_sin_prohibidas"),
+    ("farewell", "tasa_despedida")
+)
+
+CSV_COLUMNS = [
+    "clave", "llamadas", "tasa_saludo", "tasa_identificacion", "tasa_sin_prohibidas", "tasa_despedida",
+    "tasa_cumplimiento", "positivas", "negativas", "neutrales", "score_promedio", "score_min", "score_max",
+    "top_prohibidas"
+]
+
+
+class _Acumulado:
+    __slots__ = ("llamadas", "fases_ok", "cumplimiento", "sentimientos", "score_total", "score_min",
+                 "score_max", "histograma", "prohibidas")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.fases_ok = [0] * len(_FASES)
+        self.cumplimiento = 0
+        self.sentimientos = {"Positivo": 0, "Negativo": 0, "Neutral": 0}
+        self.score_total = 0
+        self.score_min: Optional[int] = None
+        self.score_max: Optional[int] = None
+        self.histograma: Counter = Counter()
+        self.prohibidas: Counter = Counter()
+
+    def add(self, fases_ok: List[bool], sentiment: str, score: int, prohibidas: List[str]):
+        self.llamadas += 1
+        for i, ok in enumerate(fases_ok):
+            if ok:
+                self.fases_ok[i] += 1
+        if all(fases_ok):
+            self.cumplimiento += 1
+        self.sentimientos[sentiment] = self.sentimientos.get(sentiment, 0) + 1
+        self.score_total += score
+        if self.score_min is None or score < self.score_min:
+            self.score_min = score
+        if self.score_max is None or score > self.score_max:
+            self.score_max = score
+        self.histograma[score // SCORE_BUCKET * SCORE_BUCKET] += 1
+        if prohibidas:
+            self.prohibidas.update(prohibidas)
+
+    def resumen(self, top: int) -> Dict[str, Any]:
+        n = self.llamadas
+        resultado: Dict[str, Any] = {"llamadas": n}
+        for (_, nombre), ok in zip(_FASES, self.fases_ok):
+            resultado[nombre] = ok / n if n else 0.0
+        resultado["tasa_cumplimiento"] = self.cumplimiento / n if n else 0.0
+        resultado["sentimientos"] = dict(self.sentimientos)
+        resultado["score_promedio"] = self.score_total / n if n else 0.0
+        resultado["score_min"] = self.score_min
+        resultado["score_max"] = self.score_max
+        resultado["histograma_score"] = {
+            f"[{inicio}, {inicio + SCORE_BUCKET})": cantidad for inicio, cantidad in sorted(self.histograma.items())
+        }
+        resultado["top_prohibidas"] = self.prohibidas.most_common(top)
+        return resultado
+
+
+def iter_reports(output_dir: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Recorre los reportes de un directorio de salidas sin cargarlos todos en memoria.
+
+    Args:
+        output_dir: Directorio con un subdirectorio por llamada (outputs/).
+
+    Yields:
+        Tuplas (ruta del reporte, reporte).
+    """
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            path = os.path.join(entry.path, REPORT_NAME)
+            try:
+                with open(path, "rb") as f:
+                    yield path, json.loads(f.read())
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                print(f"Reporte ilegible {path}: {e}")
+
+
+class AggregateReportGenerator:
+    def __init__(self, top: int = 10):
+        """
+        Reporte agregado de una campaña: tasas de cumplimiento del protocolo,
+        distribución de sentimiento y palabras prohibidas más frecuentes, en
+        total, por agente y por día.
+
+        Los reportes individuales se procesan de a uno (add / add_file /
+        add_tree), de modo que la memoria depende de la cantidad de agentes y
+        días, no de la cantidad de llamadas.
+
+        Args:
+            top: Cantidad de palabras prohibidas a informar por grupo.
+        """
+        self.top = top
+        self.total = _Acumulado()
+        self.por_agente: Dict[str, _Acumulado] = {}
+        self.por_dia: Dict[str, _Acumulado] = {}
+        self.errores = 0
+
+    def add(self, report: Dict[str, Any], agente: str = None, fecha: str = None):
+        """
+        Agrega el reporte de una llamada.
+
+        Args:
+            report: Reporte con el formato de ReportGenerator.generate_report.
+            agente: Agente de la llamada. Si es None, se toma de report["metadata"].
+            fecha: Día de la llamada ("YYYY-MM-DD"). Si es None, se toma de report["metadata"].
+        """
+        try:
+            sentiment = report["sentiment_analysis"]
+            protocol = report["protocol_analysis"]
+            fases_ok = [protocol[fase]["status"] == "OK" for fase, _ in _FASES]
+            prohibidas = [p for p in protocol["prohibited_words"].get("found") or [] if p != "Ninguna detectada"]
+            etiqueta = sentiment["sentiment"]
+            score = int(sentiment["score"])
+        except (KeyError, TypeError, ValueError):
+            self.errores += 1
+            return
+        metadata = report.get("metadata") or {}
+        agente = agente or metadata.get("agent") or SIN_AGENTE
+        fecha = (fecha or metadata.get("date") or "sin_fecha")[:10]
+
+        self.total.add(fases_ok, etiqueta, score, prohibidas)
+        grupo = self.por_agente.get(agente)
+        if grupo is None:
+            grupo = self.por_agente[agente] = _Acumulado()
+        grupo.add(fases_ok, etiqueta, score, prohibidas)
+        grupo = self.por_dia.get(fecha)
+        if grupo is None:
+            grupo = self.por_dia[fecha] = _Acumulado()
+        grupo.add(fases_ok, etiqueta, score, prohibidas)
+
+    def add_file(self, path: str, report: Dict[str, Any] = None):
+        """
+        Agrega un reporte guardado. Si el reporte no tiene fecha en sus
+        metadatos, se usa la fecha de modificación del archivo.
+
+        Args:
+            path: Ruta al reporte.
+            report: Reporte ya leído (opcional).
+        """
+        if report is None:
+            with open(path, "rb") as f:
+                report = json.loads(f.read())
+        fecha = None
+        if not (report.get("metadata") or {}).get("date"):
+            fecha = datetime.fromtimestamp(os.stat(path).st_mtime).strftime("%Y-%m-%d")
+        self.add(report, fecha=fecha)
+
+    def add_tree(self, output_dir: str = "outputs") -> int:
+        """
+        Agrega todos los reportes de un directorio de salidas.
+
+        Args:
+            output_dir: Directorio con un subdirectorio por llamada.
+
+        Returns:
+            Cantidad de reportes leídos.
+        """
+        n = 0
+        for path, report in iter_reports(output_dir):
+            self.add_file(path, report)
+            n += 1
+        return n
+
+    def generate(self) -> Dict[str, Any]:
+        """
+        Devuelve el reporte agregado.
+
+        Returns:
+            Diccionario con "total", "por_agente" y "por_dia".
+        """
+        return {
+            "total": self.total.resumen(self.top),
+            "por_agente": {k: v.resumen(self.top) for k, v in sorted(self.por_agente.items())},
+            "por_dia": {k: v.resumen(self.top) for k, v in sorted(self.por_dia.items())},
+            "reportes_invalidos": self.errores
+        }
+
+    def _filas(self, grupos: Dict[str, _Acumulado]) -> List[Dict[str, Any]]:
+        filas = []
+        for clave, acumulado in sorted(grupos.items()):
+            r = acumulado.resumen(self.top)
+            filas.append({
+                "clave": clave,
+                "llamadas": r["llamadas"],
+                **{nombre: round(r[nombre], 4) for _, nombre in _FASES},
+                "tasa_cumplimiento": round(r["tasa_cumplimiento"], 4),
+                "positivas": r["sentimientos"].get("Positivo", 0),
+                "negativas": r["sentimientos"].get("Negativo", 0),
+                "neutrales": r["sentimientos"].get("Neutral", 0),
+                "score_promedio": round(r["score_promedio"], 4),
+                "score_min": r["score_min"],
+                "score_max": r["score_max"],
+                "top_prohibidas": " ".join(f"{w}:{n}" for w, n in r["top_prohibidas"])
+            })
+        return filas
+
+    def write(self, output_dir: str, formatos=("json", "csv")) -> List[str]:
+        """
+        Guarda el reporte agregado.
+
+        Formatos:
+            json: agregado.json con el resultado completo de generate().
+            csv: por_agente.csv y por_dia.csv, una fila por grupo.
+            columnar: por_agente.columnar.json y por_dia.columnar.json, con
+                una lista por columna (para cargar en pandas o Arrow sin
+                convertir fila por fila).
+
+        Args:
+            output_dir: Directorio de destino.
+            formatos: Formatos a generar.
+
+        Returns:
+            Rutas de los archivos escritos.
+
+        Raises:
+            ValueError: Si se pide un formato desconocido.
+        """
+        desconocidos = set(formatos) - {"json", "csv", "columnar"}
+        if desconocidos:
+            raise ValueError(f"Formatos desconocidos: {', '.join(sorted(desconocidos))}")
+        os.makedirs(output_dir, exist_ok=True)
+        escritos = []
+        if "json" in formatos:
+            path = os.path.join(output_dir, "agregado.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.generate(), f, ensure_ascii=False, indent=2)
+            escritos.append(path)
+        for nombre, grupos in (("por_agente", self.por_agente), ("por_dia", self.por_dia)):
+            filas = self._filas(grupos)
+            if "csv" in formatos:
+                path = os.path.join(output_dir, f"{nombre}.csv")
+                with open(path, "w", encoding="utf-8", newline="") as f:
+                    writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+                    writer.writeheader()
+                    writer.writerows(filas)
+                escritos.append(path)
+            if "columnar" in formatos:
+                path = os.path.join(output_dir, f"{nombre}.columnar.json")
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump({c: [fila[c] for fila in filas] for c in CSV_COLUMNS}, f, ensure_ascii=False)
+                escritos.append(path)
+        return escritos
@@ -0,0 +1,390 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+DEFAULT_INDEX_PATH = os.path.join("outputs", "corpus.db")
+REPORT_NAME = "reporte.json"
+TRANSCRIPT_NAME = "transcripcion_assembly.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llamadas (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL UNIQUE,
+    fecha TEXT NOT NULL,
+    report_mtime_ns INTEGER NOT NULL DEFAULT 0,
+    transcript_mtime_ns INTEGER NOT NULL DEFAULT 0,
+    sentiment TEXT,
+    score INTEGER,
+    positive_words INTEGER,
+    negative_words INTEGER,
+    greeting TEXT,
+    identification TEXT,
+    prohibited TEXT,
+    prohibited_words TEXT,
+    farewell TEXT
+);
+CREATE TABLE IF NOT EXISTS dependencias (
+    lexema TEXT NOT NULL,
+    llamada TEXT NOT NULL,
+    puntaje INTEGER NOT NULL,
+    token TEXT NOT NULL,
+    PRIMARY KEY (lexema, llamada)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS dependencias_llamada ON dependencias(llamada);
+CREATE INDEX IF NOT EXISTS llamadas_fecha ON llamadas(fecha);
+CREATE INDEX IF NOT EXISTS llamadas_score ON llamadas(score);
+CREATE VIRTUAL TABLE IF NOT EXISTS utterances USING fts5(
+    text,
+    llamada UNINDEXED,
+    idx UNINDEXED,
+    speaker UNINDEXED,
+    start UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Filtro de search() -> columna de la tabla llamadas
+_ESTADOS = {
+    "greeting": "greeting",
+    "identification": "identification",
+    "prohibited": "prohibited",
+    "farewell": "farewell"
+}
+
+
+def _fecha(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+class CorpusIndex:
+    def __init__(self, path: str = None):
+        """
+        Índice SQLite (con búsqueda de texto completo FTS5) sobre los reportes
+        y transcripciones de outputs/.
+
+        La base usa modo WAL, por lo que varios procesos pueden agregar
+        llamadas mientras otros consultan.
+
+        Args:
+            path: Archivo de la base. Si es None, usa outputs/corpus.db.
+        """
+        self.path = path or DEFAULT_INDEX_PATH
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def ingest(self, nombre: str, report: Dict[str, Any], transcripcion: Dict[str, Any] = None,
+               report_path: str = None, transcript_path: str = None):
+        """
+        Agrega (o reemplaza) una llamada en el índice.
+
+        La fecha de la llamada es la de report["metadata"]["date"]; si no
+        está, la de la transcripción (o la del reporte). Sin fecha en los
+        metadatos, reindexar una llamada existente conserva su fecha: un
+        reanálisis reescribe el reporte pero no cambia cuándo fue la llamada.
+
+        Args:
+            nombre: Nombre de la llamada (subdirectorio de outputs/).
+            report: Reporte con el formato de ReportGenerator.generate_report.
+            transcripcion: Transcripción con "utterances". Si es None, se
+                conservan las intervenciones ya indexadas.
+            report_path: Archivo del reporte (para la indexación incremental).
+            transcript_path: Archivo de la transcripción (para la fecha y la indexación incremental).
+        """
+        sentiment = report.get("sentiment_analysis", {})
+        protocol = report.get("protocol_analysis", {})
+        prohibidas = protocol.get("prohibited_words", {})
+        palabras = [p for p in prohibidas.get("found") or [] if p != "Ninguna detectada"]
+        report_mtime = _mtime_ns(report_path) if report_path else 0
+        transcript_mtime = _mtime_ns(transcript_path) if transcript_path else 0
+        fecha = (report.get("metadata") or {}).get("date")
+        fecha_explicita = bool(fecha)
+        if not fecha_explicita:
+            archivo_mtime = transcript_mtime or report_mtime
+            fecha = _fecha(archivo_mtime / 1e9) if archivo_mtime else _fecha(datetime.now().timestamp())
+        fila = (
+            nombre, fecha, report_mtime, transcript_mtime,
+            sentiment.get("sentiment"), sentiment.get("score"),
+            sentiment.get("positive_words_count"), sentiment.get("negative_words_count"),
+            protocol.get("greeting", {}).get("status"), protocol.get("identification", {}).get("status"),
+            prohibidas.get("status"), json.dumps(palabras, ensure_ascii=False),
+            protocol.get("farewell", {}).get("status")
+        )
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO llamadas (nombre, fecha, report_mtime_ns, transcript_mtime_ns, sentiment, score, "
+                "positive_words, negative_words, greeting, identification, prohibited, prohibited_words, farewell) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(nombre) DO UPDATE SET "
+                f"{'fecha=excluded.fecha, ' if fecha_explicita else ''}report_mtime_ns=excluded.report_mtime_ns, "
+                "transcript_mtime_ns=CASE WHEN excluded.transcript_mtime_ns THEN excluded.transcript_mtime_ns "
+                "ELSE transcript_mtime_ns END, "
+                "sentiment=excluded.sentiment, score=excluded.score, positive_words=excluded.positive_words, "
+                "negative_words=excluded.negative_words, greeting=excluded.greeting, "
+                "identification=excluded.identification, prohibited=excluded.prohibited, "
+                "prohibited_words=excluded.prohibited_words, farewell=excluded.farewell",
+                fila
+            )
+            if transcripcion is not None:
+                self.conn.execute("DELETE FROM utterances WHERE llamada = ?", (nombre,))
+                self.conn.executemany(
+                    "INSERT INTO utterances (text, llamada, idx, speaker, start) VALUES (?, ?, ?, ?, ?)",
+                    [(u.get("text") or "", nombre, i, u.get("speaker"), u.get("start"))
+                     for i, u in enumerate(transcripcion.get("utterances") or [])]
+                )
+
+    def ingest_dir(self, call_dir: str, force: bool = False) -> bool:
+        """
+        Indexa un subdirectorio de outputs/ (reporte y transcripción).
+
+        Args:
+            call_dir: Directorio de la llamada.
+            force: Reindexar aunque los archivos no hayan cambiado.
+
+        Returns:
+            True si la llamada se (re)indexó.
+        """
+        nombre = os.path.basename(os.path.normpath(call_dir))
+        report_path = os.path.join(call_dir, REPORT_NAME)
+        transcript_path = os.path.join(call_dir, TRANSCRIPT_NAME)
+        report_mtime = _mtime_ns(report_path)
+        if not report_mtime:
+            return False
+        transcript_mtime = _mtime_ns(transcript_path)
+        if not force:
+            fila = self.conn.execute(
+                "SELECT report_mtime_ns, transcript_mtime_ns FROM llamadas WHERE nombre = ?", (nombre,)
+            ).fetchone()
+            if fila and fila[0] == report_mtime and fila[1] == transcript_mtime:
+                return False
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        transcripcion = None
+        if transcript_mtime:
+            with open(transcript_path, "r", encoding="utf-8") as f:
+                transcripcion = json.load(f)
+        self.ingest(nombre, report, transcripcion, report_path, transcript_path if transcript_mtime else None)
+        return True
+
+    def rebuild(self, output_dir: str = "outputs", full: bool = False) -> Dict[str, int]:
+        """
+        Sincroniza el índice con el árbol de outputs/.
+
+        Args:
+            output_dir: Directorio de salidas.
+            full: Volver a indexar todas las llamadas. Si es False, solo se
+                indexan las llamadas nuevas o modificadas. Las intervenciones
+                de llamadas sin transcripcion_assembly.json en su directorio
+                (p. ej. procesadas por lotes desde transcripciones externas)
+                se conservan.
+
+        Returns:
+            Cantidad de llamadas indexadas, sin cambios y eliminadas del índice.
+        """
+        indexadas = sin_cambios = 0
+        presentes = set()
+        for entry in sorted(os.scandir(output_dir), key=lambda e: e.name) if os.path.isdir(output_dir) else []:
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            if not os.path.exists(os.path.join(entry.path, REPORT_NAME)):
+                continue
+            presentes.add(entry.name)
+            try:
+                if self.ingest_dir(entry.path, force=full):
+                    indexadas += 1
+                else:
+                    sin_cambios += 1
+            except (OSError, ValueError) as e:
+                print(f"No se pudo indexar {entry.path}: {e}")
+        eliminadas = [n for (n,) in self.conn.execute("SELECT nombre FROM llamadas") if n not in presentes]
+        with self._lock, self.conn:
+            for nombre in eliminadas:
+                self.conn.execute("DELETE FROM llamadas WHERE nombre = ?", (nombre,))
+                self.conn.execute("DELETE FROM utterances WHERE llamada = ?", (nombre,))
+                self.conn.execute("DELETE FROM dependencias WHERE llamada = ?", (nombre,))
+        return {"indexadas": indexadas, "sin_cambios": sin_cambios, "eliminadas": len(eliminadas)}
+
+    def set_dependencies(self, nombre: str, entradas: Dict[str, Tuple[int, str]]):
+        """
+        Registra de qué entradas de la tabla de símbolos depende el reporte de una llamada.
+
+        Args:
+            nombre: Nombre de la llamada.
+            entradas: Diccionario lexema -> (puntaje, token) con los valores
+                usados en el análisis ((0, "OTRO") para palabras fuera de la tabla).
+        """
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM dependencias WHERE llamada = ?", (nombre,))
+            self.conn.executemany(
+                "INSERT INTO dependencias (lexema, llamada, puntaje, token) VALUES (?, ?, ?, ?)",
+                [(lexema, nombre, puntaje, token) for lexema, (puntaje, token) in entradas.items()]
+            )
+
+    def stale_calls(self, lookup: Callable[[str], Optional[Tuple[int, str]]]) -> List[str]:
+        """
+        Busca las llamadas cuyo análisis usó entradas de la tabla de símbolos
+        que ya no coinciden con la tabla actual.
+
+        Args:
+            lookup: Función lexema -> (puntaje, token), o None si el lexema no
+                está en la tabla (p. ej. CompiledLexicon.lookup).
+
+        Returns:
+            Nombres de las llamadas a reanalizar.
+        """
+        cambiadas = []
+        for lexema, puntaje, token in self.conn.execute("SELECT DISTINCT lexema, puntaje, token FROM dependencias"):
+            actual = lookup(lexema) or (0, "OTRO")
+            if actual[0] != puntaje or actual[1] != token:
+                cambiadas.append((lexema, puntaje, token))
+        llamadas = set()
+        for entrada in cambiadas:
+            llamadas.update(n for (n,) in self.conn.execute(
+                "SELECT llamada FROM dependencias WHERE lexema = ? AND puntaje = ? AND token = ?", entrada
+            ))
+        return sorted(llamadas)
+
+    def search(self, texto: str = None, sentiment: str = None, min_score: int = None, max_score: int = None,
+               desde: str = None, hasta: str = None, palabra_prohibida: str = None, limit: int = 100,
+               **estados: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Busca llamadas.
+
+        Args:
+            texto: Consulta de texto completo (sintaxis FTS5) sobre las intervenciones.
+            sentiment: "Positivo", "Negativo" o "Neutral".
+            min_score: Puntaje mínimo de sentimiento.
+            max_score: Puntaje máximo de sentimiento.
+            desde: Fecha mínima ("YYYY-MM-DD" o "YYYY-MM-DD HH:MM:SS").
+            hasta: Fecha máxima (inclusive).
+            palabra_prohibida: Llamadas en las que se detectó esa palabra.
+            limit: Cantidad máxima de resultados.
+            **estados: Estado de una fase del protocolo (greeting, identification,
+                prohibited o farewell), p. ej. prohibited="Detectadas".
+
+        Returns:
+            Lista de llamadas. Con texto, cada una incluye las intervenciones
+            que coinciden (con la coincidencia resaltada entre [ ]).
+
+        Raises:
+            ValueError: Si se indica un filtro de estado desconocido o la
+                consulta de texto no tiene una sintaxis FTS5 válida.
+        """
+        condiciones = []
+        params: List[Any] = []
+        for fase, valor in estados.items():
+            if fase not in _ESTADOS:
+                raise ValueError(f"Filtro desconocido: {fase}")
+            if valor is not None:
+                condiciones.append(f"l.{_ESTADOS[fase]} = ?")
+                params.append(valor)
+        if sentiment is not None:
+            condiciones.append("l.sentiment = ?")
+            params.append(sentiment)
+        if min_score is not None:
+            condiciones.append("l.score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            condiciones.append("l.score <= ?")
+            params.append(max_score)
+        if desde:
+            condiciones.append("l.fecha >= ?")
+            params.append(desde)
+        if hasta:
+            condiciones.append("l.fecha <= ?")
+            params.append(hasta if len(hasta) > 10 else f"{hasta} 23:59:59")
+        if palabra_prohibida:
+            condiciones.append("EXISTS (SELECT 1 FROM json_each(l.prohibited_words) WHERE value = ?)")
+            params.append(palabra_prohibida)
+
+        if texto:
+            condiciones.insert(0, "utterances MATCH ?")
+            params.insert(0, texto)
+            sql = (
+                "SELECT l.*, u.idx AS utt_idx, u.speaker AS utt_speaker, u.start AS utt_start, "
+                "highlight(utterances, 0, '[', ']') AS utt_text "
+                "FROM utterances u JOIN llamadas l ON l.nombre = u.llamada "
+                f"WHERE {' AND '.join(condiciones)} ORDER BY l.fecha DESC, l.nombre, u.idx"
+            )
+        else:
+            where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+            sql = f"SELECT l.* FROM llamadas l {where} ORDER BY l.fecha DESC, l.nombre LIMIT ?"
+            params.append(limit)
+
+        resultados: List[Dict[str, Any]] = []
+        por_nombre: Dict[str, Dict[str, Any]] = {}
+        try:
+            filas = self.conn.execute(sql, params)
+        except sqlite3.OperationalError as e:
+            if texto:
+                raise ValueError(f"Consulta de texto inválida: {texto} ({e})") from e
+            raise
+        for fila in filas:
+            llamada = por_nombre.get(fila["nombre"])
+            if llamada is None:
+                if len(resultados) >= limit:
+                    break
+                llamada = {k: fila[k] for k in ("nombre", "fecha", "sentiment", "score", "positive_words",
+                                                "negative_words", "greeting", "identification", "prohibited",
+                                                "farewell")}
+                llamada["prohibited_words"] = json.loads(fila["prohibited_words"] or "[]")
+                if texto:
+                    llamada["coincidencias"] = []
+                por_nombre[fila["nombre"]] = llamada
+                resultados.append(llamada)
+            if texto:
+                llamada["coincidencias"].append({
+                    "utterance": fila["utt_idx"],
+                    "speaker": fila["utt_speaker"],
+                    "start": fila["utt_start"],
+                    "text": fila["utt_text"]
+                })
+        return resultados
+
+    def stats(self) -> Dict[str, Any]:
+        """Devuelve la cantidad de llamadas, intervenciones y dependencias indexadas."""
+        llamadas = self.conn.execute("SELECT COUNT(*) FROM llamadas").fetchone()[0]
+        utterances = self.conn.execute("SELECT COUNT(*) FROM utterances").fetchone()[0]
+        dependencias = self.conn.execute("SELECT COUNT(*) FROM dependencias").fetchone()[0]
+        return {"path": self.path, "llamadas": llamadas, "utterances": utterances, "dependencias": dependencias}
+
+
+# Índices abiertos por el proceso, por ruta
+_abiertos: Dict[str, CorpusIndex] = {}
+
+
+def get_corpus_index(path: str = None) -> CorpusIndex:
+    """
+    Devuelve el índice del proceso para la ruta indicada, abriéndolo una sola vez.
+
+    Args:
+        path: Archivo de la base. Si es None, usa outputs/corpus.db.
+    """
+    key = os.path.abspath(path or DEFAULT_INDEX_PATH)
+    index = _abiertos.get(key)
+    if index is None:
+        index = _abiertos[key] = CorpusIndex(path)
+    return index
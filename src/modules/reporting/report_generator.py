@@ -3,23 +3,35 @@ import json
 import os
 
 class ReportGenerator:
-    def __init__(self, sentiment_analysis: Dict[str, Any], protocol_analysis: Dict[str, Any]):
+    def __init__(self, sentiment_analysis: Dict[str, Any], protocol_analysis: Dict[str, Any],
+                 speaker_analysis: Dict[str, Any] = None, corpus_index=None, metadata: Dict[str, Any] = None):
         """
         Inicializa el generador de reportes.
         
         Args:
             sentiment_analysis: Resultado del análisis de sentimiento.
             protocol_analysis: Resultado del análisis de protocolo.
+            speaker_analysis: Resultado opcional del análisis por hablante
+                (UtteranceSentimentAnalyzer.analyze).
+            corpus_index: Índice del corpus (CorpusIndex) en el cual registrar
+                cada reporte guardado. Si es None, no se indexa.
+            metadata: Datos de la llamada (p. ej. "call", "agent", "date") que
+                se guardan en el reporte para los reportes agregados.
         """
         self.sentiment_analysis = sentiment_analysis
         self.protocol_analysis = protocol_analysis
+        self.speaker_analysis = speaker_analysis
+        self.corpus_index = corpus_index
+        self.metadata = metadata
         
-    def generate_report(self, output_path: str = None) -> Dict[str, Any]:
+    def generate_report(self, output_path: str = None, transcripcion: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Genera un reporte completo del análisis.
         
         Args:
             output_path: Ruta donde guardar el reporte. Si es None, no se guarda.
+            transcripcion: Transcripción de la llamada, para el índice del corpus.
+                Si es None, se usa transcripcion_assembly.json junto al reporte.
             
         Returns:
             Diccionario con el reporte completo.
@@ -40,13 +52,38 @@ class ReportGenerator:
                 "farewell": self.protocol_analysis["despedida"]
             }
         }
+        if self.metadata:
+            report["metadata"] = self.metadata
+        if self.speaker_analysis:
+            report["speaker_analysis"] = {
+                "agent": self.speaker_analysis["agente"],
+                "customer": self.speaker_analysis["cliente"],
+                "timeline": self.speaker_analysis["linea_tiempo"]
+            }
         
         if output_path:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(report, f, ensure_ascii=False, indent=2)
+            if self.corpus_index is not None:
+                self._indexar(output_path, report, transcripcion)
                 
         return report
+
+    def _indexar(self, output_path: str, report: Dict[str, Any], transcripcion: Dict[str, Any] = None):
+        from .corpus_index import TRANSCRIPT_NAME
+        call_dir = os.path.dirname(os.path.abspath(output_path))
+        transcript_path = os.path.join(call_dir, TRANSCRIPT_NAME)
+        if not os.path.exists(transcript_path):
+            transcript_path = None
+        try:
+            if transcripcion is None and transcript_path:
+                with open(transcript_path, "r", encoding="utf-8") as f:
+                    transcripcion = json.load(f)
+            self.corpus_index.ingest(os.path.basename(call_dir), report, transcripcion, output_path, transcript_path)
+        except Exception as e:
+            # El reporte ya está guardado; el índice se puede reconstruir después
+            print(f"No se pudo indexar el reporte {output_path}: {e}")
         
     def print_report(self):
         """Imprime el reporte en formato legible."""
@@ -0,0 +1,47 @@
+"""
+Reanálisis incremental de los reportes afectados por cambios en la tabla de símbolos.
+
+Solo se recalculan las llamadas cuyo análisis usó lexemas cuyo puntaje o
+token cambió, a partir de sus tokens guardados (outputs/<llamada>/tokens.json).
+Las llamadas se registran al procesarlas con la GUI o con
+python -m src.batch ... --indice.
+
+Uso:
+    python -m src.reanalyze [--dry-run] [--db outputs/corpus.db] [--diccionario diccionario/tabla_simbolos.json]
+"""
+import argparse
+import sys
+import time
+from typing import List
+
+from .modules.analysis.reanalysis import Reanalyzer
+from .modules.reporting.corpus_index import CorpusIndex
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Reanálisis de los reportes desactualizados")
+    parser.add_argument("--db", default=None, help="Índice del corpus (por defecto outputs/corpus.db)")
+    parser.add_argument("--diccionario", default=None, help="Tabla de símbolos")
+    parser.add_argument("--outputs", default="outputs", help="Directorio de salidas")
+    parser.add_argument("--dry-run", action="store_true", help="Solo listar las llamadas afectadas")
+    args = parser.parse_args(argv)
+
+    with CorpusIndex(args.db) as index:
+        reanalyzer = Reanalyzer(index, args.diccionario, args.outputs)
+        inicio = time.perf_counter()
+        afectadas = reanalyzer.stale_calls()
+        print(f"Llamadas afectadas: {len(afectadas)}")
+        if args.dry_run:
+            for nombre in afectadas:
+                print(f"  {nombre}")
+            return 0
+        resultado = reanalyzer.run(afectadas)
+        for error in resultado["errores"]:
+            print(f"ERROR {error['llamada']}: {error['error']}")
+        print(f"Reanalizadas: {len(resultado['reanalizadas'])} | Errores: {len(resultado['errores'])} | "
+              f"Tiempo: {time.perf_counter() - inicio:.2f} s")
+    return 1 if resultado["errores"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+import json
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.path.join("outputs", ".cache", "duraciones.json")
+
+# Bytes leídos desde el inicio del audio para encontrar el primer frame MP3
+_MP3_SCAN_BYTES = 64 * 1024
+
+# Bitrates en kbps por (versión, capa); índice 0 = "free", 15 = inválido
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_BITRATES[(2, 3)] = _BITRATES[(2, 2)]
+
+# Frecuencias de muestreo por versión (2.5 se trata como versión 2 con la mitad)
+_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 25: (11025, 12000, 8000)}
+
+
+def _wav_duration_us(f, size: int) -> Optional[int]:
+    header = f.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+    byte_rate = None
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            return None
+        chunk_id, chunk_size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+        if chunk_id == b"fmt ":
+            fmt = f.read(chunk_size)
+            if len(fmt) < 16:
+                return None
+            byte_rate = struct.unpack("<I", fmt[8:12])[0]
+            if chunk_size % 2:
+                f.seek(1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            # Grabaciones cortadas o en curso declaran un tamaño mayor al real
+            disponible = size - f.tell()
+            data_size = min(chunk_size, disponible)
+            return data_size * 1_000_000 // byte_rate
+        else:
+            f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+
+def _mp3_frame(header: bytes) -> Optional[Tuple[int, int, int, int, int, int]]:
+    """
+    Decodifica un encabezado de frame MPEG de audio.
+
+    Returns:
+        (versión, capa, bitrate en bps, frecuencia, muestras por frame,
+        largo del frame en bytes), o None si el encabezado no es válido.
+    """
+    if len(header) < 4:
+        return None
+    b1, b2, b3 = header[1], header[2], header[3]
+    if header[0] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = {0: 25, 2: 2, 3: 1}.get((b1 >> 3) & 3)
+    capa = {1: 3, 2: 2, 3: 1}.get((b1 >> 1) & 3)
+    indice_bitrate = b2 >> 4
+    indice_frecuencia = (b2 >> 2) & 3
+    if version is None or capa is None or indice_bitrate in (0, 15) or indice_frecuencia == 3:
+        return None
+    bitrate = _BITRATES[(1 if version == 1 else 2, capa)][indice_bitrate] * 1000
+    frecuencia = _SAMPLE_RATES[version][indice_frecuencia]
+    relleno = (b2 >> 1) & 1
+    if capa == 1:
+        muestras = 384
+        largo = (12 * bitrate // frecuencia + relleno) * 4
+    else:
+        muestras = 1152 if capa == 2 or version == 1 else 576
+        largo = muestras // 8 * bitrate // frecuencia + relleno
+    return version, capa, bitrate, frecuencia, muestras, largo
+
+
+def _mp3_duration_us(f, size: int) -> Optional[int]:
+    inicio = 0
+    id3 = f.read(10)
+    if id3[:3] == b"ID3" and len(id3) == 10:
+        tamaño = (id3[6] & 0x7F) << 21 | (id3[7] & 0x7F) << 14 | (id3[8] & 0x7F) << 7 | (id3[9] & 0x7F)
+        inicio = 10 + tamaño + (10 if id3[5] & 0x10 else 0)
+    f.seek(inicio)
+    buffer = f.read(_MP3_SCAN_BYTES)
+
+    # Primer frame cuyo siguiente frame también es válido (descarta falsos sincronismos)
+    pos = buffer.find(b"\xFF")
+    frame = None
+    while 0 <= pos < len(buffer) - 4:
+        frame = _mp3_frame(buffer[pos:pos + 4])
+        if frame is not None:
+            siguiente = pos + frame[5]
+            if siguiente + 4 > len(buffer) or _mp3_frame(buffer[siguiente:siguiente + 4]) is not None:
+                break
+        frame = None
+        pos = buffer.find(b"\xFF", pos + 1)
+    if frame is None:
+        return None
+    version, capa, bitrate, frecuencia, muestras, largo = frame
+    datos = buffer[pos:pos + largo]
+
+    # Encabezado Xing/Info (LAME) o VBRI (Fraunhofer) con la cantidad de frames
+    frames = None
+    mono = (datos[3] >> 6) == 3
+    lado = (17 if mono else 32) if version == 1 else (9 if mono else 17)
+    xing = 4 + lado
+    if datos[xing:xing + 4] in (b"Xing", b"Info") and len(datos) >= xing + 12:
+        flags = struct.unpack(">I", datos[xing + 4:xing + 8])[0]
+        if flags & 1:
+            frames = struct.unpack(">I", datos[xing + 8:xing + 12])[0]
+    elif datos[36:40] == b"VBRI" and len(datos) >= 54:
+        frames = struct.unpack(">I", datos[50:54])[0]
+    if frames:
+        return frames * muestras * 1_000_000 // frecuencia
+
+    # Sin encabezado: bitrate constante, se estima por el tamaño del audio
+    fin = size
+    if size >= 128:
+        f.seek(size - 128)
+        if f.read(3) == b"TAG":
+            fin -= 128
+    return max(fin - inicio - pos, 0) * 8 * 1_000_000 // bitrate
+
+
+def probe_duration_us(path: str) -> Optional[int]:
+    """
+    Obtiene la duración de un audio leyendo solo sus encabezados.
+
+    WAV: encabezado RIFF (byte rate y tamaño del bloque de datos).
+    MP3: encabezado Xing/Info o VBRI del primer frame; sin ellos se asume
+    bitrate constante y se calcula a partir del tamaño del archivo.
+
+    Args:
+        path: Ruta al audio.
+
+    Returns:
+        Duración en microsegundos, o None si el formato no se reconoce.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        inicio = f.read(12)
+        f.seek(0)
+        if inicio[:4] == b"RIFF" and inicio[8:12] == b"WAVE":
+            return _wav_duration_us(f, size)
+        return _mp3_duration_us(f, size)
+
+
+def audio_duration_us(path: str) -> Optional[int]:
+    """
+    Duración de un audio: primero por encabezados y, si el formato no se
+    reconoce, decodificándolo con pydub.
+
+    Args:
+        path: Ruta al audio.
+
+    Returns:
+        Duración en microsegundos, o None si no se pudo obtener.
+    """
+    try:
+        duracion = probe_duration_us(path)
+    except OSError:
+        return None
+    if duracion is not None:
+        return duracion
+    try:
+        from pydub import AudioSegment
+        return int(AudioSegment.from_file(path).duration_seconds * 1_000_000)
+    except Exception:
+        return None
+
+
+def format_duration(duracion_us: Optional[int]) -> str:
+    """Formatea una duración en microsegundos como "m:ss min"."""
+    if duracion_us is None:
+        return "-"
+    segundos = duracion_us // 1_000_000
+    return f"{segundos // 60}:{segundos % 60:02d} min"
+
+
+class DurationCache:
+    def __init__(self, path: str = None):
+        """
+        Caché persistente de duraciones de audio.
+
+        Cada entrada se identifica por la ruta absoluta, el tamaño y la fecha
+        de modificación del archivo: si el audio cambia, la entrada deja de
+        coincidir y se vuelve a medir.
+
+        Args:
+            path: Archivo JSON de la caché. Si es None, usa la ruta por defecto.
+        """
+        self.path = path or DEFAULT_CACHE_PATH
+        self._lock = threading.Lock()
+        self._modificada = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entradas: Dict[str, List[int]] = json.load(f)
+        except (OSError, ValueError):
+            self.entradas = {}
+
+    @staticmethod
+    def _clave(path: str) -> Tuple[str, List[int]]:
+        st = os.stat(path)
+        return os.path.abspath(path), [st.st_size, st.st_mtime_ns]
+
+    def get(self, path: str) -> Optional[int]:
+        """Devuelve la duración guardada de un audio, o None si no está o cambió."""
+        try:
+            clave, firma = self._clave(path)
+        except OSError:
+            return None
+        entrada = self.entradas.get(clave)
+        if entrada is not None and entrada[:2] == firma:
+            return entrada[2]
+        return None
+
+    def put(self, path: str, duracion_us: int):
+        """Guarda la duración de un audio."""
+        try:
+            clave, firma = self._clave(path)
+        except OSError:
+            return
+        with self._lock:
+            self.entradas[clave] = firma + [duracion_us]
+            self._modificada = True
+
+    def save(self):
+        """Escribe la caché si hubo cambios."""
+        with self._lock:
+            if not self._modificada:
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entradas, f)
+            os.replace(tmp_path, self.path)
+            self._modificada = False
+
+
+def probe_many(paths: List[str], cache: DurationCache = None, max_workers: int = 8,
+               cancelado: Callable[[], bool] = None) -> Iterator[Tuple[int, Optional[int]]]:
+    """
+    Obtiene las duraciones de varios audios en paralelo.
+
+    Las duraciones en caché se devuelven primero; el resto se mide en un
+    pool de hilos y se devuelve a medida que termina. Al finalizar se
+    guarda la caché.
+
+    Args:
+        paths: Rutas de los audios.
+        cache: Caché de duraciones. Si es None, no se usa caché.
+        max_workers: Cantidad de hilos.
+        cancelado: Función que devuelve True para interrumpir la medición.
+
+    Yields:
+        Tuplas (índice en paths, duración en microsegundos o None).
+    """
+    pendientes = []
+    for i, path in enumerate(paths):
+        duracion = cache.get(path) if cache is not None else None
+        if duracion is None:
+            pendientes.append(i)
+        else:
+            yield i, duracion
+    if not pendientes:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futuros = {executor.submit(audio_duration_us, paths[i]): i for i in pendientes}
+        for futuro in as_completed(futuros):
+            if cancelado is not None and cancelado():
+                break
+            i = futuros[futuro]
+            duracion = futuro.result()
+            if duracion is not None and cache is not None:
+                cache.put(paths[i], duracion)
+            yield i, duracion
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if cache is not None:
+            cache.save()
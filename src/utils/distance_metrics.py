@@ -71,4 +71,244 @@ def hamming_distance_with_padding(s1: str, s2: str, pad_char: str = ' ') -> int:
     s1_padded = s1.ljust(max_len, pad_char)
     s2_padded = s2.ljust(max_len, pad_char)
     
-    return sum(c1 != c2 for c1, c2 in zip(s1_padded, s2_padded)) 
\ No newline at end of file
+    return sum(c1 != c2 for c1, c2 in zip(s1_padded, s2_padded))
+
+
+def bounded_distance(s1: str, s2: str, max_distance: int) -> int:
+    """
+    Calcula la distancia de Levenshtein solo si no supera un umbral.
+    Recorre únicamente la banda diagonal de ancho 2*max_distance+1 y
+    termina apenas todas las celdas de una fila superan el umbral.
+    
+    Args:
+        s1: Primer string
+        s2: Segundo string
+        max_distance: Distancia máxima de interés
+        
+    Returns:
+        Distancia de Levenshtein si es menor o igual a max_distance;
+        en otro caso, max_distance + 1
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    limite = max_distance + 1
+    if len(s1) - len(s2) > max_distance:
+        return limite
+
+    # Descartar prefijo y sufijo comunes
+    inicio = 0
+    fin1, fin2 = len(s1), len(s2)
+    while inicio < fin2 and s1[inicio] == s2[inicio]:
+        inicio += 1
+    while fin2 > inicio and s1[fin1 - 1] == s2[fin2 - 1]:
+        fin1 -= 1
+        fin2 -= 1
+    s1 = s1[inicio:fin1]
+    s2 = s2[inicio:fin2]
+    n, m = len(s1), len(s2)
+    if m == 0:
+        return n if n <= max_distance else limite
+
+    previous_row = [j if j <= max_distance else limite for j in range(m + 1)]
+    for i in range(1, n + 1):
+        c1 = s1[i - 1]
+        current_row = [limite] * (m + 1)
+        if i <= max_distance:
+            current_row[0] = i
+        desde = max(1, i - max_distance)
+        hasta = min(m, i + max_distance)
+        minimo_fila = current_row[0]
+        for j in range(desde, hasta + 1):
+            valor = previous_row[j - 1] + (c1 != s2[j - 1])
+            if previous_row[j] + 1 < valor:
+                valor = previous_row[j] + 1
+            if current_row[j - 1] + 1 < valor:
+                valor = current_row[j - 1] + 1
+            if valor > limite:
+                valor = limite
+            current_row[j] = valor
+            if valor < minimo_fila:
+                minimo_fila = valor
+        if minimo_fila > max_distance:
+            return limite
+        previous_row = current_row
+
+    return previous_row[m] if previous_row[m] <= max_distance else limite
+
+
+def _pattern_masks(pattern: str) -> dict:
+    masks = {}
+    for i, c in enumerate(pattern):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def _bitparallel(masks: dict, m: int, text: str) -> int:
+    # Algoritmo de Myers en la formulación de Hyyrö para distancia global
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+    for c in text:
+        eq = masks.get(c, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+def bitparallel_distance(s1: str, s2: str) -> int:
+    """
+    Calcula la distancia de Levenshtein con el algoritmo bit-paralelo de
+    Myers/Hyyrö: cada columna de la matriz se representa como vectores de
+    bits, lo que reduce el trabajo a O(len(s2)) operaciones enteras cuando
+    s1 cabe en una palabra de máquina (palabras cortas).
+    
+    Args:
+        s1: Primer string (patrón)
+        s2: Segundo string
+        
+    Returns:
+        Distancia de Levenshtein entre s1 y s2
+    """
+    if not s1:
+        return len(s2)
+    if not s2:
+        return len(s1)
+    return _bitparallel(_pattern_masks(s1), len(s1), s2)
+
+
+def distance_batch(query: str, candidates, max_distance: int = None) -> list:
+    """
+    Calcula la distancia de Levenshtein entre una palabra y muchas candidatas.
+    Las máscaras de bits de la consulta se calculan una sola vez.
+    
+    Args:
+        query: Palabra de consulta
+        candidates: Iterable de palabras candidatas
+        max_distance: Si se indica, las candidatas cuya distancia supera el
+            umbral se informan como max_distance + 1 (y las que difieren en
+            longitud más que el umbral ni siquiera se comparan)
+        
+    Returns:
+        Lista de distancias, en el mismo orden que las candidatas
+    """
+    m = len(query)
+    masks = _pattern_masks(query) if m else None
+    resultados = []
+    for candidate in candidates:
+        if max_distance is not None and abs(len(candidate) - m) > max_distance:
+            resultados.append(max_distance + 1)
+            continue
+        if not m or not candidate:
+            d = max(m, len(candidate))
+        else:
+            d = _bitparallel(masks, m, candidate)
+        if max_distance is not None and d > max_distance:
+            d = max_distance + 1
+        resultados.append(d)
+    return resultados
+
+
+class CandidateMatrix:
+    def __init__(self, candidates, pad_char: str = ' '):
+        """
+        Lista de candidatas codificada una sola vez como matriz de códigos
+        Unicode (una fila por candidata, rellenada con pad_char), para
+        calcular distancias contra una consulta en una sola pasada vectorizada.
+        
+        Args:
+            candidates: Palabras candidatas
+            pad_char: Carácter de relleno (el mismo que usa hamming_distance_with_padding)
+        """
+        import numpy as np
+        
+        if len(pad_char) != 1:
+            raise ValueError("El carácter de relleno debe ser exactamente un carácter")
+        self._np = np
+        self.candidates = list(candidates)
+        self.pad_char = pad_char
+        self.pad_code = ord(pad_char)
+        self.lengths = np.array([len(c) for c in self.candidates], dtype=np.int64)
+        self.width = int(self.lengths.max()) if self.candidates else 0
+        texto = "".join(c.ljust(self.width, pad_char) for c in self.candidates)
+        self.codes = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32).reshape(len(self.candidates), self.width)
+
+    def _encode(self, query: str, width: int):
+        return self._np.frombuffer(query.ljust(width, self.pad_char).encode("utf-32-le"), dtype=self._np.uint32)
+
+    def hamming(self, query: str):
+        """
+        Distancia de Hamming con padding entre la consulta y cada candidata.
+        Equivale a hamming_distance_with_padding(query, candidata) para cada fila.
+        
+        Args:
+            query: Palabra de consulta
+            
+        Returns:
+            Arreglo de NumPy con una distancia por candidata
+        """
+        np = self._np
+        width = max(self.width, len(query))
+        codes = self.codes
+        if width > self.width:
+            codes = np.pad(codes, ((0, 0), (0, width - self.width)), constant_values=self.pad_code)
+        return (codes != self._encode(query, width)).sum(axis=1)
+
+    def levenshtein(self, query: str, max_distance: int = None):
+        """
+        Distancia de Levenshtein entre la consulta y cada candidata.
+        Se calcula la matriz de programación dinámica fila por fila (una por
+        carácter de la consulta) para todas las candidatas a la vez; las
+        inserciones de cada fila se resuelven con un mínimo acumulado.
+        
+        Args:
+            query: Palabra de consulta
+            max_distance: Si se indica, las distancias mayores se informan como
+                max_distance + 1 y el cálculo termina apenas ninguna candidata
+                puede quedar dentro del umbral
+            
+        Returns:
+            Arreglo de NumPy con una distancia por candidata
+        """
+        np = self._np
+        n = len(self.candidates)
+        if max_distance is None:
+            return self._levenshtein(query, self.codes, self.lengths)
+        
+        # Solo pueden quedar dentro del umbral las candidatas de longitud
+        # parecida, y de ellas solo importan las primeras len(query)+max_distance columnas
+        result = np.full(n, max_distance + 1, dtype=np.int64)
+        filas = np.flatnonzero(np.abs(self.lengths - len(query)) <= max_distance)
+        if len(filas):
+            width = min(self.width, len(query) + max_distance)
+            parcial = self._levenshtein(query, self.codes[filas, :width], self.lengths[filas], max_distance)
+            result[filas] = np.minimum(parcial, max_distance + 1)
+        return result
+
+    def _levenshtein(self, query: str, codes, lengths, max_distance: int = None):
+        np = self._np
+        n, width = codes.shape
+        columnas = np.arange(width + 1, dtype=np.int32)
+        previous_row = np.broadcast_to(columnas, (n, width + 1)).copy()
+        acumulado = np.empty_like(previous_row)
+        for i, c in enumerate(query, 1):
+            distintos = codes != ord(c)
+            mejor = np.minimum(previous_row[:, :-1] + distintos, previous_row[:, 1:] + 1)
+            acumulado[:, 0] = i
+            np.subtract(mejor, columnas[1:], out=acumulado[:, 1:])
+            previous_row = np.minimum.accumulate(acumulado, axis=1)
+            previous_row += columnas
+            if max_distance is not None and previous_row.min() > max_distance:
+                return np.full(n, max_distance + 1, dtype=np.int64)
+        return previous_row[np.arange(n), lengths].astype(np.int64)
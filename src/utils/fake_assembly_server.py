@@ -0,0 +1,133 @@
+"""
+Servidor local que imita la API de transcripción de AssemblyAI
+(/v2/upload, /v2/transcript y /v2/transcript/<id>), para probar la
+transcripción por lotes sin acceso a red ni consumo de créditos.
+
+Si el archivo subido es un JSON con las claves "text" y "utterances",
+se devuelve tal cual como resultado; si no, se genera una transcripción
+de ejemplo.
+
+Uso:
+    python -m src.utils.fake_assembly_server --port 8765 --delay 2
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeAssemblyServer(ThreadingHTTPServer):
+    def __init__(self, address=("127.0.0.1", 0), delay: float = 1.0, fail_every: int = 0):
+        """
+        Inicializa el servidor de prueba.
+
+        Args:
+            address: Dirección (host, puerto). Puerto 0 elige uno libre.
+            delay: Segundos que tarda cada transcripción en completarse.
+            fail_every: Si es mayor que 0, cada N trabajos uno termina con error.
+        """
+        super().__init__(address, _Handler)
+        self.delay = delay
+        self.fail_every = fail_every
+        self.uploads = {}
+        self.jobs = {}
+        self.max_in_flight = 0
+        self._upload_ids = itertools.count(1)
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def in_flight(self) -> int:
+        ahora = time.monotonic()
+        return sum(1 for job in self.jobs.values() if job["listo"] > ahora)
+
+    def start(self) -> "FakeAssemblyServer":
+        """Inicia el servidor en un hilo en segundo plano."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def _resultado(self, datos: bytes, numero: int):
+        try:
+            transcripcion = json.loads(datos.decode("utf-8"))
+            if "text" in transcripcion and "utterances" in transcripcion:
+                return transcripcion
+        except (UnicodeDecodeError, ValueError):
+            pass
+        texto = f"Buenas tardes, llamada de prueba número {numero}. Gracias por comunicarse."
+        return {
+            "text": texto,
+            "utterances": [{"speaker": "A", "text": texto, "start": 0, "end": 1000}]
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _responder(self, status: int, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _leer_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_POST(self):
+        server = self.server
+        if self.path == "/v2/upload":
+            datos = self._leer_body()
+            with server._lock:
+                upload_id = f"upload-{next(server._upload_ids)}"
+                server.uploads[upload_id] = datos
+            self._responder(200, {"upload_url": f"{server.url}/uploads/{upload_id}"})
+        elif self.path == "/v2/transcript":
+            config = json.loads(self._leer_body().decode("utf-8"))
+            upload_id = config.get("audio_url", "").rsplit("/", 1)[-1]
+            with server._lock:
+                numero = next(server._job_ids)
+                job_id = f"job-{numero}"
+                fallar = server.fail_every > 0 and numero % server.fail_every == 0
+                server.jobs[job_id] = {
+                    "listo": time.monotonic() + server.delay,
+                    "error": "Archivo de audio inválido" if fallar else None,
+                    "resultado": server._resultado(server.uploads.pop(upload_id, b""), numero)
+                }
+                server.max_in_flight = max(server.max_in_flight, server.in_flight())
+            self._responder(200, {"id": job_id, "status": "queued"})
+        else:
+            self._responder(404, {"error": "No encontrado"})
+
+    def do_GET(self):
+        server = self.server
+        if not self.path.startswith("/v2/transcript/"):
+            self._responder(404, {"error": "No encontrado"})
+            return
+        job = server.jobs.get(self.path.rsplit("/", 1)[-1])
+        if job is None:
+            self._responder(404, {"error": "Transcripción inexistente"})
+        elif time.monotonic() < job["listo"]:
+            self._responder(200, {"status": "processing"})
+        elif job["error"]:
+            self._responder(200, {"status": "error", "error": job["error"]})
+        else:
+            self._responder(200, dict(job["resultado"], status="completed"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local que imita la API de AssemblyAI")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=1.0, help="Segundos por transcripción")
+    parser.add_argument("--fail-every", type=int, default=0, help="Cada N trabajos uno falla")
+    args = parser.parse_args()
+    server = FakeAssemblyServer(("127.0.0.1", args.port), args.delay, args.fail_every)
+    print(f"Servidor de prueba escuchando en {server.url}")
+    server.serve_forever()
@@ -0,0 +1,124 @@
+"""
+Servidor local de transcripción en vivo para probar el modo streaming
+(src/live.py) sin acceso a red.
+
+Recibe audio con el protocolo de SocketStreamingTranscriber y "transcribe"
+un guion: una transcripción JSON ({"text", "utterances"}) con los tiempos de
+cada intervención. A medida que llega audio, envía eventos parciales con las
+palabras cuyo tiempo ya transcurrió y un evento final al completarse cada
+intervención, sincronizados con la cantidad de audio recibido.
+
+Uso:
+    python -m src.utils.fake_streaming_server --port 8766 --transcripcion outputs/llamada/transcripcion_assembly.json
+"""
+import argparse
+import json
+import socketserver
+import threading
+from typing import Any, Dict, List, Tuple
+
+from ..modules.preprocessing.streaming import SAMPLE_RATE, PARCIAL, FINAL
+
+_GUION_POR_DEFECTO = {
+    "text": "Buenas tardes, gracias por llamar. ¿Con quién tengo el gusto? Hola, soy Ana. Gracias por comunicarse.",
+    "utterances": [
+        {"speaker": "A", "text": "Buenas tardes, gracias por llamar. ¿Con quién tengo el gusto?", "start": 0, "end": 4000},
+        {"speaker": "B", "text": "Hola, soy Ana.", "start": 4500, "end": 6000},
+        {"speaker": "A", "text": "Gracias por comunicarse.", "start": 6500, "end": 8000}
+    ]
+}
+
+
+def _palabras(utterance: Dict[str, Any]) -> List[Tuple[int, str]]:
+    # Instante de fin de cada palabra: el de AssemblyAI si está, si no interpolado
+    if utterance.get("words"):
+        return [(int(w["end"]), w["text"]) for w in utterance["words"]]
+    palabras = utterance.get("text", "").split()
+    inicio, fin = int(utterance.get("start", 0)), int(utterance.get("end", 0))
+    paso = (fin - inicio) / max(len(palabras), 1)
+    return [(int(inicio + paso * (i + 1)), p) for i, p in enumerate(palabras)]
+
+
+class FakeStreamingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address=("127.0.0.1", 0), transcripcion: Dict[str, Any] = None):
+        """
+        Inicializa el servidor de prueba.
+
+        Args:
+            address: Dirección (host, puerto). Puerto 0 elige uno libre.
+            transcripcion: Guion a transcribir. Si es None, usa uno de ejemplo.
+        """
+        super().__init__(address, _Handler)
+        self.transcripcion = transcripcion or _GUION_POR_DEFECTO
+        self.guion = [(u, _palabras(u)) for u in self.transcripcion.get("utterances") or []]
+
+    @property
+    def duracion_ms(self) -> int:
+        """Duración del guion en milisegundos."""
+        return max((int(u.get("end", 0)) for u, _ in self.guion), default=0)
+
+    def start(self) -> "FakeStreamingServer":
+        """Inicia el servidor en un hilo en segundo plano."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def _enviar(self, tipo: str, utterance: Dict[str, Any], palabras: List[str], fin: int):
+        evento = {
+            "tipo": tipo,
+            "text": utterance.get("text", "") if tipo == FINAL else " ".join(palabras),
+            "speaker": utterance.get("speaker"),
+            "start": int(utterance.get("start", 0)),
+            "end": fin
+        }
+        self.wfile.write(json.dumps(evento, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def _avanzar(self, audio_ms: float):
+        # Envía lo que el audio recibido hasta audio_ms permite transcribir
+        while self.actual < len(self.server.guion):
+            utterance, palabras = self.server.guion[self.actual]
+            dichas = sum(1 for fin, _ in palabras if fin <= audio_ms)
+            if audio_ms >= int(utterance.get("end", 0)):
+                self._enviar(FINAL, utterance, [], int(utterance.get("end", 0)))
+                self.actual += 1
+                self.enviadas = 0
+                continue
+            if dichas > self.enviadas:
+                self.enviadas = dichas
+                self._enviar(PARCIAL, utterance, [p for _, p in palabras[:dichas]], palabras[dichas - 1][0])
+            return
+
+    def handle(self):
+        encabezado = json.loads(self.rfile.readline() or b"{}")
+        bytes_por_ms = int(encabezado.get("sample_rate", SAMPLE_RATE)) * 2 / 1000
+        self.actual = 0
+        self.enviadas = 0
+        recibidos = 0
+        while True:
+            datos = self.request.recv(65536)
+            if not datos:
+                break
+            recibidos += len(datos)
+            self._avanzar(recibidos / bytes_por_ms)
+        # Fin del audio: se cierra lo que quedó pendiente del guion
+        self._avanzar(float("inf"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local de transcripción en vivo")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--transcripcion", default=None, help="Transcripción JSON usada como guion")
+    args = parser.parse_args()
+    guion = None
+    if args.transcripcion:
+        with open(args.transcripcion, "r", encoding="utf-8") as f:
+            guion = json.load(f)
+    server = FakeStreamingServer(("127.0.0.1", args.port), guion)
+    host, port = server.server_address[:2]
+    print(f"Servidor de transcripción en vivo escuchando en {host}:{port} ({server.duracion_ms / 1000:.1f} s de guion)")
+    server.serve_forever()
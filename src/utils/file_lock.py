@@ -0,0 +1,41 @@
+import os
+from contextlib import contextmanager
+
+
+def _lock_file(f, exclusive: bool):
+    if os.name == "nt":
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+def _unlock_file(f):
+    if os.name == "nt":
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(lock_path: str, exclusive: bool = True):
+    """
+    Bloqueo entre procesos sobre un archivo de bloqueo (fcntl en POSIX,
+    msvcrt en Windows; en Windows el bloqueo es siempre exclusivo).
+
+    Args:
+        lock_path: Ruta del archivo de bloqueo. Se crea si no existe.
+        exclusive: Bloqueo exclusivo (escritura) o compartido (lectura).
+    """
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        _lock_file(f, exclusive)
+        try:
+            yield
+        finally:
+            _unlock_file(f)
@@ -0,0 +1,84 @@
+"""
+Equivalencia de las variantes de Levenshtein de src/utils/distance_metrics.py
+con distance() (la implementación de referencia), sobre pares aleatorios:
+  - bitparallel_distance(a, b) == distance(a, b)
+  - bounded_distance(a, b, k) == min(distance(a, b), k + 1)
+  - distance_batch(a, cs, k)[i] == min(distance(a, cs[i]), k + 1)
+  - CandidateMatrix(cs).levenshtein(a, k) y .hamming(a) (si NumPy está instalado)
+
+Uso:
+    python -m unittest discover tests
+"""
+import random
+import unittest
+
+from src.utils.distance_metrics import (
+    distance, bounded_distance, bitparallel_distance, distance_batch, hamming_distance_with_padding, CandidateMatrix
+)
+
+ALFABETO = "abcdeáéñ"
+PARES = 5000
+SEMILLA = 1
+
+
+def _palabra(rng: random.Random, largo_max: int) -> str:
+    return "".join(rng.choice(ALFABETO) for _ in range(rng.randint(0, largo_max)))
+
+
+def _hay_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class TestDistanceVariants(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(SEMILLA)
+
+    def test_casos_conocidos(self):
+        for a, b, esperado in [("", "", 0), ("", "abc", 3), ("casa", "caza", 1),
+                               ("kitten", "sitting", 3), ("niño", "nino", 1)]:
+            self.assertEqual(distance(a, b), esperado)
+            self.assertEqual(bitparallel_distance(a, b), esperado)
+            self.assertEqual(bounded_distance(a, b, 1), min(esperado, 2))
+
+    def test_bitparallel_distance(self):
+        for _ in range(PARES):
+            a, b = _palabra(self.rng, 14), _palabra(self.rng, 14)
+            self.assertEqual(bitparallel_distance(a, b), distance(a, b), (a, b))
+
+    def test_bitparallel_distance_patron_largo(self):
+        # Patrones de más de 64 caracteres (varias palabras de máquina)
+        for _ in range(200):
+            a, b = _palabra(self.rng, 150), _palabra(self.rng, 150)
+            self.assertEqual(bitparallel_distance(a, b), distance(a, b), (a, b))
+
+    def test_bounded_distance(self):
+        for _ in range(PARES):
+            a, b = _palabra(self.rng, 14), _palabra(self.rng, 14)
+            esperado = distance(a, b)
+            for k in range(4):
+                self.assertEqual(bounded_distance(a, b, k), min(esperado, k + 1), (a, b, k))
+
+    def test_distance_batch(self):
+        for _ in range(PARES // 100):
+            a = _palabra(self.rng, 10)
+            cs = [_palabra(self.rng, 10) for _ in range(50)]
+            self.assertEqual(distance_batch(a, cs), [distance(a, c) for c in cs], a)
+            self.assertEqual(distance_batch(a, cs, 2), [min(distance(a, c), 3) for c in cs], a)
+
+    @unittest.skipUnless(_hay_numpy(), "NumPy no está instalado")
+    def test_candidate_matrix(self):
+        for _ in range(PARES // 100):
+            a = _palabra(self.rng, 10)
+            cs = [_palabra(self.rng, 10) for _ in range(50)]
+            matriz = CandidateMatrix(cs)
+            self.assertEqual(matriz.levenshtein(a).tolist(), [distance(a, c) for c in cs], a)
+            self.assertEqual(matriz.levenshtein(a, 2).tolist(), [min(distance(a, c), 3) for c in cs], a)
+            self.assertEqual(matriz.hamming(a).tolist(), [hamming_distance_with_padding(a, c) for c in cs], a)
+
+
+if __name__ == "__main__":
+    unittest.main()